@@ -0,0 +1,450 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Benchmarks for import time, widget construction and the hot paths of the
+widgets.
+
+The benchmarks which need a display use a Tk root which is never mapped but
+still need an X server on Linux so run them under a virtual display e.g. ::
+
+    xvfb-run -a python src/bench/benchmarks.py --save baseline.json
+    xvfb-run -a python src/bench/benchmarks.py --compare baseline.json
+
+If Tk cannot be started the GUI benchmarks are skipped. For each benchmark
+the fastest of several runs and the peak memory allocated by Python during a
+run are recorded. A comparison run exits with a status of 1 if any benchmark
+is slower or uses more memory than the baseline by more than the tolerance.
+
+The benchmarks need Python 3.4 or later.
+"""
+
+from __future__ import print_function, division, absolute_import
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import datetime
+import subprocess
+import tracemalloc
+import tkinter as tk
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import tks.tcl_trace
+
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+
+IMPORT_MODULES = ('tks', 'tks.color_funcs', 'tks.rc', 'tks.colors',
+                  'tks.color_palette', 'tks.dates', 'tks.times')
+
+_benchmarks = []
+
+
+def benchmark(name, gui=False, number=1):
+    """Register a benchmark function.
+
+    The function is passed the Tk root (or None if `gui` is False) and
+    returns a function which is timed. The setup done by the outer function
+    is not timed.
+
+    :param name: The name of the benchmark in the results
+    :param gui: True if the benchmark needs Tk
+    :param number: The number of times the timed function is called per run
+    """
+
+    def _register(func):
+        _benchmarks.append((name, func, gui, number))
+        return func
+
+    return _register
+
+
+def bench_import(root, name=None):
+    module = name[len('import.'):]
+    code = ('import time; s = time.perf_counter(); import %s; '
+            'print(time.perf_counter() - s)' % module)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+
+    def _run():
+        # The import is timed by the child so interpreter startup is excluded
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=env)
+        return float(output.decode('ascii').strip())
+
+    return _run
+
+
+for _module in IMPORT_MODULES:
+    benchmark('import.%s' % _module)(bench_import)
+
+
+@benchmark('construct.ColorDialog', gui=True)
+def bench_color_dialog(root, name=None):
+    import tks.colors
+
+    def _run():
+        dlg = tks.colors.ColorDialog(root, 'Color',
+                                     start_color=(0.2, 0.4, 0.6))
+        dlg.update_idletasks()
+        dlg.destroy()
+
+    return _run
+
+
+@benchmark('construct.PaletteSelector', gui=True)
+def bench_palette_selector(root, name=None):
+    import tks.color_palette
+
+    def _run():
+        frame = tk.Toplevel(root)
+        frame.withdraw()
+        selector = tks.color_palette.PaletteSelector(frame)
+        selector.grid()
+        frame.update_idletasks()
+        frame.destroy()
+
+    return _run
+
+
+@benchmark('construct.DateDialog', gui=True)
+def bench_date_dialog(root, name=None):
+    import tks.dates
+
+    def _run():
+        dlg = tks.dates.DateDialog(root, 'Date',
+                                   start_date=datetime.date(2018, 6, 15))
+        dlg.update_idletasks()
+        dlg.destroy()
+
+    return _run
+
+
+@benchmark('construct.TimeDialog', gui=True)
+def bench_time_dialog(root, name=None):
+    import tks.times
+
+    def _run():
+        dlg = tks.times.TimeDialog(root, 'Time',
+                                   start_time=datetime.time(10, 30))
+        dlg.update_idletasks()
+        dlg.destroy()
+
+    return _run
+
+
+@benchmark('color_funcs.conversions', number=1000)
+def bench_color_funcs(root, name=None):
+    import tks.color_funcs as cf
+
+    rgb = (0.2, 0.4, 0.6)
+
+    def _run():
+        cf.color_string_to_rgb(cf.rgb_to_hex_string(rgb))
+        cf.color_string_to_rgb(cf.rgb_to_rgb_string(rgb))
+        cf.color_string_to_rgb(cf.rgb_to_hsv_string(rgb))
+        cf.color_string_to_rgb(cf.rgb_to_hls_string(rgb))
+        cf.contrast_color(rgb)
+
+    return _run
+
+
+@benchmark('color_funcs.tints_and_shades', number=1000)
+def bench_tints_and_shades(root, name=None):
+    import tks.color_funcs as cf
+
+    rgb = (0.2, 0.4, 0.6)
+
+    def _run():
+        cf.rgb_tints(rgb, 5, 10)
+        cf.rgb_shades(rgb, 5, 10)
+
+    return _run
+
+
+@benchmark('color_funcs.perceptual', number=1000)
+def bench_perceptual(root, name=None):
+    import tks.color_funcs as cf
+
+    rgb = (0.2, 0.4, 0.6)
+
+    def _run():
+        cf.rgb_to_lab(rgb)
+        cf.color_distance(rgb, (0.6, 0.4, 0.2))
+        cf.oklab_to_rgb(cf.rgb_to_oklab(rgb))
+
+    return _run
+
+
+@benchmark('Palette.find_closest', number=10)
+def bench_find_closest(root, name=None):
+    import tks.color_palette
+
+    palette = tks.color_palette.Palette('x11.txt', read_only=True)
+    values = iter(range(10 ** 9))
+
+    def _run():
+        value = (next(values) % 256) / 255
+        palette.find_closest((value, 0.5, 1.0 - value))
+
+    return _run
+
+
+@benchmark('color_slider.gradient_colors', number=100)
+def bench_gradient_colors(root, name=None):
+    import colorsys
+    import tks.color_slider
+
+    levels = iter(range(10 ** 9))
+
+    def _run():
+        others = (next(levels) % tks.color_slider.GRADIENT_LEVELS, 63)
+        tks.color_slider.gradient_colors(lambda hsv: colorsys.hsv_to_rgb(*hsv),
+                                         0, others, 200)
+
+    return _run
+
+
+@benchmark('color_wheel.wheel_data')
+def bench_wheel_data(root, name=None):
+    import tks.color_wheel as cw
+
+    radius = cw.DEFAULT_RADIUS
+    inner = cw.inner_radius(radius)
+
+    def _run():
+        # The ring is cached after it is first calculated
+        cw._wheel_cache.clear()
+        cw.wheel_data(radius, inner)
+
+    return _run
+
+
+@benchmark('ColorWheel._update_triangle', gui=True, number=10)
+def bench_update_triangle(root, name=None):
+    import tks.color_wheel
+
+    wheel = _gui_widget(root, tks.color_wheel.ColorWheel)
+    hues = iter(range(10 ** 9))
+
+    def _run():
+        wheel._hue_degrees = next(hues) % 360
+        wheel._update_triangle()
+
+    return _run
+
+
+@benchmark('ColorPlane._update_plane', gui=True, number=10)
+def bench_update_plane(root, name=None):
+    import tks.color_plane
+
+    plane = _gui_widget(root, tks.color_plane.ColorPlane)
+    hues = iter(range(10 ** 9))
+
+    def _run():
+        plane._hsv = ((next(hues) % 360) / 359.0, 1.0, 1.0)
+        plane._update_plane()
+
+    return _run
+
+
+@benchmark('DaySelector._update_canvas', gui=True, number=10)
+def bench_day_selector(root, name=None):
+    import tks.dates
+
+    selector = _gui_widget(root, tks.dates.DaySelector,
+                           start_date=datetime.date(2018, 6, 15),
+                           locale='en')
+    months = iter(range(10 ** 9))
+
+    def _run():
+        month = next(months) % 12
+        selector._date = datetime.date(2018, month + 1, 1)
+        selector._update_canvas()
+
+    return _run
+
+
+def _gui_widget(root, cls, **kwargs):
+    """Create a widget in a Toplevel which is never mapped."""
+
+    frame = tk.Toplevel(root)
+    frame.withdraw()
+    widget = cls(frame, **kwargs)
+    widget.grid()
+    frame.update_idletasks()
+    return widget
+
+
+def create_root():
+    """Return a Tk root which is never mapped or None if Tk cannot be
+    started."""
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+
+    root.withdraw()
+    return root
+
+
+def run(names=None, repeat=DEFAULT_REPEAT, gui=True, tcl=False):
+    """Run the benchmarks and return a dictionary of the results.
+
+    :param names: If given only the benchmarks whose name starts with one of
+                  these is run.
+    :param repeat: The number of times each benchmark is run. The fastest
+                   time is recorded.
+    :param gui: If False the benchmarks which need Tk are skipped.
+    :param tcl: If True the number of Tcl commands issued by one run of each
+                GUI benchmark is recorded as `tcl_calls`.
+    """
+
+    root = create_root() if gui else None
+
+    results = {}
+    skipped = []
+    for name, func, needs_gui, number in _benchmarks:
+        if names and not any(name.startswith(n) for n in names):
+            continue
+
+        if needs_gui and root is None:
+            skipped.append(name)
+            continue
+
+        timed = func(root, name=name)
+        if root is not None:
+            root.update()
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                child_time = timed()
+            elapsed = time.perf_counter() - start
+
+            if name.startswith('import.'):
+                elapsed = child_time
+
+            times.append(elapsed / number)
+
+        # Memory is traced in a separate run as tracing slows the code down
+        tracemalloc.start()
+        timed()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results[name] = {'time': min(times), 'peak_memory': peak}
+
+        if tcl and needs_gui:
+            tracer = tks.tcl_trace.trace(root)
+            timed()
+            tracer.stop()
+            results[name]['tcl_calls'] = tracer.total
+            results[name]['tcl_report'] = tracer.report(top=10)
+
+    if root is not None:
+        root.destroy()
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'tk': tk.TkVersion,
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def compare(baseline, current, tolerance=DEFAULT_TOLERANCE):
+    """Return a list of (name, measure, baseline, current) tuples for each
+    benchmark which has regressed by more than `tolerance`.
+
+    Import times are only tracked by time as the memory is used by the child
+    process. The number of Tcl calls does not vary between runs so any
+    increase is a regression.
+    """
+
+    regressions = []
+    for name, result in sorted(current['results'].items()):
+        try:
+            base = baseline['results'][name]
+        except KeyError:
+            continue
+
+        for measure in ('time', 'peak_memory', 'tcl_calls'):
+            if measure == 'peak_memory' and name.startswith('import.'):
+                continue
+            elif measure not in result or measure not in base:
+                continue
+
+            if measure == 'tcl_calls':
+                limit = base[measure]
+            else:
+                limit = base[measure] * (1 + tolerance)
+
+            if result[measure] > limit:
+                regressions.append((name, measure, base[measure],
+                                    result[measure]))
+
+    return regressions
+
+
+def _format_result(name, result):
+    text = '%-32s %10.3fms %10.1fKiB' % (name, result['time'] * 1000,
+                                         result['peak_memory'] / 1024)
+    if 'tcl_calls' in result:
+        text += ' %8d Tcl calls' % result['tcl_calls']
+    return text
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Run the tks benchmarks.')
+    parser.add_argument('names', nargs='*',
+                        help='Only run benchmarks starting with these names')
+    parser.add_argument('--save', metavar='FILE',
+                        help='Save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='Compare the results with a JSON baseline')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='The allowed fractional slow down')
+    parser.add_argument('--no-gui', action='store_true',
+                        help='Skip the benchmarks which need Tk')
+    parser.add_argument('--tcl', action='store_true',
+                        help='Count the Tcl commands issued by the GUI '
+                             'benchmarks and show the most frequent')
+    options = parser.parse_args(args)
+
+    current = run(options.names, options.repeat, gui=not options.no_gui,
+                  tcl=options.tcl)
+    for name, result in sorted(current['results'].items()):
+        print(_format_result(name, result))
+        for count, action, widget, operation in result.get('tcl_report', []):
+            print('    %8d  %s %s' % (count, widget, operation))
+    for name in current['skipped']:
+        print('%-32s skipped (Tk unavailable)' % name)
+
+    if options.save:
+        with open(options.save, 'w') as fp:
+            json.dump(current, fp, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare) as fp:
+            baseline = json.load(fp)
+
+        regressions = compare(baseline, current, options.tolerance)
+        for name, measure, base, value in regressions:
+            print('REGRESSION %s %s: %g -> %g' % (name, measure, base, value))
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
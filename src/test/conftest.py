@@ -0,0 +1,47 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import time
+
+import pytest
+
+
+class AfterRecorder(object):
+    """Stands in for a widget, recording its `after` and `after_idle`
+    callbacks so that a test can choose when they run."""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.pending[self.next_id] = func
+        return self.next_id
+
+    def after_idle(self, func):
+        return self.after(0, func)
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        """Run the callbacks scheduled so far, in the order they were
+        scheduled. Callbacks they schedule are left pending."""
+
+        pending, self.pending = self.pending, {}
+        for after_id in sorted(pending):
+            pending[after_id]()
+
+    def run_until_idle(self, timeout=5):
+        """Run callbacks until none are left, giving threads a chance to
+        finish their work between passes."""
+
+        end = time.time() + timeout
+        while self.pending and time.time() < end:
+            self.run_pending()
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def master():
+    return AfterRecorder()
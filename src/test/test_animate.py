@@ -0,0 +1,29 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from tks.animate import FrameScheduler
+
+
+def test_animation_ends(master):
+    scheduler = FrameScheduler(master)
+    fractions = []
+    scheduler.animate('hand', fractions.append, 0)
+    assert len(master.pending) == 1
+
+    master.run_pending()
+    assert fractions == [1.0]
+    assert not scheduler.running('hand')
+    assert master.pending == {}
+
+
+def test_single_callback(master):
+    scheduler = FrameScheduler(master)
+    scheduler.animate('a', lambda f: None, 10000)
+    scheduler.animate('b', lambda f: None, 10000)
+    assert len(master.pending) == 1
+
+    master.run_pending()
+    assert len(master.pending) == 1
+
+    scheduler.cancel('a')
+    scheduler.cancel('b')
+    assert master.pending == {}
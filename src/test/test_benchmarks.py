@@ -0,0 +1,65 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'bench'))
+
+# The benchmarks need Python 3.4 or later for tracemalloc
+benchmarks = pytest.importorskip('benchmarks')
+
+
+def results(**kwargs):
+    return {'results': dict((name.replace('_', '.'),
+                             {'time': t, 'peak_memory': m})
+                            for name, (t, m) in kwargs.items())}
+
+
+def test_compare_no_regression():
+    baseline = results(a=(1.0, 100))
+    current = results(a=(1.2, 120))
+    assert benchmarks.compare(baseline, current, 0.25) == []
+
+
+def test_compare_time_regression():
+    baseline = results(a=(1.0, 100))
+    current = results(a=(1.5, 100))
+    assert benchmarks.compare(baseline, current, 0.25) == [
+        ('a', 'time', 1.0, 1.5)]
+
+
+def test_compare_memory_regression():
+    baseline = results(a=(1.0, 100))
+    current = results(a=(1.0, 200))
+    assert benchmarks.compare(baseline, current, 0.25) == [
+        ('a', 'peak_memory', 100, 200)]
+
+
+def test_compare_import_memory_ignored():
+    baseline = results(import_tks=(1.0, 100))
+    current = results(import_tks=(1.0, 200))
+    assert benchmarks.compare(baseline, current, 0.25) == []
+
+
+def test_compare_new_benchmark():
+    baseline = results(a=(1.0, 100))
+    current = results(a=(1.0, 100), b=(5.0, 500))
+    assert benchmarks.compare(baseline, current, 0.25) == []
+
+
+def test_run_non_gui():
+    current = benchmarks.run(['color_funcs.conversions'], repeat=1, gui=False)
+    result = current['results']['color_funcs.conversions']
+    assert result['time'] > 0
+    assert current['skipped'] == []
+
+
+def test_compare_tcl_calls():
+    baseline = results(a=(1.0, 100))
+    baseline['results']['a']['tcl_calls'] = 50
+    current = results(a=(1.0, 100))
+    current['results']['a']['tcl_calls'] = 51
+    assert benchmarks.compare(baseline, current, 0.25) == [
+        ('a', 'tcl_calls', 50, 51)]
@@ -0,0 +1,115 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+from tks.chunked import ChunkScheduler
+
+
+def chunks(log, name, count):
+    for idx in range(count):
+        log.append((name, idx))
+        yield
+
+
+def test_run(master):
+    log = []
+    done = []
+    scheduler = ChunkScheduler(master, budget=1000)
+    scheduler.run('a', chunks(log, 'a', 3), done=lambda: done.append('a'))
+    assert scheduler.running('a')
+    assert log == []
+
+    master.run_pending()
+    assert log == [('a', 0), ('a', 1), ('a', 2)]
+    assert done == ['a']
+    assert not scheduler.running('a')
+    assert master.pending == {}
+
+
+def test_budget(master):
+    log = []
+    scheduler = ChunkScheduler(master, budget=0)
+    scheduler.run('a', chunks(log, 'a', 3))
+
+    master.run_pending()
+    assert log == [('a', 0)]
+    master.run_pending()
+    assert log == [('a', 0), ('a', 1)]
+
+
+def test_tasks_take_turns(master):
+    log = []
+    scheduler = ChunkScheduler(master, budget=0)
+    scheduler.run('a', chunks(log, 'a', 2))
+    scheduler.run('b', chunks(log, 'b', 2))
+
+    master.run_pending()
+    assert log == [('a', 0), ('b', 0)]
+
+
+def test_superseded(master):
+    log = []
+    done = []
+    scheduler = ChunkScheduler(master, budget=0)
+    scheduler.run('a', chunks(log, 'old', 3), done=lambda: done.append(1))
+    master.run_pending()
+    scheduler.run('a', chunks(log, 'new', 1), done=lambda: done.append(2))
+    while master.pending:
+        master.run_pending()
+
+    assert log == [('old', 0), ('new', 0)]
+    assert done == [2]
+
+
+def test_cancel(master):
+    log = []
+    scheduler = ChunkScheduler(master)
+    scheduler.run('a', chunks(log, 'a', 3))
+    scheduler.cancel('a')
+    assert master.pending == {}
+    assert log == []
+
+
+def test_finish(master):
+    log = []
+    done = []
+    scheduler = ChunkScheduler(master)
+    scheduler.run('a', chunks(log, 'a', 3), done=lambda: done.append(1))
+    scheduler.finish('a')
+    assert log == [('a', 0), ('a', 1), ('a', 2)]
+    assert done == [1]
+    assert not scheduler.running('a')
+
+
+def test_done_destroyed(master):
+    log = []
+
+    def destroyed():
+        raise tk.TclError('invalid command name ".!canvas"')
+
+    scheduler = ChunkScheduler(master, budget=0)
+    scheduler.run('a', chunks(log, 'a', 1), done=destroyed)
+    scheduler.run('b', chunks(log, 'b', 3))
+    while master.pending:
+        master.run_pending()
+
+    assert log == [('a', 0), ('b', 0), ('b', 1), ('b', 2)]
+    assert not scheduler.running('a')
+
+
+def test_idle(master):
+    log = []
+    scheduler = ChunkScheduler(master, budget=0, idle=True)
+    scheduler.run('a', chunks(log, 'a', 2))
+
+    master.run_pending()
+    assert log == [('a', 0)]
+
+    # The next chunk waits for the event loop before becoming idle again
+    master.run_pending()
+    assert log == [('a', 0)]
+    master.run_pending()
+    assert log == [('a', 0), ('a', 1)]
@@ -1,5 +1,7 @@
 """Tests for color functions"""
 
+from __future__ import division
+
 import py.test
 from tks import color_funcs
 
@@ -76,3 +78,108 @@ def test_rgb_tint(rgb):
 def test_rgb_shade(rgb):
     assert color_funcs.rgb_shade(rgb, 2) == (0.98, 0.23, 0.48)
     assert color_funcs.rgb_shade(rgb) == (0.95, 0.20, 0.45)
+
+
+def test_hex_string_to_rgba():
+    assert tuple_almost_equal(color_funcs.hex_string_to_rgb('#ff3f7f80'),
+                              (1.0, 0.25, 0.5, 0.5))
+    assert color_funcs.hex_string_to_rgb('#f008') == \
+        (1.0, 0.0, 0.0, 0x88 / 255)
+    assert color_funcs.hex_string_to_rgb('#f008', allow_short=False) is None
+    assert color_funcs.hex_string_to_rgb('#ff3f7f8') is None
+
+
+def test_rgba_to_strings():
+    rgba = (1.0, 0.0, 0.0, 0.5)
+    assert color_funcs.rgb_to_hex_string(rgba) == '#ff00007f'
+    assert color_funcs.rgb_to_rgb_string(rgba) == \
+        'rgba(1.000,0.000,0.000,0.500)'
+    assert color_funcs.rgb_to_hsv_string(rgba) == \
+        'hsva(0.000,1.000,1.000,0.500)'
+    assert color_funcs.rgb_to_hls_string(rgba) == \
+        'hlsa(0.000,0.500,1.000,0.500)'
+
+
+def test_rgba_string_to_rgb():
+    assert color_funcs.color_string_to_color('rgba(1, 0, 0, 0.5)') == \
+        ('rgb', (1.0, 0.0, 0.0, 0.5))
+    assert color_funcs.color_string_to_rgb('hsva(0, 1, 1, 0.5)') == \
+        (1.0, 0.0, 0.0, 0.5)
+    assert color_funcs.color_string_to_rgb('hlsa(0, 0.5, 1, 0.5)') == \
+        (1.0, 0.0, 0.0, 0.5)
+
+
+def test_batch_conversions():
+    colors = [(1.0, 0.25, 0.5), (0.0, 0.0, 0.0, 0.5), (0.5, 0.5, 0.5)]
+    hex_colors = color_funcs.rgb_to_hex_strings(colors)
+    assert hex_colors == [color_funcs.rgb_to_hex_string(c) for c in colors]
+
+    rgb = color_funcs.hex_strings_to_rgb(hex_colors + ['#FF3F7F', 'red'])
+    for value, expected in zip(rgb, hex_colors + ['#ff3f7f']):
+        assert value == color_funcs.hex_string_to_rgb(expected)
+    assert rgb[-1] is None
+
+
+def test_composite():
+    assert color_funcs.composite((1.0, 0.0, 0.0, 0.5), (0.0, 0.0, 1.0)) == \
+        (0.5, 0.0, 0.5)
+    assert color_funcs.composite((1.0, 0.0, 0.0), (0.0, 0.0, 1.0)) == \
+        (1.0, 0.0, 0.0)
+
+
+def test_rgba_tint():
+    assert color_funcs.rgb_tint((0.5, 0.5, 0.5, 0.25), 10) == \
+        (0.6, 0.6, 0.6, 0.25)
+
+
+def test_srgb_to_linear():
+    assert color_funcs.srgb_to_linear(0.0) == 0.0
+    assert color_funcs.srgb_to_linear(1.0) == 1.0
+    assert almost_equal(color_funcs.srgb_to_linear(0.5), 0.214)
+    assert almost_equal(color_funcs.linear_to_srgb(0.214), 0.5)
+
+
+def test_rgb_to_oklab():
+    assert tuple_almost_equal(color_funcs.rgb_to_oklab((1.0, 1.0, 1.0)),
+                              (1.0, 0.0, 0.0))
+    assert tuple_almost_equal(color_funcs.rgb_to_oklab((1.0, 0.0, 0.0)),
+                              (0.628, 0.225, 0.126))
+    assert tuple_almost_equal(color_funcs.rgb_to_oklab((0.0, 0.0, 1.0)),
+                              (0.452, -0.032, -0.312))
+
+
+def test_oklab_round_trip(rgb):
+    lab = color_funcs.rgb_to_oklab(rgb)
+    assert tuple_almost_equal(color_funcs.oklab_to_rgb(lab), rgb)
+
+
+def test_rgb_to_lab():
+    lab = color_funcs.rgb_to_lab((1.0, 0.0, 0.0))
+    assert abs(lab[0] - 53.24) < 0.01
+    assert abs(lab[1] - 80.09) < 0.01
+    assert abs(lab[2] - 67.20) < 0.01
+
+
+def test_lab_round_trip(rgb):
+    lab = color_funcs.rgb_to_lab(rgb)
+    assert tuple_almost_equal(color_funcs.lab_to_rgb(lab), rgb)
+
+
+def test_color_distance():
+    assert color_funcs.color_distance((0.5, 0.5, 0.5), (0.5, 0.5, 0.5)) == 0
+    assert almost_equal(color_funcs.color_distance((0.0, 0.0, 0.0),
+                                                   (1.0, 1.0, 1.0)), 1.0)
+
+
+def test_perceptual_tints(rgb):
+    base = color_funcs.rgb_to_oklab((0.2, 0.4, 0.6))[0]
+    tints = color_funcs.rgb_tints((0.2, 0.4, 0.6), 5, 3, perceptual=True)
+    lightness = [color_funcs.rgb_to_oklab(t)[0] for t in tints]
+    for idx, value in enumerate(lightness):
+        assert almost_equal(value - base, (idx + 1) * 0.05)
+
+
+def test_perceptual_shade_keeps_alpha():
+    shade = color_funcs.perceptual_shade((0.2, 0.4, 0.6, 0.5), 10)
+    assert len(shade) == 4
+    assert shade[3] == 0.5
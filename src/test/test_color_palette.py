@@ -0,0 +1,18 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from tks.color_palette import Palette, oklab_key_func
+
+
+def test_find_closest():
+    palette = Palette('x11.txt', read_only=True)
+    assert palette[palette.find_closest((0.98, 0.01, 0.02))].display_name \
+        == 'Red'
+    assert palette[palette.find_closest((0.5, 0.5, 0.5))].display_name \
+        == 'Gray 50'
+
+
+def test_oklab_sort():
+    palette = Palette('css3.txt', read_only=True)
+    items = sorted(palette.items(), key=oklab_key_func)
+    assert items[0][0] == (0.0, 0.0, 0.0)
+    assert items[-1][0] == (1.0, 1.0, 1.0)
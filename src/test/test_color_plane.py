@@ -0,0 +1,47 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from __future__ import division
+
+from tks.color_plane import sv_from_position, position_from_sv, \
+    hue_from_position, hue_color, plane_data, hue_bar_data
+
+
+def test_sv_from_position():
+    assert sv_from_position(0, 0, 101, 101) == (0.0, 1.0)
+    assert sv_from_position(100, 100, 101, 101) == (1.0, 0.0)
+    assert sv_from_position(50, 25, 101, 101) == (0.5, 0.75)
+    assert sv_from_position(-5, 200, 101, 101) == (0.0, 0.0)
+
+
+def test_position_from_sv():
+    assert position_from_sv(0.5, 0.75, 101, 101) == (50.0, 25.0)
+
+
+def test_hue_from_position():
+    assert hue_from_position(0, 101) == 0.0
+    assert hue_from_position(50, 101) == 0.5
+    assert hue_from_position(150, 101) == 1.0
+
+
+def test_hue_color():
+    assert hue_color(0.0) == (255, 0, 0)
+    assert hue_color(1 / 3) == (0, 255, 0)
+
+
+def test_plane_data():
+    data = bytearray(plane_data((255, 0, 0), 3, 3))
+    assert len(data) == 3 * 3 * 3
+
+    # White top left, the hue top right and black along the bottom
+    assert list(data[0:3]) == [255, 255, 255]
+    assert list(data[6:9]) == [255, 0, 0]
+    assert list(data[12:15]) == [128, 64, 64]
+    assert list(data[18:27]) == [0] * 9
+
+
+def test_hue_bar_data():
+    data = bytearray(hue_bar_data(2, 4))
+    assert len(data) == 2 * 4 * 3
+    assert list(data[0:6]) == [255, 0, 0] * 2
+    assert list(data[-6:]) == [255, 0, 0] * 2
+    assert hue_bar_data(2, 4) is hue_bar_data(2, 4)
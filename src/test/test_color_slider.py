@@ -0,0 +1,41 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import colorsys
+
+from tks.color_slider import quantize, gradient_colors, alpha_colors, \
+    GRADIENT_LEVELS
+
+
+def test_quantize():
+    assert quantize(0.0) == 0
+    assert quantize(1.0) == GRADIENT_LEVELS - 1
+    assert quantize(0.5, levels=3) == 1
+    assert quantize(-0.1) == 0
+    assert quantize(1.5) == GRADIENT_LEVELS - 1
+
+
+def test_gradient_colors_rgb():
+    colors = gradient_colors(lambda rgb: rgb, 1, (GRADIENT_LEVELS - 1, 0), 3)
+    assert colors == ['#ff0000', '#ff8000', '#ffff00']
+
+
+def test_gradient_colors_hsv():
+    to_rgb = lambda hsv: colorsys.hsv_to_rgb(*hsv)
+    colors = gradient_colors(to_rgb, 0, (GRADIENT_LEVELS - 1,
+                                         GRADIENT_LEVELS - 1), 7)
+    assert colors[0] == '#ff0000'
+    assert colors[2] == '#00ff00'
+    assert colors[4] == '#0000ff'
+    assert colors[-1] == '#ff0000'
+
+
+def test_alpha_colors():
+    top, bottom = alpha_colors((1.0, 0.0, 0.0), 4, cell=2)
+    assert len(top) == len(bottom) == 4
+
+    # Transparent shows the checkerboard and opaque the color
+    assert top[0] == '#cccccc'
+    assert bottom[0] == '#999999'
+    assert top[2] == '#dd3333'
+    assert bottom[2] == '#ee4444'
+    assert top[3] == bottom[3] == '#ff0000'
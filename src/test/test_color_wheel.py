@@ -0,0 +1,40 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from tks.color_wheel import wheel_data, wheel_data_steps, inner_radius, \
+    triangle_data
+
+
+def test_inner_radius():
+    assert inner_radius(100) == 75
+
+
+def test_wheel_data():
+    data = wheel_data(20, 15)
+    stride = 41
+    assert len(data) == stride * stride * 4
+
+    # Center is transparent, 3 o'clock on the ring is red
+    center = ((20 * stride) + 20) * 4
+    assert data[center + 3] == 0
+    right = ((20 * stride) + 38) * 4
+    assert tuple(bytearray(data[right:right + 4])) == (255, 0, 0, 255)
+
+    assert wheel_data(20, 15) is data
+
+
+def test_wheel_data_steps():
+    steps = sum(1 for _ in wheel_data_steps(30, 22, rows=10))
+    assert steps == 6
+    assert list(wheel_data_steps(30, 22)) == []
+    assert len(wheel_data(30, 22)) == 61 * 61 * 4
+
+
+def test_triangle_data():
+    data = triangle_data(20, 0)
+    stride = 41
+    assert len(data) == stride * stride * 4
+
+    # The hue vertex is at 3 o'clock and the corners are transparent
+    hue = ((20 * stride) + 40) * 4
+    assert tuple(bytearray(data[hue:hue + 4])) == (255, 0, 0, 255)
+    assert bytearray(data[3:4]) == bytearray([0])
@@ -0,0 +1,129 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import datetime
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+import py.test
+
+import tks
+from tks.dates import DateSelector, DateRangeSelector
+
+
+@py.test.fixture(scope="module")
+def root():
+    tk.NoDefaultRoot()
+    return tk.Tk()
+
+
+class KeyEvent(object):
+    def __init__(self, keysym, state=0):
+        self.keysym = keysym
+        self.state = state
+
+
+class ClickEvent(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def click(selector, week_number, day_number):
+    ds = selector._ds
+    event = ClickEvent(ds._cells_left + (day_number + 0.5) * ds._x_stride,
+                       ds._cells_top + (week_number + 0.5) * ds._y_stride)
+    ds._date_clicked(event)
+    selector.update_idletasks()
+
+
+def press(selector, keysym, state=0):
+    result = selector._ds._keysym_press(KeyEvent(keysym, state))
+    selector.update_idletasks()
+    return result
+
+
+def test_DaySelector_keys(root):
+    selector = DateSelector(root, datetime.date(2018, 1, 31), locale=None)
+    assert root.focus_get() is not selector._ds._canvas
+
+    assert press(selector, 'Right') == 'break'
+    assert selector.date == datetime.date(2018, 2, 1)
+    press(selector, 'Up')
+    assert selector.date == datetime.date(2018, 1, 25)
+    press(selector, 'End')
+    assert selector.date == datetime.date(2018, 1, 31)
+    press(selector, 'Next')
+    assert selector.date == datetime.date(2018, 2, 28)
+    press(selector, 'Prior', state=0x1)
+    assert selector.date == datetime.date(2017, 2, 28)
+    press(selector, 'Home')
+    assert selector.date == datetime.date(2017, 2, 1)
+    assert press(selector, 'a') is None
+
+
+def test_DaySelector_keys_limits(root):
+    selector = DateSelector(root, datetime.date(9999, 11, 30), locale=None)
+    press(selector, 'Right')
+    assert selector.date == datetime.date(9999, 11, 30)
+    press(selector, 'Next', state=0x1)
+    assert selector.date == datetime.date(9999, 11, 30)
+
+    selector = DateSelector(root, datetime.date(2, 1, 15), locale=None)
+    press(selector, 'Prior', state=0x1)
+    assert selector.date == datetime.date(1, 2, 15)
+    press(selector, 'Home')
+    press(selector, 'Left')
+    assert selector.date == datetime.date(1, 2, 1)
+
+
+def test_DaySelector_click_other_month(root):
+    selector = DateSelector(root, datetime.date(2018, 1, 15), locale=None)
+    ds = selector._ds
+
+    # The last cell of the grid is in February
+    click(selector, 5, 6)
+    assert selector.date == datetime.date(2018, 2, 11)
+    assert ds._displayed_month() == (2018, 2)
+    assert ds._month_btn['text'] == ds._months[2]
+
+    click(selector, 2, 0)
+    assert selector.date == datetime.date(2018, 2, 12)
+    assert ds._displayed_month() == (2018, 2)
+
+
+def test_DaySelector_keys_same_month(root):
+    selector = DateSelector(root, datetime.date(2018, 1, 15), locale=None)
+    updated = []
+    selector._ms._update = lambda: updated.append('month')
+    selector._ys._update = lambda: updated.append('year')
+
+    press(selector, 'Right')
+    assert selector.date == datetime.date(2018, 1, 16)
+    assert updated == []
+
+    press(selector, 'Next')
+    assert selector.date == datetime.date(2018, 2, 16)
+    assert updated == ['month', 'year']
+
+
+def test_DateRangeSelector_colors(root):
+    colors = tks.load_colors()
+    DateRangeSelector(root, datetime.date(2018, 1, 1), colors=colors)
+    assert not hasattr(colors, 'range')
+    assert not hasattr(colors, 'other_month')
+
+
+def test_DateRangeSelector_config_changed(root):
+    colors = tks.load_colors()
+    selector = DateRangeSelector(root, datetime.date(2018, 1, 1),
+                                 colors=colors)
+    selector.range = (datetime.date(2018, 1, 10), datetime.date(2018, 1, 12))
+
+    colors.select = '#ff0000'
+    selector._config_changed(None)
+    assert selector._range_color == tks.dates._range_tint('#ff0000')
+    assert set(selector._cell_state.values()) == {'#ff0000',
+                                                  selector._range_color}
@@ -0,0 +1,52 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import calendar
+import datetime
+
+from tks.dates import add_months, next_year, month_grid
+
+
+def test_add_months():
+    assert add_months(datetime.date(2014, 1, 15), 1) == datetime.date(2014, 2, 15)
+    assert add_months(datetime.date(2014, 12, 15), 1) == datetime.date(2015, 1, 15)
+    assert add_months(datetime.date(2014, 1, 15), -1) == datetime.date(2013, 12, 15)
+
+
+def test_add_months_short_month():
+    assert add_months(datetime.date(2014, 1, 31), 1) == datetime.date(2014, 2, 28)
+    assert add_months(datetime.date(2016, 3, 31), -1) == datetime.date(2016, 2, 29)
+
+
+def test_add_months_limits():
+    assert add_months(datetime.date(1, 2, 15), -3) == datetime.date(1, 1, 15)
+    assert add_months(datetime.date(9999, 11, 15), 12) == \
+        datetime.date(9999, 12, 15)
+
+
+def test_next_year_limits():
+    assert next_year(datetime.date(5, 6, 1), -10) == datetime.date(1, 6, 1)
+    assert next_year(datetime.date(9995, 6, 1), 10) == \
+        datetime.date(9999, 6, 1)
+    assert next_year(datetime.date(2016, 2, 29), 1) == \
+        datetime.date(2017, 2, 28)
+
+
+def test_month_grid():
+    grid = month_grid(2014, 1, calendar.MONDAY)
+
+    assert len(grid) == 6
+    assert all(len(week) == 7 for week in grid)
+    assert grid[0][0] == datetime.date(2013, 12, 30)
+    assert grid[-1][-1] == datetime.date(2014, 2, 9)
+
+
+def test_month_grid_four_weeks():
+    # February 2010 starts on a Monday and fits in exactly 4 weeks
+    grid = month_grid(2010, 2, calendar.MONDAY)
+
+    assert len(grid) == 6
+    assert grid[0][0] == datetime.date(2010, 2, 1)
+
+
+def test_month_grid_cached():
+    assert month_grid(2014, 1) is month_grid(2014, 1)
@@ -0,0 +1,128 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+import py.test
+
+from tks.dial_geometry import (DialGeometry, unit_positions, endpoints, polar,
+                               dial_position, in_rect, get_dial_geometry,
+                               MODE_12HOUR, MODE_MINUTE)
+from tks.styles import get_font
+
+
+@py.test.fixture(scope="module")
+def root():
+    tk.NoDefaultRoot()
+    return tk.Tk()
+
+
+def almost_equal(value, compare_with):
+    return abs(value - compare_with) < 0.005
+
+
+def test_polar():
+    radius, angle = polar((100, 100), 100, 50)
+    assert almost_equal(radius, 50)
+    assert almost_equal(angle, 0)
+
+    radius, angle = polar((100, 100), 150, 100)
+    assert almost_equal(radius, 50)
+    assert almost_equal(angle, 90)
+
+    radius, angle = polar((100, 100), 50, 100)
+    assert almost_equal(angle, 270)
+
+
+def test_dial_position():
+    assert dial_position(0) == 0
+    assert dial_position(14) == 0
+    assert dial_position(16) == 1
+    assert dial_position(350) == 0
+    assert dial_position(90) == 3
+    assert dial_position(90, count=60) == 15
+
+
+def test_in_rect():
+    assert in_rect((0, 0, 10, 10), 5, 5)
+    assert in_rect((10, 10, 0, 0), 5, 5)
+    assert not in_rect((0, 0, 10, 10), 11, 5)
+
+
+def test_unit_positions():
+    positions = unit_positions(4)
+    assert almost_equal(positions[0][1], -1)
+    assert almost_equal(positions[1][0], 1)
+    assert unit_positions(4) is positions
+
+
+def test_numerals():
+    geometry = DialGeometry(10, '24hour')
+    assert len(geometry.numerals) == 24
+
+    numeral = geometry.numerals[-1]
+    assert numeral.text == '00'
+    radius, angle = polar(geometry.center, *numeral.position)
+    assert almost_equal(radius, geometry.outer_radius)
+    assert almost_equal(angle, 0)
+
+    assert len(DialGeometry(10, 'minute').numerals) == 12
+
+
+def test_tag_at():
+    geometry = DialGeometry(10, '12hour', (20, 12))
+    cx, cy = geometry.center
+    assert geometry.tag_at(cx + geometry.outer_radius, cy) == 'h3c'
+    assert geometry.tag_at(cx, cy - geometry.inner_radius) == 'm0c'
+    assert geometry.tag_at(cx, cy) is None
+    assert geometry.ampm_at(cx, cy - 12) == 'am'
+
+    geometry = DialGeometry(10, '24hour')
+    cx, cy = geometry.center
+    assert geometry.tag_at(cx, cy - geometry.outer_radius) == 'h0c'
+    assert geometry.tag_at(cx, cy - geometry.inner_radius) == 'h12c'
+
+
+def test_endpoints():
+    table = endpoints((100, 100), 50, 12, 24)
+    assert len(table) == 24
+    assert almost_equal(table[0][1], 50)
+    assert almost_equal(table[3][0], 150)
+    assert table[15] == table[3]
+    assert endpoints((100, 100), 50, 12, 24) is table
+
+
+def test_value_at():
+    geometry = DialGeometry(10, '12hour', (20, 12))
+    cx, cy = geometry.center
+    assert geometry.ring_at(cx, cy - geometry.outer_radius) == 'outer'
+    assert geometry.value_at(cx, cy - geometry.outer_radius) == 12
+    assert geometry.value_at(cx + 10, cy, ring='inner') == 15
+    assert geometry.ring_at(cx, cy - geometry.dial_radius - 1) is None
+
+    geometry = DialGeometry(10, '24hour')
+    cx, cy = geometry.center
+    # "00" is at the top of the outer ring and "12" at the top of the inner
+    assert geometry.value_at(cx, cy - geometry.outer_radius) == 0
+    assert geometry.value_at(cx, cy - geometry.inner_radius) == 12
+    assert geometry.tag_at(cx + geometry.outer_radius, cy) == 'h15c'
+    assert geometry.value_at(cx, cy + geometry.outer_radius) == 18
+    assert geometry.value_at(cx, cy + geometry.inner_radius) == 6
+
+    geometry = DialGeometry(10, 'minute')
+    cx, cy = geometry.center
+    assert geometry.value_at(cx + 5, cy - 8.66) == 5
+
+
+def test_get_dial_geometry(root):
+    font = ('TkTextFont',)
+    geometry = get_dial_geometry(root, font, MODE_12HOUR)
+    assert get_dial_geometry(root, font, MODE_12HOUR) is geometry
+    assert get_dial_geometry(root, font, MODE_MINUTE) is not geometry
+    assert root._tks_dial_geometry[(font, MODE_12HOUR)] is geometry
+
+    # The font is measured with the font shared by the interpreter
+    text_width = get_font(root, font).measure('00')
+    assert geometry.selection_radius == text_width * 1.125
@@ -0,0 +1,67 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(module):
+    """Return the top level modules imported by a fresh interpreter which
+    imports `module`."""
+
+    code = ('import sys, %s; '
+            'print(" ".join(set(m.split(".")[0] for m in sys.modules)))' %
+            module)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [SRC_DIR] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep)
+                     if p])
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    return set(output.decode('ascii').split())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='tks imports Tkinter before Python 3.7')
+def test_import_tks():
+    modules = imported_modules('tks')
+    assert 'tkinter' not in modules
+    assert 'Tkinter' not in modules
+
+
+def test_import_color_funcs():
+    modules = imported_modules('tks.color_funcs')
+    assert 'tkinter' not in modules
+    assert 'PIL' not in modules
+    assert 'babel' not in modules
+
+
+def test_import_rc():
+    modules = imported_modules('tks.rc')
+    assert 'tkinter' not in modules
+    assert 'PIL' not in modules
+    assert 'babel' not in modules
+
+
+def test_import_colors():
+    modules = imported_modules('tks.colors')
+    assert 'PIL' not in modules
+
+
+def test_import_dates_and_times():
+    modules = imported_modules('tks.dates, tks.times')
+    assert 'PIL' not in modules
+    assert 'babel' not in modules
+
+
+def test_lazy_attributes():
+    code = ('import sys, tks; '
+            'assert "tks.color_funcs" not in sys.modules; '
+            'tks.color_funcs; '
+            'assert "tks.color_funcs" in sys.modules')
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    if sys.version_info >= (3, 7):
+        subprocess.check_call([sys.executable, '-c', code], env=env)
@@ -0,0 +1,97 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import py.test
+
+import tks
+import tks.rc
+import tks.instrument as instrument
+
+
+@py.test.fixture
+def recording():
+    enabled = instrument.enabled()
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.enable(enabled)
+    instrument.reset()
+
+
+def test_disabled():
+    enabled = instrument.enabled()
+    instrument.enable(False)
+    instrument.reset()
+
+    @instrument.timed('test.disabled')
+    def func():
+        return 1
+
+    assert func() == 1
+    assert 'test.disabled' not in instrument.stats()
+    instrument.enable(enabled)
+
+
+def test_timed(recording):
+    @instrument.timed('test.timed')
+    def func(a, b=2):
+        return a + b
+
+    assert func(1) == 3
+    assert func(1, b=3) == 4
+
+    counter = instrument.stats()['test.timed']
+    assert counter['calls'] == 2
+    assert counter['time'] >= counter['max_time'] >= counter['mean_time']
+
+
+def test_timed_exception(recording):
+    @instrument.timed('test.exception')
+    def func():
+        raise ValueError
+
+    with py.test.raises(ValueError):
+        func()
+
+    assert instrument.stats()['test.exception']['calls'] == 1
+
+
+def test_timed_steps(recording):
+    @instrument.timed_steps('test.steps')
+    def steps(count):
+        for idx in range(count):
+            yield idx
+
+    assert list(steps(3)) == [0, 1, 2]
+
+    counter = instrument.stats()['test.steps']
+    assert counter['calls'] == 1
+
+    # A partly run generator is not recorded
+    next(steps(3))
+    assert instrument.stats()['test.steps']['calls'] == 1
+
+
+def test_wheel_data(recording):
+    import tks.color_wheel as cw
+
+    cw._wheel_cache.pop((20, cw.inner_radius(20)), None)
+    cw.wheel_data(20, cw.inner_radius(20))
+    assert instrument.stats()['color_wheel.wheel_data']['calls'] == 1
+
+
+def test_reset(recording):
+    @instrument.timed('test.reset')
+    def func():
+        pass
+
+    func()
+    instrument.reset()
+    assert tks.stats() == {}
+
+
+def test_rc_read(recording, tmpdir):
+    filename = tmpdir.join('tksrc')
+    filename.write('[color]\nselect=red\n')
+    rc = tks.rc.rcfile(str(filename))
+    rc.read()
+    assert tks.stats()['rcfile.read']['calls'] == 1
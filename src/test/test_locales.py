@@ -0,0 +1,42 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import datetime
+
+from tks.locales import LocaleInfo, get_locale_info
+
+
+def test_get_locale_info_cached():
+    assert get_locale_info('en') is get_locale_info('en')
+
+
+def test_get_locale_info_passthrough():
+    info = get_locale_info('en')
+    assert get_locale_info(info) is info
+
+
+def test_locale_info_number():
+    info = get_locale_info('en')
+
+    assert info.number(7) == '7'
+    assert info.number(99) == '99'
+    assert info.number(1000) == '1,000'
+
+
+def test_locale_info_ampm():
+    assert get_locale_info('en').ampm == ('AM', 'PM')
+    assert get_locale_info('de').ampm is None
+
+
+def test_locale_info_no_locale():
+    info = LocaleInfo(None)
+
+    assert info.date_pattern == 'yyyy-MM-dd'
+    assert info.number(5) == '5'
+    assert info.format_date(datetime.date(2014, 1, 2)) == '2014-01-02'
+    assert info.format_time(datetime.time(9, 5)) == '09:05'
+
+
+def test_locale_info_format_time():
+    info = get_locale_info('de')
+
+    assert info.format_time(datetime.time(13, 5)) == '13:05'
@@ -0,0 +1,60 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import datetime
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+import py.test
+
+from tks.dates import DateVar, CompactDateEntry
+from tks.times import TimeVar, TimeSlots, CompactTimeEntry
+
+@py.test.fixture(scope="module")
+def root():
+    tk.NoDefaultRoot()
+    return tk.Tk()
+
+
+def test_CompactDateEntry_spin(root):
+    v = DateVar(master=root, value=datetime.date(2018, 1, 31))
+    e = CompactDateEntry(root, variable=v, locale=None)
+    assert e.get() == '2018-01-31'
+
+    e.icursor(5)
+    e._spin(1)
+    assert v.get() == datetime.date(2018, 2, 28)
+    assert e.get() == '2018-02-28'
+
+
+def test_CompactDateEntry_type(root):
+    v = DateVar(master=root, value=datetime.date(2018, 1, 31))
+    e = CompactDateEntry(root, variable=v, locale=None)
+
+    e.icursor(8)
+    e._type('0')
+    assert v.get() == datetime.date(2018, 1, 31)
+    e._type('5')
+    assert v.get() == datetime.date(2018, 1, 5)
+
+
+def test_CompactDateEntry_variable(root):
+    v = DateVar(master=root, value=datetime.date(2018, 1, 31))
+    e = CompactDateEntry(root, variable=v, locale=None)
+    v.set(datetime.date(2017, 6, 1))
+    assert e.get() == '2017-06-01'
+
+
+def test_CompactTimeEntry_slots(root):
+    v = TimeVar(master=root, value=datetime.time(9, 15))
+    e = CompactTimeEntry(root, variable=v, locale=None,
+                         slots=TimeSlots(step=15))
+    assert e.get() == '09:15'
+
+    e.icursor(3)
+    e._spin(1)
+    assert v.get() == datetime.time(9, 30)
+    e._spin(-1)
+    assert v.get() == datetime.time(9, 15)
@@ -0,0 +1,52 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from tks.prewarming import Prewarmer
+
+
+def test_steps_run(master):
+    calls = []
+
+    def gen():
+        for i in range(3):
+            calls.append(('gen', i))
+            yield
+
+    steps = [lambda: calls.append('a'), gen, lambda: calls.append('b')]
+    warmer = Prewarmer(master, steps)
+    while warmer.run_step():
+        pass
+
+    assert calls == ['a', ('gen', 0), ('gen', 1), ('gen', 2), 'b']
+
+
+def test_idle_callbacks(master):
+    done = []
+    warmer = Prewarmer(master, [lambda: None] * 5, budget=1000,
+                       command=lambda: done.append(True))
+    warmer.start()
+    assert not warmer.done
+
+    master.run_pending()
+    assert warmer.done
+    assert done == [True]
+
+
+def test_budget_yields(master):
+    warmer = Prewarmer(master, [lambda: None] * 5, budget=0)
+    warmer.start()
+
+    # A zero budget runs a single step per callback
+    count = 0
+    while not warmer.done:
+        master.run_pending()
+        count += 1
+    assert count > 5
+
+
+def test_cancel(master):
+    calls = []
+    warmer = Prewarmer(master, [lambda: calls.append(1)])
+    warmer.start()
+    warmer.cancel()
+    master.run_pending()
+    assert calls == []
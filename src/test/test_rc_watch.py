@@ -0,0 +1,45 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import tks
+from tks.rc_watch import _changes, _update
+
+
+def test_changes_added():
+    assert _changes({}, {'select': 'red'}, tks.DefaultColors) == \
+        {'select': 'red'}
+
+
+def test_changes_unchanged():
+    assert _changes({'select': 'red'}, {'select': 'red'},
+                    tks.DefaultColors) == {}
+
+
+def test_changes_removed_reverts_to_default():
+    assert _changes({'select': 'red'}, {}, tks.DefaultColors) == \
+        {'select': tks.DefaultColors.select}
+
+
+def test_changes_set_to_default():
+    assert _changes({}, {'header': tks.DefaultColors.header},
+                    tks.DefaultColors) == {}
+
+
+def test_update():
+    colors = tks.DefaultColors()
+    assert _update(colors, tks.DefaultColors, {}, {'select': 'red'})
+    assert colors.select == 'red'
+
+
+def test_update_keeps_widget_value():
+    colors = tks.DefaultColors()
+    colors.select = 'green'
+    assert not _update(colors, tks.DefaultColors, {}, {'select': 'red'})
+    assert colors.select == 'green'
+
+
+def test_update_from_old_rc_value():
+    fonts = tks.DefaultFonts()
+    fonts.text = ('Calibri', '9')
+    assert _update(fonts, tks.DefaultFonts, {'text': ('Calibri', '9')},
+                   {'text': ('Arial', '10')})
+    assert fonts.text == ('Arial', '10')
@@ -1,6 +1,8 @@
+import os
 import tempfile
 
-from tks.rc import rcfile
+import tks
+from tks.rc import rcfile, get_rcfile, clear_rc_cache
 
 def test_rcfile_init():
     f = rcfile()
@@ -47,3 +49,48 @@ def test_rcfile_write():
     f2.read()
 
     assert f2['font.family'] == 'Consolas'
+
+
+def test_get_rcfile_cached(tmpdir):
+    clear_rc_cache()
+    fname = tmpdir.join('tksrc')
+    fname.write(u"[color]\nselect=red\n")
+
+    rc = get_rcfile(str(fname))
+    assert rc['color.select'] == 'red'
+    assert get_rcfile(str(fname)) is rc
+
+
+def test_get_rcfile_changed(tmpdir):
+    clear_rc_cache()
+    fname = tmpdir.join('tksrc')
+    fname.write(u"[color]\nselect=red\n")
+    rc = get_rcfile(str(fname))
+
+    fname.write(u"[color]\nselect=blue\n")
+    mtime = os.stat(str(fname)).st_mtime
+    os.utime(str(fname), (mtime + 10, mtime + 10))
+
+    rc2 = get_rcfile(str(fname))
+    assert rc2 is not rc
+    assert rc2['color.select'] == 'blue'
+
+
+def test_load_colors_and_fonts(tmpdir, monkeypatch):
+    clear_rc_cache()
+    monkeypatch.setenv('HOME', str(tmpdir))
+    tmpdir.join('.tksrc').write(
+        u"[color]\nselect=red\nheader=\n[font]\ntext=Calibri, 9\n")
+
+    colors = tks.load_colors()
+    assert colors.select == 'red'
+    assert colors.header == tks.DefaultColors.header
+
+    colors.select = 'green'
+    assert tks.load_colors().select == 'red'
+    assert tks.load_colors() is not colors
+
+    fonts = tks.load_fonts()
+    assert fonts.text == ('Calibri', '9')
+    assert fonts.monospace == tks.DefaultFonts.monospace
+    clear_rc_cache()
@@ -0,0 +1,79 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import time
+import threading
+
+import pytest
+
+from tks.rendering import RenderPool
+
+
+def square(value):
+    return value * value
+
+
+def fail():
+    raise ValueError('bad')
+
+
+def test_submit(master):
+    pool = RenderPool(master)
+    results = []
+    pool.submit('a', square, (3,), callback=results.append)
+    assert pool.pending('a')
+    assert results == []
+
+    master.run_until_idle()
+    assert results == [9]
+    assert not pool.pending('a')
+    assert master.pending == {}
+    pool.shutdown()
+
+
+def test_callback_on_polling_thread(master):
+    pool = RenderPool(master)
+    threads = []
+    pool.submit('a', square, (2,),
+                callback=lambda _: threads.append(threading.current_thread()))
+    master.run_until_idle()
+    assert threads == [threading.current_thread()]
+    pool.shutdown()
+
+
+def test_superseded(master):
+    pool = RenderPool(master, workers=1)
+    results = []
+    for value in range(5):
+        pool.submit('a', square, (value,), callback=results.append)
+    pool.submit('b', square, (10,), callback=results.append)
+
+    master.run_until_idle()
+    assert sorted(results) == [16, 100]
+    pool.shutdown()
+
+
+def test_cancel(master):
+    pool = RenderPool(master)
+    results = []
+    pool.submit('a', square, (3,), callback=results.append)
+    pool.cancel('a')
+    assert master.pending == {}
+
+    time.sleep(0.05)
+    master.run_until_idle()
+    assert results == []
+    pool.shutdown()
+
+
+def test_error(master):
+    pool = RenderPool(master)
+    results = []
+    pool.submit('a', fail)
+    pool.submit('b', square, (4,), callback=results.append)
+
+    with pytest.raises(ValueError):
+        master.run_until_idle()
+
+    master.run_until_idle()
+    assert results == [16]
+    pool.shutdown()
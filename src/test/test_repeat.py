@@ -0,0 +1,111 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+from tks.repeat import AutoRepeat
+
+
+class FakeWidget(object):
+    """Records the bindings and `after` callbacks of an AutoRepeat."""
+
+    def __init__(self):
+        self.bindings = {}
+        self.callbacks = {}
+        self.idle = []
+        self.command = None
+        self._next_id = 0
+
+    def keys(self):
+        return ['command']
+
+    def configure(self, command):
+        self.command = command
+
+    def invoke(self):
+        self.command()
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def after(self, ms, func):
+        self._next_id += 1
+        after_id = 'after#%d' % self._next_id
+        self.callbacks[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id):
+        del self.callbacks[after_id]
+
+    def after_idle(self, func):
+        self.idle.append(func)
+
+    def press(self):
+        self.bindings['<ButtonPress-1>'](None)
+
+    def release(self):
+        """Release the mouse button over the widget, which invokes it, and
+        let Tk become idle."""
+
+        self.bindings['<ButtonRelease-1>'](None)
+        self.invoke()
+        while self.idle:
+            self.idle.pop(0)()
+
+    def fire(self):
+        """Run the scheduled callback, returning False if there is none."""
+
+        if not self.callbacks:
+            return False
+
+        after_id = sorted(self.callbacks)[0]
+        self.callbacks.pop(after_id)()
+        return True
+
+
+def test_AutoRepeat_click():
+    widget = FakeWidget()
+    steps = []
+    AutoRepeat(widget, steps.append)
+
+    widget.press()
+    widget.release()
+    assert steps == [1]
+    assert widget.callbacks == {}
+
+    widget.invoke()
+    assert steps == [1, 1]
+
+
+def test_AutoRepeat():
+    widget = FakeWidget()
+    steps = []
+    AutoRepeat(widget, steps.append, accelerate_after=2, accelerated_step=10)
+
+    widget.press()
+    for _ in range(4):
+        widget.fire()
+    widget.release()
+
+    assert steps == [1, 1, 10, 10]
+    assert widget.callbacks == {}
+
+    # The keyboard still steps after the button has repeated
+    widget.invoke()
+    assert steps == [1, 1, 10, 10, 1]
+
+
+def test_AutoRepeat_stops_at_limit():
+    widget = FakeWidget()
+    position = [0]
+
+    def step(count):
+        position[0] = min(position[0] + count, 3)
+        return position[0] < 3
+
+    AutoRepeat(widget, step)
+    widget.press()
+    repeats = 0
+    while widget.fire():
+        repeats += 1
+    widget.release()
+
+    assert position[0] == 3
+    assert repeats == 3
@@ -0,0 +1,54 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+import py.test
+
+from tks.styles import get_font, configure_style, lookup_style
+
+
+@py.test.fixture(scope="module")
+def root():
+    tk.NoDefaultRoot()
+    return tk.Tk()
+
+
+def test_get_font_shared(root):
+    f1 = get_font(root, ('TkTextFont',))
+    f2 = get_font(root, ('TkTextFont',))
+    assert f1 is f2
+
+
+def test_get_font_variants(root):
+    f = get_font(root, ('TkTextFont',))
+    bold = get_font(root, ('TkTextFont',), weight='bold', scale=2)
+    assert bold is not f
+    assert bold.actual('weight') == 'bold'
+    assert bold.actual('size') == int(f.actual('size') * 2)
+
+
+def test_configure_style(root):
+    assert configure_style(root, 'Test.TLabel', foreground='red') == \
+        'Test.TLabel'
+    assert lookup_style(root, 'Test.TLabel', 'foreground') == 'red'
+
+
+def test_configure_style_after_lookup(root):
+    configure_style(root, 'Test3.TLabel', foreground='red')
+    assert lookup_style(root, 'Test3.TLabel', 'foreground') == 'red'
+    assert lookup_style(root, 'Sub.Test3.TLabel', 'foreground') == 'red'
+
+    configure_style(root, 'Test3.TLabel', foreground='blue')
+    assert lookup_style(root, 'Test3.TLabel', 'foreground') == 'blue'
+    assert lookup_style(root, 'Sub.Test3.TLabel', 'foreground') == 'blue'
+
+
+def test_configure_style_only_changes(root):
+    configure_style(root, 'Test2.TLabel', foreground='red')
+    registry = root._tks_styles
+    assert registry.options[('Test2.TLabel', 'foreground')] == 'red'
+    configure_style(root, 'Test2.TLabel', foreground='blue')
+    assert registry.options[('Test2.TLabel', 'foreground')] == 'blue'
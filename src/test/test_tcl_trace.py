@@ -0,0 +1,108 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import io
+
+from tks.tcl_trace import TclTracer, trace
+
+
+class FakeTkApp(object):
+    def __init__(self):
+        self.calls = []
+
+    def call(self, *args):
+        self.calls.append(args)
+        return 'result'
+
+    def globalsetvar(self, name, value):
+        pass
+
+    def splitlist(self, value):
+        return value.split()
+
+
+class FakeWidget(object):
+    def __init__(self, tk, children=None):
+        self.tk = tk
+        self.children = children or {}
+
+
+def test_call_passed_on():
+    app = FakeTkApp()
+    tracer = TclTracer(app)
+    assert tracer.call('.c', 'itemconfigure', 'a', '-fill', 'red') == \
+        'result'
+    assert app.calls == [('.c', 'itemconfigure', 'a', '-fill', 'red')]
+
+
+def test_tuple_call():
+    app = FakeTkApp()
+    tracer = TclTracer(app)
+    tracer.call(('.c', 'gettags', 'a'))
+    assert app.calls == [('.c', 'gettags', 'a')]
+    assert tracer.counts == {(None, '.c', 'gettags'): 1}
+
+
+def test_other_attributes_passed_on():
+    tracer = TclTracer(FakeTkApp())
+    assert tracer.splitlist('a b') == ['a', 'b']
+
+
+def test_grouping():
+    tracer = TclTracer(FakeTkApp())
+    tracer.call('.!frame.!canvas', 'itemconfigure', 'a')
+    tracer.call('.!frame.!canvas2', 'itemconfigure', 'b')
+    tracer.call('winfo', 'width', '.!frame')
+    tracer.call('after', 'idle', 'cmd')
+    tracer.call('set', 'x', '1')
+    tracer.globalsetvar('x', 1)
+
+    assert tracer.counts == {
+        (None, '.!frame.!canvas', 'itemconfigure'): 2,
+        (None, '', 'winfo width'): 1,
+        (None, '', 'after idle'): 1,
+        (None, '', 'set'): 1,
+        (None, '', 'globalsetvar'): 1,
+    }
+    assert tracer.total == 6
+
+
+def test_action_and_report():
+    tracer = TclTracer(FakeTkApp())
+    with tracer.action('click'):
+        tracer.call('.c', 'itemconfigure', 'a')
+        tracer.call('.c', 'itemconfigure', 'b')
+        tracer.call('.c', 'gettags', 'b')
+    tracer.call('.c', 'coords', 'a')
+
+    assert tracer.report(action='click') == [
+        (2, 'click', '.c', 'itemconfigure'),
+        (1, 'click', '.c', 'gettags')]
+    assert tracer.report(top=1) == [(2, 'click', '.c', 'itemconfigure')]
+    assert 'itemconfigure' in tracer.format_report()
+
+
+def test_log():
+    log = io.StringIO()
+    tracer = TclTracer(FakeTkApp(), log=log)
+    tracer.call('.c', 'delete', 'all')
+    assert log.getvalue() == '.c delete all\n'
+
+
+def test_trace_and_stop():
+    app = FakeTkApp()
+    child = FakeWidget(app)
+    root = FakeWidget(app, {'child': FakeWidget(app, {'c': child})})
+
+    tracer = trace(root)
+    assert root.tk is tracer
+    assert child.tk is tracer
+
+    child.tk.call('.child.c', 'create', 'line')
+    tracer.stop()
+
+    assert root.tk is app
+    assert child.tk is app
+    assert tracer.total == 1
+
+    tracer.call('.child.c', 'create', 'line')
+    assert tracer.total == 1
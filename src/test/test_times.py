@@ -0,0 +1,44 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import datetime
+
+import pytest
+
+from tks.times import TimeSlots
+
+
+def test_slots():
+    slots = TimeSlots(datetime.time(9, 0), datetime.time(17, 30), step=15,
+                      disabled=[datetime.time(12, 0)])
+    assert len(slots) == 34
+    assert datetime.time(9, 15) in slots
+    assert datetime.time(9, 10) not in slots
+    assert datetime.time(12, 0) not in slots
+    assert datetime.time(17, 45) not in slots
+    assert slots.hours == tuple(range(9, 18))
+    assert slots.minutes(12) == (15, 30, 45)
+    assert slots.minutes(17) == (0, 15, 30)
+    assert slots.minutes(3) == ()
+
+
+def test_nearest():
+    slots = TimeSlots(datetime.time(9, 0), datetime.time(17, 0), step=15)
+    assert slots.nearest(datetime.time(8, 0)) == datetime.time(9, 0)
+    assert slots.nearest(datetime.time(9, 7)) == datetime.time(9, 0)
+    assert slots.nearest(datetime.time(9, 8)) == datetime.time(9, 15)
+    assert slots.nearest(datetime.time(23, 0)) == datetime.time(17, 0)
+
+
+def test_step():
+    slots = TimeSlots(step=30)
+    assert slots.step(datetime.time(9, 0)) == datetime.time(9, 30)
+    assert slots.step(datetime.time(9, 10)) == datetime.time(9, 30)
+    assert slots.step(datetime.time(9, 10), -1) == datetime.time(9, 0)
+    assert slots.step(datetime.time(9, 0), -2) == datetime.time(8, 0)
+    assert slots.step(datetime.time(23, 30), 5) == datetime.time(23, 30)
+    assert slots.step(datetime.time(0, 0), -1) == datetime.time(0, 0)
+
+
+def test_no_slots():
+    with pytest.raises(ValueError):
+        TimeSlots(datetime.time(10, 0), datetime.time(9, 0))
@@ -0,0 +1,112 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+import datetime
+
+try:
+    import tkinter as tk
+except ImportError:
+    import Tkinter as tk
+
+import py.test
+
+from tks.value_grid import GridColumn, ValueGrid
+
+@py.test.fixture(scope="module")
+def root():
+    tk.NoDefaultRoot()
+    return tk.Tk()
+
+
+def create_grid(root, count):
+    columns = [GridColumn('Name'),
+               GridColumn('Date', 'date'),
+               GridColumn('Color', 'color')]
+    rows = [['Row %d' % idx, datetime.date(2018, 1, 1), (1.0, 0.0, 0.0)]
+            for idx in range(count)]
+    grid = ValueGrid(root, columns, rows, height=10, locale=None)
+    grid.pack()
+    root.update()
+    return grid
+
+
+def test_ValueGrid_widgets(root):
+    grid = create_grid(root, 10000)
+    assert grid.row_count == 10000
+    assert len(grid.winfo_children()) == 3
+    assert len(grid._canvas.find_all()) < 100
+
+
+def test_ValueGrid_scroll(root):
+    grid = create_grid(root, 1000)
+    grid.yview('moveto', 0.5)
+    assert grid.yview()[0] == 0.5
+
+    grid.selection = (999, 0)
+    assert grid.yview()[1] == 1.0
+
+
+def test_ValueGrid_values(root):
+    grid = create_grid(root, 5)
+    grid.set_value(2, 0, 'Changed')
+    assert grid.value(2, 0) == 'Changed'
+
+    grid.append_row(['New', datetime.date(2018, 2, 1), (0.0, 0.0, 1.0)])
+    assert grid.row_count == 6
+
+    grid.delete_row(0)
+    assert grid.row(0)[0] == 'Row 1'
+
+
+def test_ValueGrid_rgba(root):
+    grid = create_grid(root, 5)
+    grid.set_value(1, 2, (1.0, 0.0, 0.0, 0.5))
+    grid.yview('moveto', 0.0)
+    root.update()
+
+    assert grid.value(1, 2) == (1.0, 0.0, 0.0, 0.5)
+    assert grid._format('color', grid.value(1, 2)) == '#ff00007f'
+    assert grid._swatch_color((1.0, 0.0, 0.0, 1.0)) == '#ff0000'
+    assert len(grid._swatch_color((1.0, 0.0, 0.0, 0.5))) == 7
+
+
+def test_ValueGrid_edit(root):
+    changes = []
+    grid = create_grid(root, 5)
+    grid._command = lambda row, column, value: changes.append(value)
+
+    grid.edit(1, 0)
+    editor = grid._editors['text']
+    editor.value = 'Edited'
+    grid.finish_edit()
+    assert grid.value(1, 0) == 'Edited'
+    assert changes == ['Edited']
+
+    grid.edit(1, 0)
+    editor.value = 'Cancelled'
+    grid.finish_edit(save=False)
+    assert grid.value(1, 0) == 'Edited'
+
+
+def test_ValueGrid_edit_empty(root):
+    grid = create_grid(root, 5)
+    grid.set_value(1, 1, None)
+    root.update()
+
+    grid.edit(1, 1)
+    assert grid._editors['date'].value == datetime.date.today()
+    grid.finish_edit()
+    assert grid.value(1, 1) == datetime.date.today()
+
+
+def test_ValueGrid_config_changed(root):
+    grid = create_grid(root, 5)
+    root.update()
+
+    grid._colors.select = 'red'
+    grid._colors.header = 'blue'
+    grid._config_changed(None)
+    root.update()
+
+    assert grid._canvas.itemcget(grid._select_rect, 'fill') == 'red'
+    assert grid._header['background'] == 'blue'
+    assert grid.value(1, 0) == 'Row 1'
@@ -42,6 +42,27 @@ def test_ColorVar_gt1(root):
     assert v.get() == (1.0, 1.0, 1.0)
 
 
+def test_ColorVar_alpha(root):
+    v = ColorVar(master=root, value=(1.0, 0.0, 0.0, 0.5))
+    assert v.get() == (1.0, 0.0, 0.0, 0.5)
+    assert v.alpha == 0.5
+
+    # Setting an RGB color keeps the alpha
+    v.set((0.0, 1.0, 0.0))
+    assert v.get() == (0.0, 1.0, 0.0, 0.5)
+
+    v = ColorVar(master=root)
+    assert v.alpha == 1.0
+
+
+def test_ColorVar_set_before_tcl_variable(root):
+    # Python 2 sets the value before the Tcl variable is created
+    v = ColorVar(master=root, name='C_var')
+    root.globalunsetvar('C_var')
+    v.set((0.0, 1.0, 0.0))
+    assert v.get() == (0.0, 1.0, 0.0)
+
+
 def test_DateVar_init(root):
     _v = DateVar(master=root)
 
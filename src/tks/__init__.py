@@ -7,17 +7,28 @@ __author__ = 'Simon Kennedy <sffjunkie+code@gmail.com>'
 
 import re
 import sys
-import pickle
-
-if sys.version_info >= (3, 0):
-    from base64 import encodebytes, decodebytes
-    import tkinter as tk
-else:
-    from base64 import (encodestring as encodebytes,
-                        decodestring as decodebytes)
-    import Tkinter as tk
-
-from tks.rc import rcfile, configparser
+import importlib
+
+from tks.rc import rcfile, get_rcfile, configparser
+from tks.instrument import stats
+
+# Sub modules and names which are only imported when first accessed so that
+# tools which only need e.g. `tks.color_funcs` or `tks.rc` do not import
+# Tkinter, PIL or babel. This needs Python 3.7 or later; see the end of the
+# module for earlier versions.
+_SUBMODULES = ('animate', 'basic', 'chunked', 'color_funcs',
+               'color_palette', 'color_plane', 'color_slider',
+               'color_square', 'color_tints_and_shades', 'color_wheel',
+               'colors', 'dates', 'dial_geometry', 'dialog', 'dnd', 'fs',
+               'i18n', 'icon', 'instrument', 'locales', 'masked_entry',
+               'matrix', 'passwords', 'prewarming', 'rc_watch', 'rendering',
+               'repeat', 'stats_window', 'styles', 'swatches', 'tcl_trace',
+               'times', 'tooltip', 'value_grid', 'vars')
+
+_LAZY_NAMES = {
+    'PickleVar': 'tks.vars',
+    'prewarm': 'tks.prewarming',
+}
 
 class DefaultColors(object):
     """A container for color names."""
@@ -28,6 +39,7 @@ class DefaultColors(object):
     header = 'white'
     outline = '#ccc'
     invalid = 'red'
+    disabled = '#aaa'
 
 
 class DefaultFonts(object):
@@ -38,59 +50,74 @@ class DefaultFonts(object):
 
 
 def load_colors():
-    """Load color definitions from the `.tksrc` file"""
-
-    colors = DefaultColors()
-    try:
-        rc = rcfile()
-        rc.read()
+    """Load color definitions from the `.tksrc` file.
 
-        try:
-            header_color = rc['color.header']
-            if header_color != '':
-                colors.header = header_color
-        except configparser.Error:
-            pass
+    A new :class:`DefaultColors` is returned each time but the file is only
+    parsed again when it changes.
+    """
 
-        try:
-            select_color = rc['color.select']
-            if select_color != '':
-                colors.select = select_color
-        except configparser.Error:
-            pass
-    except:
-        pass
+    colors = DefaultColors()
+    for name, value in _rc_settings()[0].items():
+        setattr(colors, name, value)
 
     return colors
 
 
 def load_fonts():
-    """Load font definitions from the `.tksrc` file"""
+    """Load font definitions from the `.tksrc` file.
 
-    def _parse_font(font_def):
-        elems = [i.strip() for i in font_def.split(',')][:3]
-        return tuple([elem for elem in elems if elem])
+    A new :class:`DefaultFonts` is returned each time but the file is only
+    parsed again when it changes.
+    """
 
     fonts = DefaultFonts()
+    for name, value in _rc_settings()[1].items():
+        setattr(fonts, name, value)
+
+    return fonts
+
+
+_settings_cache = (None, ({}, {}))
+
+
+def _rc_settings(filename=None):
+    """Return dictionaries of the colors and fonts set in the `.tksrc` file,
+    extracting them again only when the file has been read again."""
+
+    global _settings_cache
+
     try:
-        rc = rcfile()
-        rc.read()
+        rc = get_rcfile(filename)
+    except Exception:
+        return {}, {}
+
+    cached_rc, settings = _settings_cache
+    if rc is cached_rc:
+        return settings
 
+    def _parse_font(font_def):
+        elems = [i.strip() for i in font_def.split(',')][:3]
+        return tuple([elem for elem in elems if elem])
+
+    colors = {}
+    for name in ('header', 'select'):
         try:
-            font_def = rc['font.text']
-            fonts.text = _parse_font(font_def)
+            color = rc['color.%s' % name]
+            if color != '':
+                colors[name] = color
         except configparser.Error:
             pass
 
+    fonts = {}
+    for name in ('text', 'monospace'):
         try:
-            font_def = rc['font.monospace']
-            fonts.monospace = _parse_font(font_def)
+            fonts[name] = _parse_font(rc['font.%s' % name])
         except configparser.Error:
             pass
-    except:
-        pass
 
-    return fonts
+    settings = (colors, fonts)
+    _settings_cache = (rc, settings)
+    return settings
 
 
 def parse_geometry(geom):
@@ -123,34 +150,28 @@ def rect_at(point, size, size_y=-1):
             point[0] + size, point[1] + size_y)
 
 
-class PickleVar(tk.Variable, object):
-    """A Tkinter variable which stores values as pickled objects."""
+def __getattr__(name):
+    """Import sub modules and :class:`PickleVar` when they are first used."""
 
-    def __init__(self, master=None, value=None, name=None):
-        # Python 3 Tkinter does not call our set method so we'll need to
-        # pickle the value now
-        if value and sys.version_info >= (3, 0):
-            value = self.__transform_value(value)
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module('tks.%s' % name)
+    else:
+        raise AttributeError("module 'tks' has no attribute '%s'" % name)
 
-        super(PickleVar, self).__init__(master, value, name)
+    globals()[name] = value
+    return value
 
-    def get(self):
-        value = super(PickleVar, self).get()
-        if value and not isinstance(value, bytes) and sys.version_info >= (3, 0):
-            value = bytes(value, encoding='ASCII')
 
-        value = decodebytes(value)
-        return pickle.loads(value)
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_LAZY_NAMES))
 
-    def set(self, value):
-        value = self.__transform_value(value)
-        return tk.Variable.set(self, value)
 
-    @staticmethod
-    def __transform_value(value):
-        """We need to base64 encode/decode the pickled objects as Tkinter tries
-        to convert the value to a string and fails with a UnicodeDecodeError
-        """
-        value = pickle.dumps(value)
-        value = encodebytes(value)
-        return value
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported from Python 3.7 so earlier
+    # versions import these names now, which imports Tkinter, as the widget
+    # modules subclass `tks.PickleVar`. Sub modules must be imported before
+    # they are used e.g. `import tks.colors`.
+    from tks.vars import PickleVar
+    from tks.prewarming import prewarm
@@ -0,0 +1,100 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""A frame scheduler for simple canvas animations.
+
+All running animations for a Tk interpreter are advanced by a single `after`
+callback. Animations are driven by elapsed time rather than by counting frames
+so if the event loop is busy the frames which could not be drawn in time are
+dropped instead of being queued up and drawn late.
+
+:func:`get_frame_scheduler`
+    Returns the :class:`FrameScheduler` shared by all widgets in an
+    interpreter.
+"""
+
+from __future__ import print_function, division, absolute_import
+import time
+
+__all__ = ['FrameScheduler', 'get_frame_scheduler']
+
+FRAME_INTERVAL = 16
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class FrameScheduler(object):
+    """Calls animation step functions once per frame.
+
+    :param widget: The widget used to schedule the `after` callbacks.
+    :param interval: The number of milliseconds between frames.
+    :type interval:  int
+    """
+
+    def __init__(self, widget, interval=FRAME_INTERVAL):
+        self._widget = widget
+        self._interval = interval
+        self._animations = {}
+        self._after_id = None
+
+    def animate(self, key, step, duration):
+        """Start an animation.
+
+        If an animation with the same key is already running it is replaced.
+
+        :param key: A hashable value identifying the animation
+        :param step: A function which is passed the fraction of the animation
+                     which has elapsed, from 0.0 to 1.0. It is always called
+                     with 1.0 when the animation ends.
+        :param duration: The length of the animation in milliseconds
+        :type duration:  int
+        """
+
+        self._animations[key] = (step, _clock(), duration / 1000)
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._interval, self._frame)
+
+    def cancel(self, key):
+        """Stop an animation without calling its step function again."""
+
+        self._animations.pop(key, None)
+        if not self._animations and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def running(self, key):
+        """Return True if an animation with the key is running."""
+
+        return key in self._animations
+
+    def _frame(self):
+        self._after_id = None
+        now = _clock()
+
+        for key, (step, start, duration) in list(self._animations.items()):
+            if duration > 0:
+                fraction = min(1.0, (now - start) / duration)
+            else:
+                fraction = 1.0
+
+            if fraction >= 1.0:
+                del self._animations[key]
+
+            step(fraction)
+
+        # The next frame is only requested once this one has been drawn so
+        # frames never pile up behind a busy event loop.
+        if self._animations:
+            self._after_id = self._widget.after(self._interval, self._frame)
+
+
+def get_frame_scheduler(widget):
+    """Return the :class:`FrameScheduler` for the interpreter which `widget`
+    belongs to, creating it the first time it is requested."""
+
+    root = widget._root()
+    try:
+        return root._tks_frame_scheduler
+    except AttributeError:
+        scheduler = FrameScheduler(root)
+        root._tks_frame_scheduler = scheduler
+        return scheduler
@@ -0,0 +1,149 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""A cooperative scheduler for building large canvases in chunks.
+
+A builder is a generator which yields after each chunk of work. The
+scheduler runs chunks from `after` callbacks until a time budget is used up
+and then returns to the event loop so that the interface stays responsive
+while a large palette or image is built. ::
+
+    scheduler = get_chunk_scheduler(widget)
+    scheduler.run((widget, 'palette'), widget._build_palette(),
+                  done=widget._palette_built)
+
+Starting a task with the same key as a running task cancels the old one so
+that, for example, switching palettes quickly only builds the last one.
+
+:func:`get_chunk_scheduler`
+    Returns the :class:`ChunkScheduler` shared by all widgets in an
+    interpreter.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+import time
+from collections import OrderedDict
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+else:
+    import Tkinter as tk
+
+__all__ = ['ChunkScheduler', 'get_chunk_scheduler']
+
+CHUNK_BUDGET = 10
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_FINISHED = object()
+
+
+class ChunkScheduler(object):
+    """Runs generators a chunk at a time from `after` callbacks.
+
+    :param widget: The widget used to schedule the callbacks
+    :param budget: The number of milliseconds of chunks to run per callback
+    :type budget:  int
+    :param idle: If True the chunks are run from `after_idle` callbacks so
+                 that they only run when the application is idle
+    :type idle:  bool
+    """
+
+    def __init__(self, widget, budget=CHUNK_BUDGET, idle=False):
+        self._widget = widget
+        self._budget = budget / 1000
+        self._idle = idle
+        self._tasks = OrderedDict()
+        self._after_id = None
+
+    def run(self, key, chunks, done=None):
+        """Start a task, cancelling any running task with the same key.
+
+        :param key: A hashable value identifying the task
+        :param chunks: An iterable which does a chunk of work per item
+        :param done: An optional function called when the task finishes
+        """
+
+        self.cancel(key)
+        self._tasks[key] = (iter(chunks), done)
+        if self._after_id is None:
+            if self._idle:
+                self._after_id = self._widget.after_idle(self._run)
+            else:
+                self._after_id = self._widget.after(1, self._run)
+
+    def cancel(self, key):
+        """Stop a task without finishing it."""
+
+        self._tasks.pop(key, None)
+        if not self._tasks and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def finish(self, key):
+        """Run the rest of a task now."""
+
+        try:
+            chunks, done = self._tasks.pop(key)
+        except KeyError:
+            return
+
+        for _ in chunks:
+            pass
+
+        if done:
+            done()
+
+    def running(self, key):
+        """Return True if a task with the key is running."""
+
+        return key in self._tasks
+
+    def _run(self):
+        self._after_id = None
+        end = _clock() + self._budget
+
+        # Tasks take turns so a large task does not hold up a small one.
+        # At least one chunk is run per callback.
+        while self._tasks:
+            for key in list(self._tasks):
+                if key not in self._tasks:
+                    continue
+
+                chunks, done = self._tasks[key]
+                try:
+                    if next(chunks, _FINISHED) is _FINISHED:
+                        del self._tasks[key]
+                        if done:
+                            done()
+                except tk.TclError:
+                    # The widget was destroyed before it was built
+                    self._tasks.pop(key, None)
+
+            if _clock() >= end:
+                break
+
+        if self._tasks and self._after_id is None:
+            if self._idle:
+                # Wait for the event loop to process pending events before
+                # the next chunk. Idle callbacks added by an idle callback
+                # would otherwise run in the same pass.
+                self._after_id = self._widget.after(1, self._idle_again)
+            else:
+                self._after_id = self._widget.after(1, self._run)
+
+    def _idle_again(self):
+        self._after_id = self._widget.after_idle(self._run)
+
+
+def get_chunk_scheduler(widget):
+    """Return the :class:`ChunkScheduler` for the interpreter which `widget`
+    belongs to, creating it the first time it is requested."""
+
+    root = widget._root()
+    try:
+        return root._tks_chunk_scheduler
+    except AttributeError:
+        scheduler = ChunkScheduler(root)
+        root._tks_chunk_scheduler = scheduler
+        return scheduler
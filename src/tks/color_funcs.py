@@ -1,9 +1,21 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
-"""Various functions to manipulate RGB hex, RGB, HSV and HLS colors."""
+"""Various functions to manipulate RGB hex, RGB, HSV and HLS colors.
+
+Colors are tuples of floats between 0.0 and 1.0. A fourth element, if
+present, is the alpha of the color where 0.0 is transparent and 1.0 opaque.
+The functions which produce strings keep the alpha e.g. `#rrggbbaa` or
+`rgba(...)` and the functions which parse strings accept it.
+
+The perceptual color spaces OKLab and CIELAB (D65) are also supported. The
+sRGB channels are linearized with a table of the 256 8 bit values, so the
+colors are treated as 8 bit colors, and the OKLab values of recently used
+colors are cached.
+"""
 
 from __future__ import (print_function, division, absolute_import,
                         unicode_literals)
+import math
 import string
 import colorsys
 
@@ -24,12 +36,13 @@ def contrast_color(rgb):
 
 
 def rgb_to_hex_string(value):
-    """Convert from an (R, G, B) tuple to a hex color.
+    """Convert from an (R, G, B) or (R, G, B, A) tuple to a hex color of the
+    form `#rrggbb` or `#rrggbbaa`.
 
     :param value: The RGB value to convert
     :type value:  tuple
 
-    R, G and B should be in the range 0.0 - 1.0
+    R, G, B and A should be in the range 0.0 - 1.0
     """
     color = ''.join(['%02x' % x1 for x1 in [int(x * 255) for x in value]])
     return '#%s' % color
@@ -46,7 +59,8 @@ def rgb_to_rgb_string(value, dp=3):
     R, G and B should be in the range 0.0 - 1.0
     """
     format_str = '%%.0%df' % dp
-    value = 'rgb(%s)' % (','.join([format_str % x for x in value]))
+    value = '%s(%s)' % ('rgba' if len(value) > 3 else 'rgb',
+                        ','.join([format_str % x for x in value]))
     return value
 
 
@@ -60,9 +74,10 @@ def rgb_to_hsv_string(value, dp=3):
 
     R, G and B should be in the range 0.0 - 1.0
     """
-    hsv = colorsys.rgb_to_hsv(*value)
+    hsv = colorsys.rgb_to_hsv(*value[:3]) + tuple(value[3:])
     format_str = '%%.0%df' % dp
-    hsv = 'hsv(%s)' % (','.join([format_str % x for x in hsv]))
+    hsv = '%s(%s)' % ('hsva' if len(hsv) > 3 else 'hsv',
+                      ','.join([format_str % x for x in hsv]))
     return hsv
 
 
@@ -76,15 +91,16 @@ def rgb_to_hls_string(value, dp=3):
 
     R, G and B should be in the range 0.0 - 1.0
     """
-    hls = colorsys.rgb_to_hls(*value)
+    hls = colorsys.rgb_to_hls(*value[:3]) + tuple(value[3:])
     format_str = '%%.0%df' % dp
-    hls = 'hls(%s)' % (','.join([format_str % x for x in hls]))
+    hls = '%s(%s)' % ('hlsa' if len(hls) > 3 else 'hls',
+                      ','.join([format_str % x for x in hls]))
     return hls
 
 
 def hex_string_to_rgb(value, allow_short=True):
     """Convert from a hex color string of the form `#abc` or `#abcdef` to an
-    RGB tuple.
+    RGB tuple, or from `#abcd` or `#abcdef12` to an RGBA tuple.
 
     :param value: The value to convert
     :type value: str
@@ -99,7 +115,7 @@ def hex_string_to_rgb(value, allow_short=True):
         if ch not in string.hexdigits:
             return None
 
-    if len(value) == 7:
+    if len(value) in (7, 9):
         # The following to_iterable function is based on the
         # :func:`grouper` function in the Python standard library docs
         # http://docs.python.org/library/itertools.html
@@ -107,7 +123,7 @@ def hex_string_to_rgb(value, allow_short=True):
              # pylint: disable=missing-docstring
             args = [iter(value[1:])] * 2
             return tuple([int('%s%s' % t, 16) / 255 for t in zip(*args)])
-    elif len(value) == 4 and allow_short:
+    elif len(value) in (4, 5) and allow_short:
         def to_iterable():
             # pylint: disable=missing-docstring
             return tuple([int('%s%s' % (t, t), 16) / 255 for t in value[1:]])
@@ -120,6 +136,57 @@ def hex_string_to_rgb(value, allow_short=True):
         return None
 
 
+def rgb_to_hex_strings(values):
+    """Convert a sequence of RGB or RGBA tuples to hex colors. Gives the
+    same results as :func:`rgb_to_hex_string` but is faster for many colors.
+    """
+
+    table = _HEX_TABLE
+    return ['#' + ''.join([table[int(x * 255)] for x in value])
+            for value in values]
+
+
+def hex_strings_to_rgb(values):
+    """Convert a sequence of `#rrggbb` or `#rrggbbaa` strings to RGB or RGBA
+    tuples. Values which are not in either form are returned as None.
+    """
+
+    table = _HEX_VALUES
+    colors = []
+    for value in values:
+        try:
+            if value[0] != '#' or len(value) not in (7, 9):
+                raise KeyError
+            colors.append(tuple([table[value[idx:idx + 2]]
+                                 for idx in range(1, len(value), 2)]))
+        except (KeyError, IndexError):
+            colors.append(None)
+
+    return colors
+
+
+_HEX_TABLE = ['%02x' % x for x in range(256)]
+_HEX_VALUES = {}
+for _value in range(256):
+    for _text in set(['%02x' % _value, '%02X' % _value,
+                      '%x%X' % (_value // 16, _value % 16),
+                      '%X%x' % (_value // 16, _value % 16)]):
+        _HEX_VALUES[_text] = _value / 255
+del _value, _text
+
+
+def composite(rgba, background):
+    """Return the RGB color seen when an RGBA color is drawn over an opaque
+    RGB background. RGB colors are returned unchanged."""
+
+    if len(rgba) < 4:
+        return tuple(rgba)
+
+    alpha = rgba[3]
+    return tuple([c * alpha + b * (1.0 - alpha)
+                  for c, b in zip(rgba[:3], background)])
+
+
 def clamp(value):
     """Clamp a float between 0.0 and 1.0"""
 
@@ -137,21 +204,22 @@ def luminosity_transform(color, luminosity=0.05):
 
     If luminosity is a tuple then the 3 elements are used to transform the red,
     green and blue values individually. If a float then the same value is used
-    to transform all 3 elements."""
+    to transform all 3 elements. The alpha of an RGBA color is unchanged."""
 
     if isinstance(luminosity, tuple):
         luminosity = luminosity[:3]
     else:
         luminosity = (luminosity, luminosity, luminosity)
 
-    return tuple([clamp(e + l) for e, l in zip(color, luminosity)])
+    return tuple([clamp(e + l) for e, l in zip(color, luminosity)]) + \
+        tuple(color[3:])
 
 
 def color_string_to_tuple(value):
     """Convert a color string to a tuple of floats."""
 
     try:
-        return clamped_tuple(value[4:-1].split(','))
+        return clamped_tuple(value[value.index('(') + 1:-1].split(','))
     except:
         return None
 
@@ -167,7 +235,8 @@ def color_string_to_color(value, allow_short_hex=True):
             if rgb:
                 return color_format, rgb
         else:
-            if value[:4] in ['rgb(', 'hsv(', 'hls(']:
+            prefix = value[:value.find('(') + 1]
+            if prefix in ['rgb(', 'hsv(', 'hls(', 'rgba(', 'hsva(', 'hlsa(']:
                 color_format = value[:3]
                 if value[-1] == ')':
                     t = color_string_to_tuple(value)
@@ -191,12 +260,12 @@ def color_string_to_rgb(value):
         if color_info[0] == 'rgbhex' or color_info[0] == 'rgb':
             return color_info[1]
         elif color_info[0] == 'hsv':
-            return colorsys.hsv_to_rgb(*color_info[1])
+            return colorsys.hsv_to_rgb(*color_info[1][:3]) + color_info[1][3:]
         elif color_info[0] == 'hls':
-            return colorsys.hls_to_rgb(*color_info[1])
+            return colorsys.hls_to_rgb(*color_info[1][:3]) + color_info[1][3:]
 
 
-def rgb_tints(rgb, base_percent, count, linear=True):
+def rgb_tints(rgb, base_percent, count, linear=True, perceptual=False):
     """Produce a list of tints from the base color
 
     :param rgb: The RGB value for which to calculate the tints
@@ -205,13 +274,17 @@ def rgb_tints(rgb, base_percent, count, linear=True):
     :type base_percent:  float
     :param count: The number of tints to return
     :type count: int
+    :param perceptual: If True the tints are evenly spaced in OKLab
+                       lightness instead of adding to each RGB element
+    :type perceptual:  bool
     """
+    tint = perceptual_tint if perceptual else rgb_tint
     factor = base_percent
     tints = []
     number_to_calc = (2 * count) - 1
     for dummy in range(number_to_calc):
         if factor < 100:
-            tints.append(rgb_tint(rgb, factor))
+            tints.append(tint(rgb, factor))
         else:
             tints.append(None)
 
@@ -253,7 +326,7 @@ def rgb_tint(rgb, percent=5):
     return luminosity_transform(rgb, percent / 100)
 
 
-def rgb_shades(rgb, base_percent, count, linear=True):
+def rgb_shades(rgb, base_percent, count, linear=True, perceptual=False):
     """Produce a list of shades from the base color
 
     :param rgb: The RGB value for which to calculate the shades
@@ -262,13 +335,17 @@ def rgb_shades(rgb, base_percent, count, linear=True):
     :type base_percent:  float
     :param count: The number of shades to return
     :type count:  int
+    :param perceptual: If True the shades are evenly spaced in OKLab
+                       lightness instead of subtracting from each RGB element
+    :type perceptual:  bool
     """
+    shade = perceptual_shade if perceptual else rgb_shade
     factor = base_percent
     shades = []
     number_to_calc = (2 * count) - 1
     for dummy in range(number_to_calc):
         if factor < 100:
-            shades.append(rgb_shade(rgb, factor))
+            shades.append(shade(rgb, factor))
         else:
             shades.append(None)
 
@@ -306,3 +383,175 @@ def rgb_shade(rgb, percent=5):
     :type percent:  int
     """
     return luminosity_transform(rgb, -percent / 100)
+
+
+def perceptual_tint(rgb, percent=5):
+    """Create a tint of the RGB color by increasing its OKLab lightness
+
+    :param rgb: The RGB value for which to calculate the tint
+    :type rgb:  tuple
+    :param percent: The percentage of the lightness range to add
+    :type percent:  int
+    """
+    return _change_lightness(rgb, percent / 100)
+
+
+def perceptual_shade(rgb, percent=5):
+    """Create a shade of the RGB color by decreasing its OKLab lightness
+
+    :param rgb: The RGB value for which to calculate the shade
+    :type rgb:  tuple
+    :param percent: The percentage of the lightness range to subtract
+    :type percent:  int
+    """
+    return _change_lightness(rgb, -percent / 100)
+
+
+def _change_lightness(rgb, amount):
+    lightness, a, b = rgb_to_oklab(rgb)
+    lightness = clamp(lightness + amount)
+    return oklab_to_rgb((lightness, a, b)) + tuple(rgb[3:])
+
+
+def srgb_to_linear(value):
+    """Convert an sRGB element between 0.0 and 1.0 to linear light. The
+    value is rounded to 8 bits."""
+
+    return _SRGB_TO_LINEAR[int(clamp(value) * 255 + 0.5)]
+
+
+def linear_to_srgb(value):
+    """Convert a linear light value to an sRGB element between 0.0 and
+    1.0"""
+
+    value = clamp(value)
+    if value <= 0.0031308:
+        return value * 12.92
+    else:
+        return 1.055 * math.pow(value, 1 / 2.4) - 0.055
+
+
+def rgb_to_oklab(rgb):
+    """Convert an RGB color to an OKLab (L, a, b) tuple where L is between
+    0.0 and 1.0"""
+
+    key = tuple([int(clamp(c) * 255 + 0.5) for c in rgb[:3]])
+    try:
+        return _oklab_cache[key]
+    except KeyError:
+        pass
+
+    r, g, b = [_SRGB_TO_LINEAR[c] for c in key]
+
+    l = 0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b
+    m = 0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b
+    s = 0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b
+
+    l, m, s = _cbrt(l), _cbrt(m), _cbrt(s)
+
+    lab = (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+           1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+           0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+
+    if len(_oklab_cache) >= OKLAB_CACHE_SIZE:
+        _oklab_cache.clear()
+    _oklab_cache[key] = lab
+    return lab
+
+
+def oklab_to_rgb(lab):
+    """Convert an OKLab (L, a, b) tuple to an RGB color. Colors outside the
+    sRGB gamut are clipped."""
+
+    lightness, a, b = lab
+
+    l = lightness + 0.3963377774 * a + 0.2158037573 * b
+    m = lightness - 0.1055613458 * a - 0.0638541728 * b
+    s = lightness - 0.0894841775 * a - 1.2914855480 * b
+
+    l, m, s = l * l * l, m * m * m, s * s * s
+
+    linear = (4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+              -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+              -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s)
+
+    return tuple([linear_to_srgb(c) for c in linear])
+
+
+def rgb_to_lab(rgb):
+    """Convert an RGB color to a CIELAB (L*, a*, b*) tuple using the D65
+    white point. L* is between 0.0 and 100.0"""
+
+    r, g, b = [srgb_to_linear(c) for c in rgb[:3]]
+
+    x = (0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / _D65[0]
+    y = (0.2126729 * r + 0.7151522 * g + 0.0721750 * b) / _D65[1]
+    z = (0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / _D65[2]
+
+    fx, fy, fz = _lab_f(x), _lab_f(y), _lab_f(z)
+    return (116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz))
+
+
+def lab_to_rgb(lab):
+    """Convert a CIELAB (L*, a*, b*) tuple to an RGB color. Colors outside
+    the sRGB gamut are clipped."""
+
+    lightness, a, b = lab
+    fy = (lightness + 16.0) / 116.0
+    fx = fy + a / 500.0
+    fz = fy - b / 200.0
+
+    x = _lab_f_inverse(fx) * _D65[0]
+    y = _lab_f_inverse(fy) * _D65[1]
+    z = _lab_f_inverse(fz) * _D65[2]
+
+    linear = (3.2404542 * x - 1.5371385 * y - 0.4985314 * z,
+              -0.9692660 * x + 1.8760108 * y + 0.0415560 * z,
+              0.0556434 * x - 0.2040259 * y + 1.0572252 * z)
+
+    return tuple([linear_to_srgb(c) for c in linear])
+
+
+def color_distance(rgb1, rgb2):
+    """Return the perceptual distance between two RGB colors, the
+    Euclidean distance between their OKLab values."""
+
+    l1, a1, b1 = rgb_to_oklab(rgb1)
+    l2, a2, b2 = rgb_to_oklab(rgb2)
+    return math.sqrt((l1 - l2) * (l1 - l2) + (a1 - a2) * (a1 - a2) +
+                     (b1 - b2) * (b1 - b2))
+
+
+def _srgb_to_linear(value):
+    if value <= 0.04045:
+        return value / 12.92
+    else:
+        return math.pow((value + 0.055) / 1.055, 2.4)
+
+
+def _cbrt(value):
+    return math.copysign(math.pow(abs(value), 1 / 3), value)
+
+
+def _lab_f(t):
+    if t > _LAB_EPSILON:
+        return math.pow(t, 1 / 3)
+    else:
+        return t / (3 * _LAB_DELTA * _LAB_DELTA) + 4 / 29
+
+
+def _lab_f_inverse(t):
+    if t > _LAB_DELTA:
+        return t * t * t
+    else:
+        return 3 * _LAB_DELTA * _LAB_DELTA * (t - 4 / 29)
+
+
+_SRGB_TO_LINEAR = [_srgb_to_linear(c / 255) for c in range(256)]
+
+OKLAB_CACHE_SIZE = 4096
+_oklab_cache = {}
+
+_D65 = (0.95047, 1.0, 1.08883)
+_LAB_DELTA = 6 / 29
+_LAB_EPSILON = _LAB_DELTA ** 3
@@ -14,18 +14,22 @@ from pkgutil import get_data
 if sys.version_info >= (3, 0):
     import tkinter as tk
     from tkinter import ttk
-    from tkinter import font as tkf
 else:
     import Tkinter as tk
     import ttk
-    import tkFont as tkf
 
 import tks.colors
 import tks.color_funcs
+from tks.instrument import timed
+from tks.styles import get_font
+from tks.chunked import get_chunk_scheduler
 
 from .i18n import language
 _ = language.gettext
 
+# The number of colors drawn before returning to the event loop
+PALETTE_CHUNK = 50
+
 
 def hsv_key_func(key):
     """Key function to sort by the HSV value for a color"""
@@ -45,6 +49,13 @@ def yiq_key_func(key):
     return colorsys.rgb_to_yiq(*key[0])
 
 
+def oklab_key_func(key):
+    """Key function to sort by the OKLab value for a color, which orders
+    the colors by perceived lightness"""
+
+    return tks.color_funcs.rgb_to_oklab(key[0])
+
+
 def intensity_key_func(key):
     """Key function to sort by intensity"""
 
@@ -111,7 +122,8 @@ class PaletteSelector(ttk.Frame, object):
         self._sort_order_var.set(self._sort_order)
 
         col = 3
-        for idx, order in enumerate(['HSV', 'HLS', 'RGB', 'YIQ', 'Name']):
+        for idx, order in enumerate(['HSV', 'HLS', 'RGB', 'YIQ', 'OKLab',
+                                     'Name']):
             btn = ttk.Radiobutton(header_frame, text=order,
                                   variable=self._sort_order_var, value=order,
                                   command=self._change_sort)
@@ -119,7 +131,7 @@ class PaletteSelector(ttk.Frame, object):
 
         header_frame.grid(row=0, column=0, sticky=(tk.N, tk.EW), columnspan=2)
 
-        f = tkf.Font(font=('TkDefaultFont',))
+        f = get_font(self, ('TkDefaultFont',))
         max_name_len = 0
         for color_db in self._color_databases.values():
             max_name_len = max(max_name_len,
@@ -169,17 +181,45 @@ class PaletteSelector(ttk.Frame, object):
         if variable is None:
             self._select_entry('rct001')
 
+    @timed('PaletteSelector._change_palette')
     def _change_palette(self, event=None, init=False):
-        """Change to another color database"""
+        """Change to another color database.
+
+        The colors are drawn in chunks so that the interface stays responsive
+        while a large palette is drawn. When the widget is created they are
+        drawn immediately.
+        """
 
         db_name = self._current_palette_var.get()
         self._current_palette = self._color_databases[db_name]
 
+        self._canvas.delete('color')
+
+        color_count = len(self._current_palette)
+        self._canvas_height = self._color_height * \
+                              math.ceil(color_count / self._column_count)
+        scrollregion = (0, 0, self._canvas_width,
+                        self._canvas_height)
+        self._canvas.config(scrollregion=scrollregion)
+        self._canvas.yview_moveto(0.0)
+
+        self._selected_rct_tag = ''
+
+        sorted_items = sorted(self._current_palette.items(), key=self._key_func)
+        scheduler = get_chunk_scheduler(self)
+        key = (self, 'palette')
+        scheduler.run(key, self._draw_colors(sorted_items),
+                      done=None if init else self._palette_drawn)
+        if init:
+            scheduler.finish(key)
+
+    def _draw_colors(self, sorted_items):
+        """Draw the colors yielding after every :data:`PALETTE_CHUNK`
+        colors."""
+
         row = 0
         col = 0
 
-        self._canvas.delete('color')
-        sorted_items = sorted(self._current_palette.items(), key=self._key_func)
         for idx, (key, color_info) in enumerate(sorted_items):
             rect = (col * self._color_width + 1,
                     row * self._color_height + 1,
@@ -214,21 +254,13 @@ class PaletteSelector(ttk.Frame, object):
                 row += 1
                 col = 0
 
-        self._canvas.update_idletasks()
-
-        color_count = len(self._current_palette)
-        self._canvas_height = self._color_height * \
-                              math.ceil(color_count / self._column_count)
-        scrollregion = (0, 0, self._canvas_width,
-                        self._canvas_height)
-        self._canvas.config(scrollregion=scrollregion)
-
-        self._selected_rct_tag = ''
+            if idx % PALETTE_CHUNK == PALETTE_CHUNK - 1:
+                yield
 
-        if not init:
-            self._select_entry('rct001')
-            self._canvas.yview_moveto(0.0)
+    def _palette_drawn(self):
+        self._select_entry('rct001')
 
+    @timed('PaletteSelector._change_sort')
     def _change_sort(self, event=None):
         """Change the color sort order"""
 
@@ -244,9 +276,18 @@ class PaletteSelector(ttk.Frame, object):
             self._key_func = intensity_key_func
         elif new_order == 'YIQ':
             self._key_func = yiq_key_func
+        elif new_order == 'OKLab':
+            self._key_func = oklab_key_func
         elif new_order == 'Name':
             self._key_func = name_key_func
 
+        if get_chunk_scheduler(self).running((self, 'palette')):
+            # The palette is still being drawn so draw it again in the new
+            # order
+            self._sort_order = new_order
+            self._change_palette()
+            return
+
         palette_name = self._current_palette_var.get()
         palette = self._color_databases[palette_name]
         for idx, (key, color_info) in enumerate(sorted(palette.items(),
@@ -347,7 +388,7 @@ class PaletteSelector(ttk.Frame, object):
 
         tag = 'rct%s' % value[3:]
         old_tag = self._selected_rct_tag
-        if tag != old_tag:
+        if tag != old_tag and self._canvas.find_withtag(tag):
             if old_tag:
                 old_rct_color = self._canvas.itemcget(old_tag, 'fill')
                 self._canvas.itemconfigure(old_tag, outline=old_rct_color)
@@ -387,17 +428,16 @@ class Palette(dict):
         return dict.__setitem__(self, key, value)
 
     def find_closest(self, rgb):
-        """Find a color in the database which is the closest match"""
+        """Find the color in the database which is perceptually closest,
+        using the distance between colors in OKLab"""
 
         closest_color = None
-        closest_distance = math.pow(10, 6)
+        closest_distance = None
         for key in self:
-            distance2 = math.pow((rgb[0] - key[0]) * 255 * 0.3, 2) + \
-                math.pow((rgb[1] - key[1]) * 255 * 0.59, 2) + \
-                math.pow((rgb[2] - key[2]) * 255 * 0.11, 2)
-
-            if distance2 < closest_distance:
+            distance = tks.color_funcs.color_distance(rgb, key)
+            if closest_distance is None or distance < closest_distance:
                 closest_color = key
+                closest_distance = distance
 
         return closest_color
 
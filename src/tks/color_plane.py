@@ -0,0 +1,252 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Implements a color picker with a square plane to select the saturation
+and value and a vertical bar to select the hue.
+
+The plane is drawn one row at a time. Every row is the top row with each
+byte scaled by the row's value, which `bytes.translate` does with a table
+lookup, so the pixel calculation in Python is proportional to the width
+plus the height of the plane rather than its area. Positions map directly
+to saturation, value and hue so redrawing during a drag is cheap.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+import colorsys
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+    from tkinter import ttk
+else:
+    import Tkinter as tk
+    import ttk
+
+import tks.colors
+from tks.instrument import timed
+
+__all__ = ['ColorPlane']
+
+DEFAULT_SIZE = 200
+DEFAULT_BAR_WIDTH = 20
+
+_scale_tables = {}
+_hue_bar_cache = {}
+
+# PIL is only imported when the first color plane is created
+Image = None
+ImageTk = None
+
+
+class ColorPlane(ttk.Frame, object):
+    """Displays a saturation/value plane and a hue bar.
+
+    :param master: The master widget
+    :param variable: The :class:`~tks.colors.ColorVar` to display
+    :param size: The width and height of the plane
+    :type size:  int
+    :param bar_width: The width of the hue bar
+    :type bar_width:  int
+    """
+
+    def __init__(self, master,
+                 variable=None,
+                 size=DEFAULT_SIZE,
+                 bar_width=DEFAULT_BAR_WIDTH):
+        _import_pil()
+        super(ColorPlane, self).__init__(master, style='tks.TFrame')
+
+        self._size = size
+        self._bar_width = bar_width
+
+        if variable is not None:
+            self.color_var = variable
+        else:
+            # Start with Red
+            self.color_var = tks.colors.ColorVar()
+            self.color_var.set((1.0, 0.0, 0.0))
+
+        self._hsv = colorsys.rgb_to_hsv(*self.color_var.get()[:3])
+        self._internal_color_change = False
+        self.color_var.trace_variable('w', self._color_var_changed)
+
+        self._plane = tk.Canvas(self, width=size, height=size,
+                                borderwidth=0, highlightthickness=0)
+        self._plane.grid(row=0, column=0, padx=(0, 4))
+        self._plane.bind('<Button-1>', self._plane_clicked)
+        self._plane.bind('<B1-Motion>', self._plane_clicked)
+
+        self._bar = tk.Canvas(self, width=bar_width, height=size,
+                              borderwidth=0, highlightthickness=0)
+        self._bar.grid(row=0, column=1)
+        self._bar.bind('<Button-1>', self._bar_clicked)
+        self._bar.bind('<B1-Motion>', self._bar_clicked)
+
+        self._plane_hue = None
+        self._plane_photoimage = ImageTk.PhotoImage('RGB', (size, size))
+        self._plane.create_image((0, 0), anchor=tk.NW,
+                                 image=self._plane_photoimage,
+                                 tags='plane')
+
+        bar = Image.frombytes('RGB', (bar_width, size),
+                              hue_bar_data(bar_width, size))
+        self._bar_photoimage = ImageTk.PhotoImage(image=bar)
+        self._bar.create_image((0, 0), anchor=tk.NW,
+                               image=self._bar_photoimage,
+                               tags='bar')
+
+        self._plane.create_oval((0, 0, 6, 6),
+                                width='1.0',
+                                outline='#fafafa',
+                                fill='black',
+                                tags='sv')
+        self._bar.create_rectangle((0, 0, bar_width - 1, 3),
+                                   width='1.0',
+                                   outline='#fafafa',
+                                   fill='black',
+                                   tags='hue')
+
+        self._update_plane()
+        self._update_selection()
+
+    @property
+    def hsv(self):
+        """The selected color as an (H, S, V) tuple."""
+
+        return self._hsv
+
+    def _plane_clicked(self, event):
+        s, v = sv_from_position(event.x, event.y, self._size, self._size)
+        self._set_hsv((self._hsv[0], s, v))
+
+    def _bar_clicked(self, event):
+        h = hue_from_position(event.y, self._size)
+        self._set_hsv((h, self._hsv[1], self._hsv[2]))
+
+    def _set_hsv(self, hsv):
+        self._hsv = hsv
+        self._update_plane()
+        self._update_selection()
+
+        self._internal_color_change = True
+        self.color_var.set(colorsys.hsv_to_rgb(*hsv))
+
+    def _color_var_changed(self, *args):
+        """Respond to changes in the color variable."""
+
+        if self._internal_color_change:
+            self._internal_color_change = False
+            return
+
+        h, s, v = colorsys.rgb_to_hsv(*self.color_var.get()[:3])
+        if s == 0.0 or v == 0.0:
+            # Greys have no hue so keep the one selected
+            h = self._hsv[0]
+
+        self._hsv = (h, s, v)
+        self._update_plane()
+        self._update_selection()
+
+    @timed('ColorPlane._update_plane')
+    def _update_plane(self):
+        """Redraw the plane if the hue's color has changed."""
+
+        hue_rgb = hue_color(self._hsv[0])
+        if hue_rgb == self._plane_hue:
+            return
+
+        plane = Image.frombytes('RGB', (self._size, self._size),
+                                plane_data(hue_rgb, self._size, self._size))
+        self._plane_photoimage.paste(plane)
+        self._plane_hue = hue_rgb
+
+    def _update_selection(self):
+        """Move the selection indicators to the current color."""
+
+        h, s, v = self._hsv
+        x, y = position_from_sv(s, v, self._size, self._size)
+        self._plane.coords('sv', x - 3, y - 3, x + 3, y + 3)
+
+        y = h * (self._size - 1)
+        self._bar.coords('hue', 0, y - 1, self._bar_width - 1, y + 2)
+
+
+def sv_from_position(x, y, width, height):
+    """Return the saturation and value at a position on the plane."""
+
+    s = min(max(x / (width - 1), 0.0), 1.0)
+    v = min(max(1.0 - (y / (height - 1)), 0.0), 1.0)
+    return s, v
+
+
+def position_from_sv(s, v, width, height):
+    """Return the position on the plane of a saturation and value."""
+
+    return s * (width - 1), (1.0 - v) * (height - 1)
+
+
+def hue_from_position(y, height):
+    """Return the hue at a position on the hue bar."""
+
+    return min(max(y / (height - 1), 0.0), 1.0)
+
+
+def hue_color(hue):
+    """Return the fully saturated color of a hue as an (R, G, B) tuple of
+    integers between 0 and 255"""
+
+    return tuple(int(c * 255 + 0.5) for c in colorsys.hsv_to_rgb(hue, 1.0,
+                                                                  1.0))
+
+
+def plane_data(hue_rgb, width, height):
+    """Return the RGB pixel data of the saturation/value plane for a hue.
+
+    :param hue_rgb: The color of the hue as returned by :func:`hue_color`
+    :param width: The width of the plane
+    :param height: The height of the plane
+    """
+
+    # The top row has a value of 1.0 and goes from white to the hue
+    top = bytearray(width * 3)
+    for x in range(width):
+        s = x / (width - 1)
+        for c in range(3):
+            top[x * 3 + c] = int(255 - s * (255 - hue_rgb[c]) + 0.5)
+    top = bytes(top)
+
+    rows = []
+    for y in range(height):
+        level = int((1.0 - y / (height - 1)) * 255 + 0.5)
+        rows.append(top.translate(_scale_table(level)))
+
+    return b''.join(rows)
+
+
+def hue_bar_data(width, height):
+    """Return the RGB pixel data of a hue bar."""
+
+    key = (width, height)
+    try:
+        return _hue_bar_cache[key]
+    except KeyError:
+        rows = [bytes(bytearray(hue_color(hue_from_position(y, height))))
+                * width for y in range(height)]
+        data = _hue_bar_cache[key] = b''.join(rows)
+        return data
+
+
+def _scale_table(level):
+    """Return a translation table which scales bytes by `level` / 255"""
+
+    try:
+        return _scale_tables[level]
+    except KeyError:
+        table = bytes(bytearray((i * level + 127) // 255 for i in range(256)))
+        _scale_tables[level] = table
+        return table
+
+
+def _import_pil():
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image, ImageTk
@@ -1,10 +1,21 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
-"""3 element sliders to change RGB, HSV and HLS variables"""
+"""3 element sliders to change RGB, HSV and HLS variables and a slider to
+change the alpha of an RGBA variable.
+
+Below each scale is a track showing the colors the scale selects given the
+values of the other two elements. Each track is a one pixel high strip which
+Tk zooms to the height of the track. Strips are cached per interpreter by
+element and the values of the other two elements, quantized to
+`GRADIENT_LEVELS` levels, so moving one scale only redraws the tracks of the
+other two and returning to a previous color reuses the strips. The alpha
+track shows the color over a checkerboard.
+"""
 
 from __future__ import print_function, division, absolute_import
 import sys
 import colorsys
+from collections import OrderedDict
 
 if sys.version_info >= (3, 0):
     import tkinter as tk
@@ -14,6 +25,14 @@ else:
     import ttk
 
 import tks.colors
+from tks.instrument import timed
+from tks.color_funcs import composite
+from tks.swatches import CHECKER_LIGHT, CHECKER_DARK
+
+TRACK_HEIGHT = 6
+GRADIENT_LEVELS = 64
+GRADIENT_CACHE_SIZE = 192
+
 
 class ColorSlider(ttk.Frame, object):
     """Color slider base class."""
@@ -33,13 +52,18 @@ class ColorSlider(ttk.Frame, object):
 
         self.color_var.trace_variable('w', self._color_var_changed)
 
+        self._tracks = []
+        self._track_keys = [None, None, None]
+        self._track_images = [None, None, None]
+        self._track_after_id = None
+
         self._validate_entry = (self.register(self._tk_validate_var),
                                 '%P', '%V')
 
         if not fonts:
             fonts = tks.load_fonts()
 
-        elem1, elem2, elem3 = self.from_rgb(self.color_var.get())
+        elem1, elem2, elem3 = self.from_rgb(self.color_var.get()[:3])
 
         self._elem1_var = tk.DoubleVar(value=elem1)
         lbl = ttk.Label(self, text=self.labels[0])
@@ -52,11 +76,8 @@ class ColorSlider(ttk.Frame, object):
                                       font=fonts.monospace)
         self._elem1_entry.grid(row=0, column=1, padx=4)
 
-        self._elem1_scale = ttk.Scale(self,
-                                      to=1.0,
-                                      variable=self._elem1_var,
-                                      command=self._elem1_update)
-        self._elem1_scale.grid(row=0, column=2, sticky=tk.EW, padx=4)
+        self._elem1_scale = self._create_scale(0, self._elem1_var,
+                                                self._elem1_update)
 
         self._elem2_var = tk.DoubleVar(value=elem2)
         lbl = ttk.Label(self, text=self.labels[1])
@@ -69,11 +90,8 @@ class ColorSlider(ttk.Frame, object):
                                        font=fonts.monospace)
         self._elem2_number.grid(row=1, column=1, padx=4)
 
-        self._elem2_scale = ttk.Scale(self,
-                                      to=1.0,
-                                      variable=self._elem2_var,
-                                      command=self._elem2_update)
-        self._elem2_scale.grid(row=1, column=2, sticky=tk.EW, padx=4)
+        self._elem2_scale = self._create_scale(1, self._elem2_var,
+                                                self._elem2_update)
 
         self._elem3_var = tk.DoubleVar(value=elem3)
         lbl = ttk.Label(self, text=self.labels[2])
@@ -86,11 +104,8 @@ class ColorSlider(ttk.Frame, object):
                                       font=fonts.monospace)
         self._elem3_entry.grid(row=2, column=1, padx=4)
 
-        self._elem3_scale = ttk.Scale(self,
-                                      to=1.0,
-                                      variable=self._elem3_var,
-                                      command=self._elem3_update)
-        self._elem3_scale.grid(row=2, column=2, sticky=tk.EW, padx=4)
+        self._elem3_scale = self._create_scale(2, self._elem3_var,
+                                                self._elem3_update)
 
         self._elem1_var.trace_variable('w', self._color_element_var_changed)
         self._elem2_var.trace_variable('w', self._color_element_var_changed)
@@ -110,6 +125,65 @@ class ColorSlider(ttk.Frame, object):
 
         raise NotImplementedError
 
+    def _create_scale(self, row, variable, command):
+        """Create a scale with a gradient track below it."""
+
+        frame = ttk.Frame(self, style='tks.TFrame')
+        frame.grid(row=row, column=2, sticky=tk.EW, padx=4)
+        frame.columnconfigure(0, weight=1)
+
+        scale = ttk.Scale(frame,
+                          to=1.0,
+                          variable=variable,
+                          command=command)
+        scale.grid(row=0, column=0, sticky=tk.EW)
+
+        track = tk.Canvas(frame, height=TRACK_HEIGHT,
+                          borderwidth=0, highlightthickness=0)
+        track.grid(row=1, column=0, sticky=tk.EW)
+        track.create_image((0, 0), anchor=tk.NW, tags='gradient')
+        track.bind('<Configure>', self._schedule_track_update)
+        self._tracks.append(track)
+
+        return scale
+
+    def _schedule_track_update(self, *args):
+        """Update the tracks once the pending changes have been made."""
+
+        if self._track_after_id is None:
+            self._track_after_id = self.after_idle(self._update_tracks)
+
+    @timed('ColorSlider._update_tracks')
+    def _update_tracks(self):
+        """Show the gradient of each element given the other two."""
+
+        self._track_after_id = None
+        try:
+            values = (self._elem1_var.get(),
+                      self._elem2_var.get(),
+                      self._elem3_var.get())
+        except (tk.TclError, ValueError):
+            # An entry contains a partially typed value
+            return
+
+        for channel, track in enumerate(self._tracks):
+            width = track.winfo_width()
+            if width < 2:
+                continue
+
+            others = tuple(quantize(value) for idx, value in enumerate(values)
+                           if idx != channel)
+            key = (self.__class__, channel, others, width)
+            if key != self._track_keys[channel]:
+                image = _track_image(self, key,
+                                     lambda: [gradient_colors(self.to_rgb,
+                                                              channel,
+                                                              others,
+                                                              width)])
+                track.itemconfigure('gradient', image=image)
+                self._track_keys[channel] = key
+                self._track_images[channel] = image
+
     def _elem1_update(self, value):
         self._internal_color_change = True
         self._elem1_var.set(float(value))
@@ -157,12 +231,14 @@ class ColorSlider(ttk.Frame, object):
 
         if not self._internal_color_change:
             rgb = self.color_var.get()
-            value = self.from_rgb(rgb)
+            value = self.from_rgb(rgb[:3])
             self._elem1_var.set(value[0])
             self._elem2_var.set(value[1])
             self._elem3_var.set(value[2])
         self._internal_color_change = False
 
+        self._schedule_track_update()
+
 
 class RGBSlider(ColorSlider):
     """An RGB Color Slider"""
@@ -220,3 +296,217 @@ class HLSSlider(ColorSlider):
 
     def to_rgb(self, hls):
         return colorsys.hls_to_rgb(*hls)
+
+
+class AlphaSlider(ttk.Frame, object):
+    """A slider to change the alpha of a color. The alpha of an RGB color is
+    1.0 and moving the slider makes it an RGBA color.
+
+    :param variable: The color variable
+    :type variable:  :class:`~tks.colors.ColorVar`
+    """
+
+    def __init__(self, master,
+                 variable=None,
+                 fonts=None):
+        super(AlphaSlider, self).__init__(master, style='tks.TFrame')
+
+        if variable is not None:
+            self.color_var = variable
+        else:
+            self.color_var = tks.colors.ColorVar(value=(1.0, 0.0, 0.0, 1.0))
+
+        self.color_var.trace_variable('w', self._color_var_changed)
+
+        self._track_key = None
+        self._track_image = None
+        self._track_after_id = None
+
+        self._validate_entry = (self.register(self._tk_validate_var),
+                                '%P', '%V')
+
+        if not fonts:
+            fonts = tks.load_fonts()
+
+        self._alpha_var = tk.DoubleVar(value=self.color_var.alpha)
+        lbl = ttk.Label(self, text='A')
+        lbl.grid(row=0, column=0, padx=4)
+
+        self._alpha_entry = ttk.Entry(self, width=4,
+                                      textvariable=self._alpha_var,
+                                      validate='all',
+                                      validatecommand=self._validate_entry,
+                                      font=fonts.monospace)
+        self._alpha_entry.grid(row=0, column=1, padx=4)
+
+        frame = ttk.Frame(self, style='tks.TFrame')
+        frame.grid(row=0, column=2, sticky=tk.EW, padx=4)
+        frame.columnconfigure(0, weight=1)
+
+        self._alpha_scale = ttk.Scale(frame,
+                                      to=1.0,
+                                      variable=self._alpha_var,
+                                      command=self._alpha_update)
+        self._alpha_scale.grid(row=0, column=0, sticky=tk.EW)
+
+        self._track = tk.Canvas(frame, height=TRACK_HEIGHT,
+                                borderwidth=0, highlightthickness=0)
+        self._track.grid(row=1, column=0, sticky=tk.EW)
+        self._track.create_image((0, 0), anchor=tk.NW, tags='gradient')
+        self._track.bind('<Configure>', self._schedule_track_update)
+
+        self._alpha_var.trace_variable('w', self._alpha_var_changed)
+
+        self.columnconfigure(2, weight=1)
+
+        self._internal_color_change = False
+
+    def _alpha_update(self, value):
+        self._alpha_var.set(float(value))
+
+    def _tk_validate_var(self, P, V):
+        """Tkinter validation function.
+
+        Must always return 0 or 1 or it won't get called again
+        """
+
+        rval = 1
+        if V != 'focusin':
+            try:
+                value = float(P)
+                if value > 1.0:
+                    rval = 0
+            except ValueError:
+                rval = 0
+
+        return rval
+
+    def _alpha_var_changed(self, *args):
+        """When the alpha changes update the color variable"""
+
+        try:
+            alpha = self._alpha_var.get()
+        except (tk.TclError, ValueError):
+            return
+
+        self._internal_color_change = True
+        self.color_var.set(tuple(self.color_var.get()[:3]) + (alpha,))
+
+    def _color_var_changed(self, *args):
+        """When the color variable changes update the alpha and the track"""
+
+        if not self._internal_color_change:
+            self._alpha_var.set(self.color_var.alpha)
+        self._internal_color_change = False
+
+        self._schedule_track_update()
+
+    def _schedule_track_update(self, *args):
+        if self._track_after_id is None:
+            self._track_after_id = self.after_idle(self._update_track)
+
+    def _update_track(self):
+        """Show the color with increasing alpha."""
+
+        self._track_after_id = None
+        width = self._track.winfo_width()
+        if width < 2:
+            return
+
+        levels = tuple(quantize(c) for c in self.color_var.get()[:3])
+        key = ('alpha', levels, width)
+        if key != self._track_key:
+            rgb = tuple(level / (GRADIENT_LEVELS - 1) for level in levels)
+            image = _track_image(self, key, lambda: alpha_colors(rgb, width))
+            self._track.itemconfigure('gradient', image=image)
+            self._track_key = key
+            self._track_image = image
+
+
+def quantize(value, levels=GRADIENT_LEVELS):
+    """Return the level, from 0 to `levels` - 1, nearest to a value between
+    0.0 and 1.0"""
+
+    value = min(max(value, 0.0), 1.0)
+    return int(value * (levels - 1) + 0.5)
+
+
+def gradient_colors(to_rgb, channel, others, width, levels=GRADIENT_LEVELS):
+    """Return the colors of a track as a list of `#rrggbb` strings.
+
+    :param to_rgb: The function which converts the slider's elements to RGB
+    :param channel: The index of the element which varies along the track
+    :type channel:  int
+    :param others: The quantized levels of the other two elements
+    :type others:  tuple
+    :param width: The number of colors to return
+    :type width:  int
+    """
+
+    values = [level / (levels - 1) for level in others]
+    values.insert(channel, 0.0)
+
+    colors = []
+    for x in range(width):
+        values[channel] = x / (width - 1)
+        colors.append(_hex(to_rgb(tuple(values))))
+
+    return colors
+
+
+def alpha_colors(rgb, width, cell=TRACK_HEIGHT // 2):
+    """Return the two rows of colors of an alpha track, the color drawn with
+    increasing alpha over a checkerboard with cells `cell` pixels wide.
+
+    :param rgb: The color as an (R, G, B) tuple
+    :param width: The number of colors in each row
+    :type width:  int
+    """
+
+    rgb = tuple(rgb[:3])
+    top = []
+    bottom = []
+    for x in range(width):
+        rgba = rgb + (x / (width - 1),)
+        light = _hex(composite(rgba, CHECKER_LIGHT))
+        dark = _hex(composite(rgba, CHECKER_DARK))
+        if (x // cell) % 2:
+            light, dark = dark, light
+        top.append(light)
+        bottom.append(dark)
+
+    return [top, bottom]
+
+
+def _hex(rgb):
+    return '#%02x%02x%02x' % tuple(int(min(max(c, 0.0), 1.0) * 255 + 0.5)
+                                   for c in rgb)
+
+
+def _track_image(master, key, create_rows):
+    """Return the track image for a key, creating it from the rows of colors
+    returned by `create_rows` if it is not in the interpreter's cache of
+    recently used images."""
+
+    root = master._root()
+    try:
+        cache = root._tks_gradients
+    except AttributeError:
+        cache = root._tks_gradients = OrderedDict()
+
+    try:
+        image = cache.pop(key)
+    except KeyError:
+        rows = create_rows()
+        strip = tk.PhotoImage(master=root, width=len(rows[0]),
+                              height=len(rows))
+        strip.put(' '.join('{%s}' % ' '.join(row) for row in rows),
+                  to=(0, 0))
+        image = strip.zoom(1, TRACK_HEIGHT // len(rows))
+
+        # Images which are still shown are kept alive by their slider
+        while len(cache) >= GRADIENT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    cache[key] = image
+    return image
@@ -1,7 +1,9 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
 """ColorSquare displays a solid square which changes color depending on the
-value of a variable. Also displays textual color information below."""
+value of a variable. Also displays textual color information below.
+
+Translucent colors are shown over a checkerboard."""
 
 from __future__ import print_function, division, absolute_import
 import sys
@@ -17,6 +19,7 @@ import tks.dnd
 import tks.colors
 import tks.tooltip
 import tks.color_funcs
+from tks.swatches import swatch_image
 
 __all__ = ['ColorSquare']
 
@@ -71,6 +74,12 @@ class ColorSquare(ttk.Frame, object):
         self._canvas_cursor = None
         self._blank_label_color = self._canvas.cget('bg')
 
+        inset = int(float(self._canvas['borderwidth'])) + \
+            int(self._canvas['highlightthickness'])
+        self._swatch = None
+        self._canvas.create_image((inset, inset), anchor=tk.NW,
+                                  state=tk.HIDDEN, tags='swatch')
+
         self._tooltip = tks.tooltip.ToolTip(self._canvas,
                                             msg_func=self._color_info_func)
         self._popup = ColorPopupMenu(self)
@@ -207,12 +216,24 @@ class ColorSquare(ttk.Frame, object):
         """Update for a new RGB value."""
 
         if self.rgb:
-            self._canvas['bg'] = tks.color_funcs.rgb_to_hex_string(self.rgb)
+            rgb = tuple(self.rgb)
+            self._canvas['bg'] = tks.color_funcs.rgb_to_hex_string(rgb[:3])
             self._text['text'] = self._color_info_text()
         else:
+            rgb = ()
             self._canvas['bg'] = self._blank_label_color
             self._text['text'] = ''
 
+        if len(rgb) > 3 and rgb[3] < 1.0:
+            self._swatch = swatch_image(self, rgb,
+                                        int(self._canvas['width']),
+                                        int(self._canvas['height']))
+            self._canvas.itemconfigure('swatch', image=self._swatch,
+                                       state=tk.NORMAL)
+        elif self._swatch is not None:
+            self._swatch = None
+            self._canvas.itemconfigure('swatch', image='', state=tk.HIDDEN)
+
     def _color_info_text(self):
         """Generate a text representation of the color."""
 
@@ -15,6 +15,7 @@ a scale to adjust the percent between the colors.
 from __future__ import print_function, division, absolute_import
 import sys
 import math
+import functools
 
 if sys.version_info >= (3, 0):
     import tkinter as tk
@@ -127,16 +128,22 @@ class ColorTint(_TintAndShadeBase):
     :param percent: Determines the percent between the tints specified as a
                      min and a max range.
     :type percent:  tuple
+    :param perceptual: If True the tints are evenly spaced in perceived
+                       lightness
+    :type perceptual:  bool
     """
 
     def __init__(self, master,
                  variable,
                  count=5,
-                 percent=(1, 5)):
+                 percent=(1, 5),
+                 perceptual=False):
+        func = functools.partial(tks.color_funcs.rgb_tints,
+                                 perceptual=perceptual)
         super(ColorTint, self).__init__(master, variable, _('Tints'),
                                         count=count,
                                         percent=percent,
-                                        func=tks.color_funcs.rgb_tints)
+                                        func=func)
 
 
 class ColorShade(_TintAndShadeBase):
@@ -149,13 +156,19 @@ class ColorShade(_TintAndShadeBase):
     :param percent: Determines the percentage percent between the shades
                      specified as a min and a max range.
     :type percent:  tuple
+    :param perceptual: If True the shades are evenly spaced in perceived
+                       lightness
+    :type perceptual:  bool
     """
 
     def __init__(self, master,
                  variable,
                  count=5,
-                 percent=(1, 5)):
+                 percent=(1, 5),
+                 perceptual=False):
+        func = functools.partial(tks.color_funcs.rgb_shades,
+                                 perceptual=perceptual)
         super(ColorShade, self).__init__(master, variable, _('Shades'),
                                          count=count,
                                          percent=percent,
-                                         func=tks.color_funcs.rgb_shades)
+                                         func=func)
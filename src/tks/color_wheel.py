@@ -16,27 +16,46 @@ else:
     import Tkinter as tk
     import ttk
 
-from PIL import Image, ImageTk
-
 import tks.colors
+from tks.instrument import timed, timed_steps
+from tks.chunked import get_chunk_scheduler
 
 DEFAULT_RADIUS = 125
 
+_wheel_cache = {}
+
+# PIL is only imported when the first color wheel is created
+Image = None
+ImageTk = None
+
 
 class ColorWheel(ttk.Frame, object):
-    """Displays an HSV color wheel."""
+    """Displays an HSV color wheel.
+
+    :param master: The master widget
+    :param variable: The :class:`~tks.colors.ColorVar` to display
+    :param radius: The outer radius of the wheel
+    :type radius:  int
+    :param render_pool: If given the :class:`~tks.rendering.RenderPool` used
+                        to calculate the wheel and triangle images away from
+                        the Tk thread.
+    """
 
     def __init__(self, master,
                  variable=None,
-                 radius=DEFAULT_RADIUS):
+                 radius=DEFAULT_RADIUS,
+                 render_pool=None):
+        _import_pil()
         super(ColorWheel, self).__init__(master, style='tks.TFrame')
 
+        self._render_pool = render_pool
+
         self._hue_degrees = 0.0
 
         if variable is not None:
             self.color_var = variable
             self._variable = variable.get()
-            self._hsv = colorsys.rgb_to_hsv(*self._variable)
+            self._hsv = colorsys.rgb_to_hsv(*self._variable[:3])
         else:
             # Start with Red
             self.color_var = tks.colors.ColorVar()
@@ -67,6 +86,13 @@ class ColorWheel(ttk.Frame, object):
 
         self.columnconfigure(0, weight=0, minsize=radius * 2 + 1)
 
+    def destroy(self):
+        get_chunk_scheduler(self).cancel((self, 'wheel'))
+        if self._render_pool is not None:
+            self._render_pool.cancel((self, 'wheel'))
+            self._render_pool.cancel((self, 'triangle'))
+        super(ColorWheel, self).destroy()
+
     @property
     def hue(self):
         return self._hsv[0]
@@ -113,14 +139,13 @@ class ColorWheel(ttk.Frame, object):
         """Respond to changes in the color variable."""
 
         self._variable = self.color_var.get()
-        self._hsv = colorsys.rgb_to_hsv(*self._variable)
+        self._hsv = colorsys.rgb_to_hsv(*self._variable[:3])
         angle = int(self._hsv[0] * 359.0)
         if not self._internal_color_change:
             if angle != self._hue_degrees:
                 self._hue_degrees = angle
                 self._hue_update_selection()
-                self._update_triangle()
-                self._update_triangle_image()
+                self._redraw_triangle()
         self._internal_color_change = False
 
         s = self._hsv[1]
@@ -145,8 +170,7 @@ class ColorWheel(ttk.Frame, object):
         self._outer_radius = radius
         self._outer_radius2 = pow(self._outer_radius, 2)
 
-        self._inner_radius = int(self._outer_radius - \
-                                       (self._outer_radius / 4))
+        self._inner_radius = inner_radius(radius)
         self._inner_radius2 = pow(self._inner_radius, 2)
 
         self._triangle_radius = self._inner_radius - 6
@@ -157,37 +181,39 @@ class ColorWheel(ttk.Frame, object):
         self._selection_radius = 3
 
     def _create_wheel(self, radius):
-        """Create the color wheel."""
+        """Create the color wheel.
+
+        The first wheel of a size is calculated in chunks, or by the render
+        pool, and drawn when it is complete so that the interface stays
+        responsive.
+        """
 
+        key = (self._outer_radius, self._inner_radius)
+        if key in _wheel_cache:
+            self._draw_wheel()
+        elif self._render_pool is not None:
+            self._render_pool.submit((self, 'wheel'), wheel_data, key,
+                                     callback=self._wheel_calculated)
+        else:
+            get_chunk_scheduler(self).run(
+                (self, 'wheel'),
+                wheel_data_steps(self._outer_radius, self._inner_radius),
+                done=self._draw_wheel)
+
+    def _wheel_calculated(self, data):
+        # A pool of processes cannot fill the cache of this process
+        _wheel_cache.setdefault((self._outer_radius, self._inner_radius),
+                                data)
+        self._draw_wheel()
+
+    def _draw_wheel(self):
         stride = (self._outer_radius * 2) + 1
-        ring_buf_size = stride * stride * 4
-        ring_data = bytearray(ring_buf_size)
-
-        # -radius + 0 + radius
-        points = range(-self._outer_radius, self._outer_radius + 1)
-        for y in points:
-            for x in points:
-                r2 = (x * x) + (y * y)
-
-                offset = (((self._outer_radius + y) * stride) + \
-                          (self._outer_radius + x)) * 4
-
-                if r2 < self._outer_radius2 and r2 > self._inner_radius2:
-                    angle = int(degrees(atan2(y, x))) % 360
-                    c = self._hue_to_rgb_map[angle]
-                    ring_data[offset] = int(255 * c[0])
-                    ring_data[offset + 1] = int(255 * c[1])
-                    ring_data[offset + 2] = int(255 * c[2])
-                    ring_data[offset + 3] = 255
-                else:
-                    ring_data[offset] = 0
-                    ring_data[offset + 1] = 0
-                    ring_data[offset + 2] = 0
-                    ring_data[offset + 3] = 0
+        ring_data = wheel_data(self._outer_radius, self._inner_radius)
 
+        self._canvas.delete('wheel')
         self._wheel = Image.frombytes('RGBA',
                                       (stride, stride),
-                                      bytes(ring_data),
+                                      ring_data,
                                       'raw', 'RGBA', 0, -1)
 
         self._wheel_photoimage = ImageTk.PhotoImage(image=self._wheel)
@@ -195,14 +221,15 @@ class ColorWheel(ttk.Frame, object):
         self._canvas.create_image((self._center + 1, self._center + 1),
                                   image=self._wheel_photoimage,
                                   tags='wheel')
+        self._canvas.tag_lower('wheel')
 
+    @timed('ColorWheel._create_triangle')
     def _create_triangle(self):
         """Create the saturation/value triangle that is displayed in the wheel."""
 
         stride = (self._triangle_radius * 2) + 1
         buf_size = stride * stride * 4
         self._triangle_data = bytearray(source=buf_size)
-        self._triangle_back_buffer = bytearray(source=buf_size)
 
         self._update_triangle()
 
@@ -234,8 +261,7 @@ class ColorWheel(ttk.Frame, object):
             # print(self._hue_degrees)
 
             self._hue_update_selection()
-            self._update_triangle()
-            self._update_triangle_image()
+            self._redraw_triangle()
 
             rgb = colorsys.hsv_to_rgb(self._hue_degrees / 359.0, 1.0, 1.0)
             vertices = self._triangle_vertices(self._hue_degrees, self._center)
@@ -245,99 +271,36 @@ class ColorWheel(ttk.Frame, object):
             if self._in_triangle(x, y):
                 self._sv_update_selection(x, y)
                 rgb = self.color_var.get()
-                hsv = colorsys.rgb_to_hsv(*rgb)
+                hsv = colorsys.rgb_to_hsv(*rgb[:3])
                 s, v = self._sv_calc_from_position(x, y)
                 rgb = colorsys.hsv_to_rgb(hsv[0], s, v)
 
                 self._internal_color_change = True
                 self.color_var.set(rgb)
 
+    @timed('ColorWheel._update_triangle')
     def _update_triangle(self):
         """Update the triangle for the new hue."""
 
-        hx, hy, sx, sy, vx, vy = \
-            self._triangle_vertices(self._hue_degrees,
-                                    self._triangle_radius)
-
-        r1, g1, b1 = colorsys.hsv_to_rgb(self._hue_degrees / 359.0,
-                                         1.0, 1.0)
-        r2, g2, b2 = (0.0, 0.0, 0.0)
-        r3, g3, b3 = (1.0, 1.0, 1.0)
-
-        if sy > vy:
-            sx, vx = vx, sx
-            sy, vy = vy, sy
-            r2, r3 = r3, r2
-            g2, g3 = g3, g2
-            b2, b3 = b3, b2
-
-        if hy > vy:
-            hx, vx = vx, hx
-            hy, vy = vy, hy
-            r1, r3 = r3, r1
-            g1, g3 = g3, g1
-            b1, b3 = b3, b1
-
-        if hy > sy:
-            hx, sx = sx, hx
-            hy, sy = sy, hy
-            r1, r2 = r2, r1
-            g1, g2 = g2, g1
-            b1, b2 = b2, b1
+        self._triangle_data[:] = triangle_data(self._triangle_radius,
+                                               self._hue_degrees)
 
-        stride = (self._triangle_radius * 2) + 1
-        for y in range(stride):
-            offset = y * stride * 4
-
-            if y < hy or y > vy:
-                for x in range(stride):
-                    self._triangle_back_buffer[offset] = 0
-                    self._triangle_back_buffer[offset + 1] = 0
-                    self._triangle_back_buffer[offset + 2] = 0
-                    self._triangle_back_buffer[offset + 3] = 0
-                    offset += 4
-            else:
-                if y < sy:
-                    xl = linear_interpolate(hx, sx, hy, sy, y)
-                    rl = linear_interpolate(r1, r2, hy, sy, y)
-                    gl = linear_interpolate(g1, g2, hy, sy, y)
-                    bl = linear_interpolate(b1, b2, hy, sy, y)
-                else:
-                    xl = linear_interpolate(sx, vx, sy, vy, y)
-                    rl = linear_interpolate(r2, r3, sy, vy, y)
-                    gl = linear_interpolate(g2, g3, sy, vy, y)
-                    bl = linear_interpolate(b2, b3, sy, vy, y)
-
-                xr = linear_interpolate(hx, vx, hy, vy, y)
-
-                rr = linear_interpolate(r1, r3, hy, vy, y)
-                gr = linear_interpolate(g1, g3, hy, vy, y)
-                br = linear_interpolate(b1, b3, hy, vy, y)
-
-                if xl > xr:
-                    xl, xr = xr, xl
-                    rl, rr = rr, rl
-                    gl, gr = gr, gl
-                    bl, br = br, bl
-
-                for x in range(stride):
-                    if x < xl or x > xr:
-                        self._triangle_back_buffer[offset] = 0
-                        self._triangle_back_buffer[offset + 1] = 0
-                        self._triangle_back_buffer[offset + 2] = 0
-                        self._triangle_back_buffer[offset + 3] = 0
-                        offset += 4
-                    else:
-                        r = int(linear_interpolate(rl, rr, xl, xr, x) * 255)
-                        g = int(linear_interpolate(gl, gr, xl, xr, x) * 255)
-                        b = int(linear_interpolate(bl, br, xl, xr, x) * 255)
-                        self._triangle_back_buffer[offset] = r
-                        self._triangle_back_buffer[offset + 1] = g
-                        self._triangle_back_buffer[offset + 2] = b
-                        self._triangle_back_buffer[offset + 3] = 255
-                        offset += 4
-
-        self._triangle_data[:] = self._triangle_back_buffer
+    def _redraw_triangle(self):
+        """Redraw the triangle for the new hue, calculating it in the render
+        pool if there is one."""
+
+        if self._render_pool is None:
+            self._update_triangle()
+            self._update_triangle_image()
+        else:
+            self._render_pool.submit((self, 'triangle'), triangle_data,
+                                     (self._triangle_radius,
+                                      self._hue_degrees),
+                                     callback=self._triangle_calculated)
+
+    def _triangle_calculated(self, data):
+        self._triangle_data[:] = data
+        self._update_triangle_image()
 
     def _update_triangle_image(self):
         """Create a new PhotoImage for the updated triangle."""
@@ -350,15 +313,8 @@ class ColorWheel(ttk.Frame, object):
     def _triangle_vertices(self, angle, center=0):
         """Calculate the vertices of the triangle."""
 
-        angle = radians(self._hue_degrees)
-        hx = floor(center + 0.5 + (cos(angle) * self._triangle_radius))
-        hy = floor(center + 0.5 - (sin(angle) * self._triangle_radius))
-        sx = floor(center + 0.5 + (cos(angle + (2.0 * pi / 3.0)) * self._triangle_radius))
-        sy = floor(center + 0.5 - (sin(angle + (2.0 * pi / 3.0)) * self._triangle_radius))
-        vx = floor(center + 0.5 + (cos(angle + (4.0 * pi / 3.0)) * self._triangle_radius))
-        vy = floor(center + 0.5 - (sin(angle + (4.0 * pi / 3.0)) * self._triangle_radius))
-
-        return hx, hy, sx, sy, vx, vy
+        return triangle_vertices(self._hue_degrees, self._triangle_radius,
+                                 center)
 
     def _in_triangle(self, x, y):
         """Determine if point x,y is within the triangle."""
@@ -498,6 +454,167 @@ class ColorWheel(ttk.Frame, object):
         return s, v
 
 
+def inner_radius(outer_radius):
+    """Return the inner radius of the hue ring of a wheel."""
+
+    return int(outer_radius - (outer_radius / 4))
+
+
+def wheel_data(outer_radius, inner_radius):
+    """Return the RGBA pixel data of a hue ring.
+
+    The ring only depends on its radii so it is calculated once and shared
+    by all color wheels of the same size.
+    """
+
+    key = (outer_radius, inner_radius)
+    try:
+        return _wheel_cache[key]
+    except KeyError:
+        for _ in wheel_data_steps(outer_radius, inner_radius):
+            pass
+        return _wheel_cache[key]
+
+
+@timed_steps('color_wheel.wheel_data')
+def wheel_data_steps(outer_radius, inner_radius, rows=16):
+    """Calculate the pixel data for :func:`wheel_data` yielding after every
+    `rows` rows so that the work can be spread over several idle callbacks.
+    """
+
+    key = (outer_radius, inner_radius)
+    if key in _wheel_cache:
+        return
+
+    hue_to_rgb = [tuple(int(255 * c) for c in
+                        colorsys.hsv_to_rgb(radians(angle) / (2 * pi),
+                                            1.0, 1.0))
+                  for angle in range(360)]
+    outer_radius2 = pow(outer_radius, 2)
+    inner_radius2 = pow(inner_radius, 2)
+
+    stride = (outer_radius * 2) + 1
+    ring_data = bytearray(stride * stride * 4)
+
+    # -radius + 0 + radius
+    points = range(-outer_radius, outer_radius + 1)
+    for y in points:
+        offset = (outer_radius + y) * stride * 4
+        for x in points:
+            r2 = (x * x) + (y * y)
+            if r2 < outer_radius2 and r2 > inner_radius2:
+                r, g, b = hue_to_rgb[int(degrees(atan2(y, x))) % 360]
+                ring_data[offset] = r
+                ring_data[offset + 1] = g
+                ring_data[offset + 2] = b
+                ring_data[offset + 3] = 255
+            offset += 4
+
+        if (y + outer_radius) % rows == rows - 1:
+            yield
+
+    _wheel_cache[key] = bytes(ring_data)
+
+
+def triangle_vertices(hue_degrees, radius, center=0):
+    """Return the hue, saturation and value vertices of the triangle for a
+    hue as a tuple `(hx, hy, sx, sy, vx, vy)`."""
+
+    angle = radians(hue_degrees)
+    hx = floor(center + 0.5 + (cos(angle) * radius))
+    hy = floor(center + 0.5 - (sin(angle) * radius))
+    sx = floor(center + 0.5 + (cos(angle + (2.0 * pi / 3.0)) * radius))
+    sy = floor(center + 0.5 - (sin(angle + (2.0 * pi / 3.0)) * radius))
+    vx = floor(center + 0.5 + (cos(angle + (4.0 * pi / 3.0)) * radius))
+    vy = floor(center + 0.5 - (sin(angle + (4.0 * pi / 3.0)) * radius))
+
+    return hx, hy, sx, sy, vx, vy
+
+
+def triangle_data(radius, hue_degrees):
+    """Return the RGBA pixel data of the saturation/value triangle for a hue.
+
+    This only uses its arguments so it can be run by a
+    :class:`~tks.rendering.RenderPool`.
+    """
+
+    hx, hy, sx, sy, vx, vy = triangle_vertices(hue_degrees, radius, radius)
+
+    r1, g1, b1 = colorsys.hsv_to_rgb(hue_degrees / 359.0, 1.0, 1.0)
+    r2, g2, b2 = (0.0, 0.0, 0.0)
+    r3, g3, b3 = (1.0, 1.0, 1.0)
+
+    if sy > vy:
+        sx, vx = vx, sx
+        sy, vy = vy, sy
+        r2, r3 = r3, r2
+        g2, g3 = g3, g2
+        b2, b3 = b3, b2
+
+    if hy > vy:
+        hx, vx = vx, hx
+        hy, vy = vy, hy
+        r1, r3 = r3, r1
+        g1, g3 = g3, g1
+        b1, b3 = b3, b1
+
+    if hy > sy:
+        hx, sx = sx, hx
+        hy, sy = sy, hy
+        r1, r2 = r2, r1
+        g1, g2 = g2, g1
+        b1, b2 = b2, b1
+
+    stride = (radius * 2) + 1
+    data = bytearray(stride * stride * 4)
+    for y in range(stride):
+        # Rows outside the triangle are left transparent
+        if y < hy or y > vy:
+            continue
+
+        if y < sy:
+            xl = linear_interpolate(hx, sx, hy, sy, y)
+            rl = linear_interpolate(r1, r2, hy, sy, y)
+            gl = linear_interpolate(g1, g2, hy, sy, y)
+            bl = linear_interpolate(b1, b2, hy, sy, y)
+        else:
+            xl = linear_interpolate(sx, vx, sy, vy, y)
+            rl = linear_interpolate(r2, r3, sy, vy, y)
+            gl = linear_interpolate(g2, g3, sy, vy, y)
+            bl = linear_interpolate(b2, b3, sy, vy, y)
+
+        xr = linear_interpolate(hx, vx, hy, vy, y)
+
+        rr = linear_interpolate(r1, r3, hy, vy, y)
+        gr = linear_interpolate(g1, g3, hy, vy, y)
+        br = linear_interpolate(b1, b3, hy, vy, y)
+
+        if xl > xr:
+            xl, xr = xr, xl
+            rl, rr = rr, rl
+            gl, gr = gr, gl
+            bl, br = br, bl
+
+        offset = y * stride * 4
+        for x in range(stride):
+            if x >= xl and x <= xr:
+                data[offset] = int(linear_interpolate(rl, rr, xl, xr, x) * 255)
+                data[offset + 1] = int(linear_interpolate(gl, gr, xl, xr, x)
+                                       * 255)
+                data[offset + 2] = int(linear_interpolate(bl, br, xl, xr, x)
+                                       * 255)
+                data[offset + 3] = 255
+            offset += 4
+
+    return bytes(data)
+
+
+def _import_pil():
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image, ImageTk
+
+
 def linear_interpolate(a, b, v1, v2, i):
     """Linear interpolation"""
 
@@ -3,7 +3,7 @@
 """:mod:`tks.colors` provides 3 classes to obtain a color from a user.
 
 :class:`ColorVar`
-    A Tk variable which holds an RGB color.
+    A Tk variable which holds an RGB or RGBA color.
 
 :class:`ColorEntry`
     Displays an entry box to enter a color as well as a button to
@@ -30,22 +30,24 @@ _ = language.gettext
 
 import tks
 import tks.color_funcs
-import tks.color_wheel
-import tks.color_square
-import tks.color_slider
+from tks.styles import configure_style, lookup_style
 
 DEFAULT_RGB = (1.0, 0.0, 0.0)
 
 
 class ColorVar(tks.PickleVar):
-    """A Tkinter Variable subclass to store an RGB color tuple."""
+    """A Tkinter Variable subclass to store an RGB or RGBA color tuple.
+
+    Setting an RGB color keeps the alpha of the current color so widgets
+    which only handle RGB can share a variable holding an RGBA color.
+    """
 
     def __init__(self, master=None, value=None, name=None):
         if value is not None:
             if sys.version_info >= (3, 0):
                 value = self.__transform_value(value)
             else:
-                value = tuple([float(x) for x in value[:3]])
+                value = tuple([float(x) for x in value[:4]])
         else:
             value = DEFAULT_RGB
 
@@ -55,13 +57,25 @@ class ColorVar(tks.PickleVar):
         """Set the color tuple to be stored."""
 
         value = self.__transform_value(value)
+        # Python 2's Variable.__init__ sets the value before the Tcl
+        # variable exists
+        if len(value) == 3 and self._tk.getboolean(
+                self._tk.call('info', 'exists', self._name)):
+            value += tuple(self.get()[3:])
         return super(ColorVar, self).set(value)
 
+    @property
+    def alpha(self):
+        """The alpha of the color, 1.0 for an RGB color."""
+
+        value = self.get()
+        return value[3] if len(value) > 3 else 1.0
+
     def __transform_value(self, value):
         """If any element of the tuple is greater than 1.0 then all values
         will be divided by 255.0
         """
-        value = [float(x) for x in value[:3]]
+        value = [float(x) for x in value[:4]]
 
         if any([x > 1.0 for x in value]):
             value = [x / 255.0 for x in value]
@@ -137,14 +151,14 @@ class ColorEntry(ttk.Frame, object):
         """HSV representation of the selected color"""
 
         color = self._variable.get()
-        return colorsys.rgb_to_hsv(*color)
+        return colorsys.rgb_to_hsv(*color[:3])
 
     @property
     def hls(self):
         """HLS representation of the selected color"""
 
         color = self._variable.get()
-        return colorsys.rgb_to_hls(*color)
+        return colorsys.rgb_to_hls(*color[:3])
 
     @property
     def value(self):
@@ -206,9 +220,9 @@ class ColorEntry(ttk.Frame, object):
             if color_format in ['rgb', 'rgbhex']:
                 rgb = color
             elif color_format == 'hsv':
-                rgb = colorsys.hsv_to_rgb(*color)
+                rgb = colorsys.hsv_to_rgb(*color[:3]) + color[3:]
             elif color_format == 'hls':
-                rgb = colorsys.hls_to_rgb(*color)
+                rgb = colorsys.hls_to_rgb(*color[:3]) + color[3:]
         else:
             rgb = DEFAULT_RGB
 
@@ -225,22 +239,43 @@ class ColorDialog(tk.Toplevel, object):
     """Display a dialog to obtain an RGB value.
 
     The color is returned as an (R, G, B) tuple where each component is
-    between 0.0 and 1.0
+    between 0.0 and 1.0, or an (R, G, B, A) tuple if the dialog shows an
+    alpha slider.
 
     :param master:      The master widget
     :param title:       The window title
     :type title:        str
-    :param start_color: The initial (R, G, B) tuple to display.
+    :param start_color: The initial (R, G, B) or (R, G, B, A) tuple to
+                        display.
 
                         If any element of the tuple is greater than 1.0 then
                         it is assumed that all values need to be scaled by
                         255.0 both when setting and obtaining the color value.
     :type start_color:  tuple
+    :param render_pool: If given the :class:`~tks.rendering.RenderPool` the
+                        color wheel uses to calculate its images.
+    :param picker:      `wheel` to select the color with a
+                        :class:`~tks.color_wheel.ColorWheel` or `plane` to
+                        use a :class:`~tks.color_plane.ColorPlane`
+    :type picker:       str
+    :param alpha:       If True an alpha slider is shown. Defaults to showing
+                        the slider if `start_color` has an alpha.
+    :type alpha:        bool
     """
 
     def __init__(self, master, title,
                  start_color=(0.5, 0.5, 0.5),
-                 fonts=None):
+                 fonts=None,
+                 render_pool=None,
+                 picker='wheel',
+                 alpha=None):
+        # The selectors are imported here so that importing this module does
+        # not import PIL
+        import tks.color_wheel
+        import tks.color_plane
+        import tks.color_square
+        import tks.color_slider
+
         super(ColorDialog, self).__init__(master)
 
         self.withdraw()
@@ -251,13 +286,24 @@ class ColorDialog(tk.Toplevel, object):
 
         self.color = None
 
-        bg_color = ttk.Style().lookup('TFrame', 'background')
-        ttk.Style().configure('tks.TFrame', background=bg_color)
+        configure_style(self, 'tks.TFrame',
+                        background=lookup_style(self, 'TFrame', 'background'))
+
+        if alpha is None:
+            alpha = len(start_color) > 3
+        elif alpha and len(start_color) == 3:
+            opaque = 255.0 if any([c > 1.0 for c in start_color]) else 1.0
+            start_color = tuple(start_color) + (opaque,)
 
         start_color, self._scaled = self._scale_color_var(start_color)
         self.color_var = ColorVar(value=start_color)
 
-        self._color_selector = tks.color_wheel.ColorWheel(self, variable=self.color_var)
+        if picker == 'plane':
+            self._color_selector = tks.color_plane.ColorPlane(
+                self, variable=self.color_var)
+        else:
+            self._color_selector = tks.color_wheel.ColorWheel(
+                self, variable=self.color_var, render_pool=render_pool)
         self._color_selector.grid(row=0, column=0, rowspan=3,
                                   padx=4, pady=4, sticky=tk.NW)
 
@@ -276,6 +322,12 @@ class ColorDialog(tk.Toplevel, object):
                                                 fonts=fonts)
         hls_slider.grid(row=2, column=1, padx=4, pady=4, sticky=tk.NSEW)
 
+        if alpha:
+            alpha_slider = tks.color_slider.AlphaSlider(
+                self, variable=self.color_var, fonts=fonts)
+            alpha_slider.grid(row=3, column=1, padx=4, pady=4,
+                              sticky=tk.NSEW)
+
         self.lbl = tks.color_square.ColorSquare(self, variable=self.color_var,
                                                 mode='rw',
                                                 color_info=('rgbhex', 'rgb',
@@ -1,6 +1,6 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
-""":mod:`tks.dates` provides 4 classes to obtain a date from a user.
+""":mod:`tks.dates` provides 6 classes to obtain a date from a user.
 
 :class:`DateVar`
     A Tk variable which holds a date.
@@ -9,18 +9,28 @@
     Displays entry boxes for year, month and day as well as a button to
     display a date selection dialog.
 
+:class:`CompactDateEntry`
+    A single entry box for a date which is lighter weight than a
+    :class:`DateEntry`.
+
 :class:`DateDialog`
     Displays a dialog window allowing the user to select a date.
 
 :class:`DateSelector`
     A widget which contains the date selection machinery.
+
+:class:`DateRangeSelector`
+    A widget which displays several months side by side and allows a range
+    of dates to be selected.
 """
 
 from __future__ import print_function, division, absolute_import
 import sys
+import math
 import datetime
 import calendar
 from functools import partial
+from collections import OrderedDict
 
 if sys.version_info >= (3, 0):
     import tkinter as tk
@@ -31,18 +41,32 @@ else:
     import tkFont as tkf
     import ttk
 
-try:
-    import babel
-    import babel.dates
-    import babel.numbers
-except ImportError:
-    babel = None
-
 from tks.i18n import language
 _ = language.gettext
 
 import tks
 import tks.dialog
+import tks.locales
+import tks.color_funcs
+from tks.instrument import timed
+from tks.rc_watch import CONFIG_CHANGED
+from tks.repeat import AutoRepeat
+from tks.styles import get_font, configure_style, lookup_style
+from tks.masked_entry import MaskedEntry
+
+GRID_CACHE_SIZE = 48
+
+_grid_cache = OrderedDict()
+
+# The first and last months which a date can be in, as counted by
+# _month_index
+_MIN_MONTH_INDEX = datetime.MINYEAR * 12
+_MAX_MONTH_INDEX = datetime.MAXYEAR * 12 + 11
+
+# The 6 week grids of the very first and last months include days which a
+# date cannot represent so the calendars stop at the months next to them.
+_FIRST_CALENDAR_MONTH = _MIN_MONTH_INDEX + 1
+_LAST_CALENDAR_MONTH = _MAX_MONTH_INDEX - 1
 
 
 class TargetShape():
@@ -100,31 +124,21 @@ class DateEntry(ttk.Frame, object):
         else:
             self._variable = DateVar(value=datetime.date.today())
 
-        if babel and locale:
-            if not isinstance(locale, babel.Locale):
-                locale = babel.Locale(locale)
-
-            self._pattern = locale.date_formats['short'].pattern
-
-            for ch in self._pattern:
-                if ch.lower() not in ['d', 'm', 'y']:
-                    separator = ch
-                    break
-
-            elems = self._pattern.split(separator)
-            for idx, elem in enumerate(elems):
-                if 'y' in elem:
-                    year_column = idx
-                elif 'M' in elem:
-                    month_column = idx
-                elif 'd' in elem:
-                    day_column = idx
-        else:
-            year_column = 0
-            month_column = 1
-            day_column = 2
-            separator = '-'
-            self._pattern = 'yyyy-MM-dd'
+        self._pattern = tks.locales.get_locale_info(locale).date_pattern
+
+        for ch in self._pattern:
+            if ch.lower() not in ['d', 'm', 'y']:
+                separator = ch
+                break
+
+        elems = self._pattern.split(separator)
+        for idx, elem in enumerate(elems):
+            if 'y' in elem:
+                year_column = idx
+            elif 'M' in elem:
+                month_column = idx
+            elif 'd' in elem:
+                day_column = idx
 
         self._locale = locale
 
@@ -282,6 +296,101 @@ class DateEntry(ttk.Frame, object):
             self.value = new_date
 
 
+class CompactDateEntry(MaskedEntry):
+    """A date entry widget which uses a single entry box.
+
+    Digits overwrite the text under the cursor, the Up and Down keys change
+    the year, month or day under the cursor and either Alt-Down or F4
+    displays a date selection dialog. Only a single entry widget and the
+    :class:`DateVar` are created which makes this more suitable than
+    :class:`DateEntry` when many dates are displayed at once.
+
+    :param master:   The master frame
+    :type master:    :class:`ttk.Frame`
+    :param variable: The variable which holds the date to display.
+    :type variable:  :class:`tks.dates.DateVar`
+    :param locale:   Determines the order of the fields in the entry.
+                     Either a locale name e.g. 'en' or a babel Locale
+                     instance. If :mod:`babel` is not installed ISO 8601
+                     format will be used.
+    :type locale:    str or :class:`babel.Locale <babel.core.Locale>`
+    :param fonts:    Fonts to use.
+    :type fonts:     :class:`~tks.DefaultFonts`
+    """
+
+    def __init__(self, master,
+                 variable=None,
+                 locale='en',
+                 fonts=None):
+        if variable:
+            if not isinstance(variable, DateVar):
+                raise ValueError('"variable" argument must be a DateVar')
+        else:
+            variable = DateVar(master, value=datetime.date.today())
+
+        pattern = tks.locales.get_locale_info(locale).date_pattern
+
+        for ch in pattern:
+            if ch.lower() not in ['d', 'm', 'y']:
+                separator = ch
+                break
+
+        mask = []
+        for elem in pattern.split(separator):
+            if mask:
+                mask.append(separator)
+
+            if 'y' in elem:
+                mask.append(('year', 4))
+            elif 'M' in elem:
+                mask.append(('month', 2))
+            elif 'd' in elem:
+                mask.append(('day', 2))
+
+        self._locale = locale
+
+        if not fonts:
+            fonts = tks.load_fonts()
+
+        self.fonts = fonts
+
+        super(CompactDateEntry, self).__init__(master, variable, mask,
+                                               font=fonts.text)
+
+    def _split(self, value):
+        return {'year': value.year, 'month': value.month, 'day': value.day}
+
+    def _join(self, values):
+        return self._variable.get().replace(year=values['year'],
+                                            month=values['month'],
+                                            day=values['day'])
+
+    def _limits(self, name, values):
+        if name == 'year':
+            return (datetime.MINYEAR, datetime.MAXYEAR)
+        elif name == 'month':
+            return (1, 12)
+        elif 'year' in values and 'month' in values:
+            return (1, calendar.monthrange(values['year'],
+                                           values['month'])[1])
+        else:
+            return (1, 31)
+
+    def _popup(self, event=None):
+        """Display the date selection dialog"""
+
+        dlg = DateDialog(self,
+                         _('Select a Date...'),
+                         start_date=self.value,
+                         locale=self._locale,
+                         fonts=self.fonts)
+        self.wait_window(dlg)
+        if dlg.date is not None:
+            self.value = dlg.date
+
+        return 'break'
+
+
 class DateDialog(tks.dialog.Dialog):
     """Display a dialog to obtain a date from the user
 
@@ -322,9 +431,6 @@ class DateDialog(tks.dialog.Dialog):
         if not colors:
             colors = tks.load_colors()
 
-        if babel and not isinstance(locale, babel.Locale):
-            locale = babel.Locale(locale)
-
         self.selector = DateSelector(self, start_date,
                                      locale=locale,
                                      target_type=target_type,
@@ -385,25 +491,21 @@ class DateSelector(ttk.Frame, object):
         if not colors:
             colors = tks.load_colors()
 
-        today = datetime.date.today()
-        if babel:
-            if not isinstance(locale, babel.Locale):
-                locale = babel.Locale(locale)
+        locale = tks.locales.get_locale_info(locale)
 
-            today_txt = babel.dates.format_date(today, 'long', locale)
-        else:
-            today_txt = today.strftime('%Y-%m-%d')
-
-        ttk.Style().configure('Selector.tks.TButton',
-                              font=fonts.text,
-                              anchor=tk.CENTER)
-        ttk.Style().configure('Selector.tks.TLabel',
-                              font=fonts.text,
-                              anchor=tk.CENTER)
-        ttk.Style().configure('Month.Selector.tks.TButton',
-                              padding=(0, 10))
-        ttk.Style().configure('Year.Selector.tks.TButton',
-                              padding=(0, 10))
+        today = datetime.date.today()
+        today_txt = locale.format_date(today, 'long')
+
+        configure_style(self, 'Selector.tks.TButton',
+                        font=fonts.text,
+                        anchor=tk.CENTER)
+        configure_style(self, 'Selector.tks.TLabel',
+                        font=fonts.text,
+                        anchor=tk.CENTER)
+        configure_style(self, 'Month.Selector.tks.TButton',
+                        padding=(0, 10))
+        configure_style(self, 'Year.Selector.tks.TButton',
+                        padding=(0, 10))
 
         self._today_btn = ttk.Button(self, text=today_txt,
                                      width=len(today_txt) + 4,
@@ -492,7 +594,10 @@ class DateSelector(ttk.Frame, object):
         self._ds.grid(row=1, column=0, sticky=(tk.N, tk.EW), padx=3, pady=3)
 
     def day_selected(self):
-        self.date = self._ds.date
+        # The day selector has already drawn the date and calls
+        # new_month_selected when the month changes, which is the only time
+        # the month and year selectors need updating before they are shown.
+        self._date = self._ds.date
 
     def month_btn_clicked(self, event):
         self._prev_selector = self._ds
@@ -553,8 +658,7 @@ class DaySelector(ttk.Frame, object):
         self._master = master
         super(DaySelector, self).__init__(master, style='tks.TFrame')
 
-        self._canvas_color = ttk.Style(master).lookup('tks.TFrame',
-                                                      'background')
+        self._canvas_color = lookup_style(self, 'tks.TFrame', 'background')
 
         if fonts:
             self.fonts = fonts
@@ -574,34 +678,25 @@ class DaySelector(ttk.Frame, object):
         else:
             self._date = start_date
 
-        if babel:
-            if not isinstance(locale, babel.Locale):
-                locale = babel.Locale(locale)
-
-            self._first_week_day = locale.first_week_day
-            self._days = locale.days['format']['abbreviated']
-            self._months = locale.months['format']['wide']
-            self._locale = locale
-        else:
-            self._first_week_day = calendar.MONDAY
-            self._days = calendar.day_abbr
-            self._months = calendar.month_name
-
-        self._calendar = calendar.LocaleTextCalendar(self._first_week_day, '')
+        self._locale = tks.locales.get_locale_info(locale)
+        self._first_week_day = self._locale.first_week_day
+        self._days = self._locale.day_names
+        self._months = self._locale.month_names
 
         self._selected_tgt = ''
+        self._pending_months = 0
+        self._pending_after = None
 
-        self._font = tkf.Font(font=fonts.text)
-        family = self._font.actual('family')
-        size = self._font.actual('size')
-        self._font_bold = tkf.Font(font=(family, size, tkf.BOLD))
+        self._font = get_font(self, fonts.text)
+        self._font_bold = get_font(self, fonts.text, weight=tkf.BOLD)
 
         self._header = ttk.Frame(self, padding=(3, 0), style='tks.TFrame')
 
         self._prev_btn = ttk.Button(self._header, text='<', width=2,
-                                    command=self._prev_month,
                                     style='Selector.tks.TButton')
         self._prev_btn.grid(row=0, column=0, sticky=tk.W)
+        self._prev_repeat = AutoRepeat(self._prev_btn, self._prev_month,
+                                       accelerated_step=12)
 
         self._month_btn = ttk.Button(self._header,
                                      style='Selector.tks.TButton')
@@ -616,9 +711,10 @@ class DaySelector(ttk.Frame, object):
                             self._master.year_btn_clicked)
 
         self._next_btn = ttk.Button(self._header, text='>', width=2,
-                                    command=self._next_month,
                                     style='Selector.tks.TButton')
         self._next_btn.grid(row=0, column=3, sticky=tk.W)
+        self._next_repeat = AutoRepeat(self._next_btn, self._next_month,
+                                       accelerated_step=12)
 
         self._header.columnconfigure(0, weight=0)
         self._header.columnconfigure(1, weight=1)
@@ -626,24 +722,52 @@ class DaySelector(ttk.Frame, object):
         self._header.columnconfigure(3, weight=0)
         self._header.grid(row=0, column=0, sticky=tk.EW)
 
-        self._canvas = tk.Canvas(self, background=self._canvas_color)
+        self._canvas = tk.Canvas(self, background=self._canvas_color,
+                                 takefocus=True)
         self._canvas.grid(row=1, column=0, columnspan=3, pady=(4, 0))
         self._create_canvas(target_type)
 
+        # Mouse wheel for Windows first then other systems.
+        self._canvas.bind('<MouseWheel>', self._mouse_wheel)
+        self._canvas.bind('<Button-4>', self._mouse_wheel)
+        self._canvas.bind('<Button-5>', self._mouse_wheel)
+
         self.columnconfigure(0, weight=1)
 
         self._today_tag = None
         self._update_canvas()
         self._fill_target()
 
+        for key in ['<Up>', '<Down>', '<Left>', '<Right>',
+                    '<Prior>', '<Next>', '<Home>', '<End>']:
+            self._canvas.bind(key, self._keysym_press)
+
     @property
     def date(self):
         return self._date
 
     @date.setter
     def date(self, value):
+        self._cancel_pending_months()
+        self._select_date(value)
+
+    def destroy(self):
+        self._cancel_pending_months()
+        self._prev_repeat.cancel()
+        self._next_repeat.cancel()
+        super(DaySelector, self).destroy()
+
+    def _select_date(self, value):
+        """Select a date. If the date is in the month being displayed only
+        the old and new targets are redrawn."""
+
+        same_month = (value.year, value.month) == self._displayed_month()
         self._date = value
-        self._update_canvas()
+
+        if same_month and self._selected_tgt:
+            self._fill_target()
+        else:
+            self._update_canvas()
 
     def _create_canvas(self, target_type):
         days = []
@@ -651,16 +775,13 @@ class DaySelector(ttk.Frame, object):
             day_idx = (self._first_week_day + idx) % 7
             days.append(self._days[day_idx])
 
-        font_info = tkf.Font(font=self._font)
+        font_info = self._font
         item_width = max(font_info.measure(day) for day in days) + 4
         linespace = font_info.metrics('linespace')
         item_height = linespace + 4
 
         if target_type == TargetShape.Circle:
-            if babel:
-                num = babel.numbers.format_number(99, self._locale)
-            else:
-                num = '99'
+            num = self._locale.number(99)
 
             circle_diameter = font_info.measure(num) * 2.25
             circle_radius = circle_diameter / 2.0
@@ -680,12 +801,20 @@ class DaySelector(ttk.Frame, object):
         x_pos = x_start
         y_pos = y_start
 
+        # The geometry of the day cells is kept so that a mouse position can
+        # be mapped directly to a cell.
+        self._x_stride = x_stride
+        self._y_stride = y_stride
+        self._cells_left = x_start - (x_stride / 2)
+        self._cells_top = y_start + (y_stride / 2)
+
         rect_width = x_stride * 6.5
         self._canvas.create_rectangle(
             (x_start - half_width, y_start - half_height,
              x_start + rect_width, y_start + half_height),
             fill=self.colors.header,
-            outline='')
+            outline='',
+            tags='header')
 
         for day in days:
             self._canvas.create_text((x_pos, y_pos), text=day,
@@ -724,44 +853,79 @@ class DaySelector(ttk.Frame, object):
                                          font=self._font,
                                          anchor=tk.CENTER)
 
-                self._canvas.tag_bind(day_tag, '<Button-1>', self._date_clicked)
-
                 x_pos += x_stride
             y_pos += y_stride
 
         self._canvas.configure(width=x_pos - (x_stride / 2),
                                height=y_pos - (y_stride / 2))
 
-    def _date_clicked(self, event):
-        x = self._canvas.canvasx(event.x)
-        y = self._canvas.canvasy(event.y)
+        self._hover_tgt = ''
+        self._canvas.bind('<Button-1>', self._date_clicked)
+        self._canvas.bind('<Motion>', self._motion)
+        self._canvas.bind('<Leave>', self._leave)
+        self.bind(CONFIG_CHANGED, self._config_changed)
 
-        items = self._canvas.find_closest(x, y)
-        tags = self._canvas.gettags(items[0])
+    def _cell_at(self, x, y):
+        """Return the (week, day) of the cell at a canvas position or None
+        if the position is outside the day cells."""
 
-        for tag in tags:
-            if tag.startswith('day'):
-                break
+        day_number = int((x - self._cells_left) // self._x_stride)
+        week_number = int((y - self._cells_top) // self._y_stride)
+
+        if 0 <= day_number < 7 and 0 <= week_number < 6:
+            return week_number, day_number
         else:
-            return
+            return None
 
-        txt_tag = 'txt%s' % tag[3:]
-        tgt_tag = 'tgt%s' % tag[3:]
+    def _motion(self, event):
+        """Highlight the cell under the mouse pointer"""
 
-        if self._selected_tgt:
-            self._canvas.itemconfig(self._selected_tgt,
-                                    fill='')
+        cell = self._cell_at(self._canvas.canvasx(event.x),
+                             self._canvas.canvasy(event.y))
 
-        self._canvas.itemconfig(tgt_tag,
-                                fill=self.colors.select)
+        if cell is None:
+            tgt_tag = ''
+        else:
+            tgt_tag = 'tgt%d:%d' % cell
 
-        week_number, day_number = [int(x) for x in txt_tag[3:].split(':')]
-        self._date = self._get_date(week_number, day_number)
+        if tgt_tag != self._hover_tgt:
+            if self._hover_tgt:
+                self._canvas.itemconfig(self._hover_tgt, outline='')
 
-        self._selected_tgt = tgt_tag
+            if tgt_tag:
+                self._canvas.itemconfig(tgt_tag,
+                                        outline=self.colors.select_dark)
+
+            self._hover_tgt = tgt_tag
+
+    def _leave(self, event):
+        if self._hover_tgt:
+            self._canvas.itemconfig(self._hover_tgt, outline='')
+            self._hover_tgt = ''
+
+    def _date_clicked(self, event):
+        self._canvas.focus_set()
 
+        cell = self._cell_at(self._canvas.canvasx(event.x),
+                             self._canvas.canvasy(event.y))
+        if cell is None:
+            return
+
+        d = self._get_date(*cell)
+        month_changed = (d.year, d.month) != self._displayed_month()
+        self._select_date(d)
+
+        if month_changed:
+            self._master.new_month_selected(self._date)
         self._master.day_selected()
 
+    def _config_changed(self, event):
+        """Redraw with the colors from a changed `.tksrc` file."""
+
+        self._canvas.itemconfigure('header', fill=self.colors.header)
+        self._update_canvas()
+
+    @timed('DaySelector._update_canvas')
     def _update_canvas(self):
         """Redraw the calendar"""
 
@@ -769,34 +933,17 @@ class DaySelector(ttk.Frame, object):
         self._month_btn['text'] = '%s' % month_txt
         self._year_btn['text'] = '%s' % str(self._date.year)
 
-        self._days = list(self._calendar.monthdatescalendar(self._date.year,
-                                                            self._date.month))
-
-        # We display 6 weeks of days but some months only have 5 weeks in
-        # them this means the calendar doesn't have the required number of rows
-        # so we add another
-        if len(self._days) == 5:
-            d = self._days[4][-1]
-            delta = datetime.timedelta(days=1)
-
-            missing_days = []
-            for day_number in range(7):
-                d += delta
-                missing_days.append(d)
-
-            self._days.append(missing_days)
+        self._days = self._month_grid(self._date.year, self._date.month)
 
         if self._selected_tgt:
             self._canvas.itemconfig(self._selected_tgt, fill='')
+            self._selected_tgt = ''
 
         for week_number, days_in_week in enumerate(self._days):
             for day_number, date_ in enumerate(days_in_week):
                 txt_tag = 'txt%d:%d' % (week_number, day_number)
 
-                if babel:
-                    text = babel.numbers.format_number(date_.day, self._locale)
-                else:
-                    text = str(date_.day)
+                text = self._locale.number(date_.day)
 
                 if self._date.month == date_.month:
                     self._canvas.itemconfigure(txt_tag,
@@ -810,23 +957,73 @@ class DaySelector(ttk.Frame, object):
 
                 tgt_tag = 'tgt%s:%s' % (week_number, day_number)
 
-                if self._selected_tgt and tgt_tag == self._selected_tgt:
-                    self._canvas.itemconfig(self._selected_tgt, fill='')
-
                 if date_ == self._date:
                     self._canvas.itemconfig(tgt_tag,
                                             fill=self.colors.select)
                     self._selected_tgt = tgt_tag
 
-    def _next_month(self):
-        self._date = next_month(self._date)
-        self._master.new_month_selected(self._date)
-        self._update_canvas()
+    def _month_grid(self, year, month):
+        """Return the 6 weeks of dates displayed for a month."""
 
-    def _prev_month(self):
-        self._date = prev_month(self._date)
-        self._master.new_month_selected(self._date)
-        self._update_canvas()
+        return month_grid(year, month, self._first_week_day)
+
+    def _prefetch_months(self):
+        """Calculate the grids for the months either side of the one being
+        displayed."""
+
+        for count in (1, -1):
+            index = _month_index(self._date) + count
+            if _FIRST_CALENDAR_MONTH <= index <= _LAST_CALENDAR_MONTH:
+                d = add_months(self._date, count)
+                self._month_grid(d.year, d.month)
+
+    def _next_month(self, step=1):
+        return self._page_months(step)
+
+    def _prev_month(self, step=1):
+        return self._page_months(-step)
+
+    def _page_months(self, count):
+        """Move the calendar by a number of months.
+
+        Moves requested before Tk next becomes idle are combined so only the
+        final month is drawn. Returns False once the first or last month
+        which can be displayed has been reached.
+        """
+
+        current = _month_index(self._date)
+        target = min(max(current + self._pending_months + count,
+                         _FIRST_CALENDAR_MONTH), _LAST_CALENDAR_MONTH)
+        self._pending_months = target - current
+        if self._pending_after is None:
+            self._pending_after = self.after_idle(self._apply_pending_months)
+
+        return _FIRST_CALENDAR_MONTH < target < _LAST_CALENDAR_MONTH
+
+    def _apply_pending_months(self):
+        self._pending_after = None
+        count = self._pending_months
+        self._pending_months = 0
+
+        if count:
+            self._date = add_months(self._date, count)
+            self._master.new_month_selected(self._date)
+            self._update_canvas()
+            self._prefetch_months()
+
+    def _cancel_pending_months(self):
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+            self._pending_after = None
+        self._pending_months = 0
+
+    def _mouse_wheel(self, event):
+        """Respond to the mouse scroll wheel by changing the month"""
+
+        if event.num == 4 or event.delta > 0:
+            self._prev_month()
+        else:
+            self._next_month()
 
     def _select_today(self):
         self._date = datetime.date.today()
@@ -835,6 +1032,13 @@ class DaySelector(ttk.Frame, object):
     def _get_date(self, week_number, day_number):
         return self._days[week_number][day_number]
 
+    def _displayed_month(self):
+        """Return the (year, month) of the calendar being displayed. The
+        third week is always entirely within the month."""
+
+        d = self._days[2][0]
+        return d.year, d.month
+
     def _find_date_position(self, d):
         for week_number, week in enumerate(self._days):
             for day_number, day in enumerate(week):
@@ -842,13 +1046,78 @@ class DaySelector(ttk.Frame, object):
                     return (week_number, day_number)
 
     def _fill_target(self):
-        tgt_tag = 'tgt%d:%d' % self._find_date_position(self._date)
+        """Move the target to the selected date"""
+
+        position = self._find_date_position(self._date)
+        if position is None:
+            return
+
+        tgt_tag = 'tgt%d:%d' % position
+        if tgt_tag == self._selected_tgt:
+            return
+
+        if self._selected_tgt:
+            self._canvas.itemconfig(self._selected_tgt, fill='')
 
         self._canvas.itemconfig(tgt_tag,
                                 fill=self.colors.select)
 
         self._selected_tgt = tgt_tag
 
+    def _keysym_press(self, event):
+        """Respond to the arrow, Page Up/Down, Home and End keys.
+
+        Shift with Page Up/Down moves by a year.
+        """
+
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+            self._apply_pending_months()
+
+        keysym = event.keysym
+        d = self._date
+
+        try:
+            if keysym == 'Left':
+                d -= datetime.timedelta(days=1)
+            elif keysym == 'Right':
+                d += datetime.timedelta(days=1)
+            elif keysym == 'Up':
+                d -= datetime.timedelta(days=7)
+            elif keysym == 'Down':
+                d += datetime.timedelta(days=7)
+            elif keysym in ('Prior', 'Next'):
+                months = 12 if event.state & 0x1 else 1
+                if keysym == 'Prior':
+                    months = -months
+                current = _month_index(d)
+                target = min(max(current + months, _FIRST_CALENDAR_MONTH),
+                             _LAST_CALENDAR_MONTH)
+                d = add_months(d, target - current)
+            elif keysym == 'Home':
+                d = d.replace(day=1)
+            elif keysym == 'End':
+                d = d.replace(day=calendar.monthrange(d.year, d.month)[1])
+            else:
+                return
+        except OverflowError:
+            return 'break'
+
+        # Stay within the months which the calendar can display
+        if not (_FIRST_CALENDAR_MONTH <= _month_index(d) <=
+                _LAST_CALENDAR_MONTH):
+            return 'break'
+
+        month_changed = (d.year != self._date.year or
+                         d.month != self._date.month)
+        self._select_date(d)
+
+        if month_changed:
+            self._master.new_month_selected(self._date)
+        self._master.day_selected()
+
+        return 'break'
+
 
 class MonthSelector(ttk.Frame, object):
     """
@@ -863,19 +1132,13 @@ class MonthSelector(ttk.Frame, object):
         self._master = master
         self._date = None
 
-        if babel:
-            if not isinstance(locale, babel.Locale):
-                locale = babel.Locale(locale)
-
-            self._months = locale.months['format']['wide']
-        else:
-            self._months = calendar.month_name
-
+        self._months = tks.locales.get_locale_info(locale).month_names
 
         self._prev_btn = ttk.Button(self, text='<', width=2,
-                                    command=self._prev_year,
                                     style='Selector.tks.TButton')
         self._prev_btn.grid(row=0, column=0, sticky=tk.W, padx=(0, 4))
+        self._prev_repeat = AutoRepeat(self._prev_btn, self._prev_year,
+                                       accelerated_step=10)
 
         self._year_btn = ttk.Button(self,
                                     style='Selector.tks.TButton')
@@ -884,9 +1147,10 @@ class MonthSelector(ttk.Frame, object):
                             self._master.year_btn_clicked)
 
         self._next_btn = ttk.Button(self, text='>', width=2,
-                                    command=self._next_year,
                                     style='Selector.tks.TButton')
         self._next_btn.grid(row=0, column=2, sticky=tk.E, padx=(4, 0))
+        self._next_repeat = AutoRepeat(self._next_btn, self._next_year,
+                                       accelerated_step=10)
 
         btn_frame = ttk.Frame(self, style='tks.TFrame')
         self._buttons = []
@@ -929,11 +1193,13 @@ class MonthSelector(ttk.Frame, object):
             else:
                 self._buttons[month - 1]['default'] = tk.DISABLED
 
-    def _prev_year(self):
-        self.date = prev_year(self.date)
+    def _prev_year(self, step=1):
+        self.date = next_year(self.date, -step)
+        return self.date.year > datetime.MINYEAR
 
-    def _next_year(self):
-        self.date = next_year(self.date)
+    def _next_year(self, step=1):
+        self.date = next_year(self.date, step)
+        return self.date.year < datetime.MAXYEAR
 
     def _btn_selected(self, month):
         self.date = set_month(self.date, month)
@@ -947,9 +1213,10 @@ class YearSelector(ttk.Frame, object):
 
         self._date = None
         self._prev_btn = ttk.Button(self, text='<', width=2,
-                                    command=self._prev_decade,
                                     style='Selector.tks.TButton')
         self._prev_btn.grid(row=0, column=0, sticky=tk.W, padx=(0, 4))
+        self._prev_repeat = AutoRepeat(self._prev_btn, self._prev_decade,
+                                       accelerated_step=10)
 
         self._year_btn = ttk.Label(self,
                                    style='Selector.tks.TLabel')
@@ -957,9 +1224,10 @@ class YearSelector(ttk.Frame, object):
         # self._year_btn.bind('<Button-1>', self.year_btn_clicked)
 
         self._next_btn = ttk.Button(self, text='>', width=2,
-                                    command=self._next_decade,
                                     style='Selector.tks.TButton')
         self._next_btn.grid(row=0, column=2, sticky=tk.E, padx=(4, 0))
+        self._next_repeat = AutoRepeat(self._next_btn, self._next_decade,
+                                       accelerated_step=10)
 
         btn_frame = ttk.Frame(self, style='tks.TFrame')
         self._buttons = []
@@ -991,11 +1259,21 @@ class YearSelector(ttk.Frame, object):
     def _update(self):
         year = self._date.year
         year_range = (year - 5, year + 6)
-        self._year_btn['text'] = '%d - %d' % year_range
+        self._year_btn['text'] = '%d - %d' % (
+            max(year_range[0], datetime.MINYEAR),
+            min(year_range[1], datetime.MAXYEAR))
 
         year_in_range = False
         for idx, year in enumerate(range(year_range[0], year_range[1] + 1)):
             btn = self._buttons[idx]
+            if not datetime.MINYEAR <= year <= datetime.MAXYEAR:
+                btn['text'] = ''
+                btn['command'] = ''
+                btn['default'] = tk.DISABLED
+                btn.state(['disabled'])
+                continue
+
+            btn.state(['!disabled'])
             btn['text'] = '%d' % year
             btn['command'] = partial(self._btn_selected, year)
 
@@ -1009,19 +1287,462 @@ class YearSelector(ttk.Frame, object):
         if not year_in_range:
             self.unbind('<space>')
 
-    def _prev_decade(self):
-        self.date = prev_decade(self.date)
-        self._update()
+    def _prev_decade(self, step=1):
+        self.date = next_year(self.date, -10 * step)
+        return self.date.year > datetime.MINYEAR
 
-    def _next_decade(self):
-        self.date = next_decade(self.date)
-        self._update()
+    def _next_decade(self, step=1):
+        self.date = next_year(self.date, 10 * step)
+        return self.date.year < datetime.MAXYEAR
 
     def _btn_selected(self, year):
         self.date = set_year(self.date, year)
         self._master.year_selected()
 
 
+class DateRangeSelector(ttk.Frame, object):
+    """A widget which displays a number of consecutive months side by side and
+    allows a range of dates to be selected.
+
+    The first click selects the start of the range, the second the end. A
+    further click starts a new range.
+
+    All months are drawn on a single canvas and the position of every day
+    cell is calculated once when the widget is created.
+
+    :param master: The master frame
+    :type master:  :class:`ttk.Frame`
+    :param start_date: A date within the first month to display or None
+                       for the current month.
+    :type start_date:  :class:`datetime.date`
+    :param months: The number of months to display
+    :type months:  int
+    :param columns: The number of months to display on each row. If None
+                    then all months are displayed on a single row.
+    :type columns:  int
+    :param locale: Determines the day and month names.
+                   Either a locale name e.g. 'en' or a babel Locale
+                   instance. If :mod:`babel` is not installed ISO 8601
+                   format will be used.
+    :type locale:  str or :class:`babel.Locale <babel.core.Locale>`
+    :param fonts: Font definitions to use
+    :type fonts: :class:`~tks.DefaultFonts`
+    :param colors:    Colors to use.
+    :type colors:      :class:`~tks.DefaultColors`
+    :param command: A function which is called with the start and end dates
+                    whenever the selected range changes.
+    """
+
+    def __init__(self, master,
+                 start_date=None,
+                 months=3,
+                 columns=None,
+                 locale='en',
+                 fonts=None,
+                 colors=None,
+                 command=None):
+        super(DateRangeSelector, self).__init__(master, style='tks.TFrame')
+
+        if not fonts:
+            fonts = tks.load_fonts()
+
+        if not colors:
+            colors = tks.load_colors()
+
+        self.fonts = fonts
+        self.colors = colors
+        self._range_color = _range_tint(colors.select)
+
+        self._command = command
+        self._month_count = max(1, int(months))
+        self._columns = min(columns or self._month_count, self._month_count)
+        self._rows = int(math.ceil(self._month_count / self._columns))
+
+        self._locale = tks.locales.get_locale_info(locale)
+        self._first_week_day = self._locale.first_week_day
+
+        if start_date is None:
+            start_date = datetime.date.today()
+
+        self._date = start_date.replace(day=1)
+        self._start = None
+        self._end = None
+        self._grids = []
+        self._cell_state = {}
+        self._pending_months = 0
+        self._pending_after = None
+
+        self._canvas_color = lookup_style(self, 'tks.TFrame', 'background')
+        self._font = get_font(self, fonts.text)
+
+        header = ttk.Frame(self, padding=(3, 0), style='tks.TFrame')
+        self._prev_btn = ttk.Button(header, text='<', width=2,
+                                    style='Selector.tks.TButton')
+        self._prev_btn.grid(row=0, column=0, sticky=tk.W)
+        self._prev_repeat = AutoRepeat(self._prev_btn, self._prev_month,
+                                       accelerated_step=12)
+
+        self._next_btn = ttk.Button(header, text='>', width=2,
+                                    style='Selector.tks.TButton')
+        self._next_btn.grid(row=0, column=2, sticky=tk.E)
+        self._next_repeat = AutoRepeat(self._next_btn, self._next_month,
+                                       accelerated_step=12)
+
+        header.columnconfigure(1, weight=1)
+        header.grid(row=0, column=0, sticky=tk.EW)
+
+        self._canvas = tk.Canvas(self, background=self._canvas_color,
+                                 highlightthickness=0)
+        self._canvas.grid(row=1, column=0, pady=(4, 0))
+        self._create_canvas()
+
+        self._canvas.bind('<Button-1>', self._canvas_clicked)
+        # Mouse wheel for Windows first then other systems.
+        self._canvas.bind('<MouseWheel>', self._mouse_wheel)
+        self._canvas.bind('<Button-4>', self._mouse_wheel)
+        self._canvas.bind('<Button-5>', self._mouse_wheel)
+        self.bind(CONFIG_CHANGED, self._config_changed)
+
+        self.columnconfigure(0, weight=1)
+
+        self._update_canvas()
+
+    @property
+    def date(self):
+        """The first day of the first month displayed."""
+
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        self._cancel_pending_months()
+        self._date = value.replace(day=1)
+        self._update_canvas()
+
+    @property
+    def start(self):
+        """The first date in the selected range or None."""
+
+        return self._start
+
+    @property
+    def end(self):
+        """The last date in the selected range or None."""
+
+        return self._end
+
+    @property
+    def range(self):
+        """The selected range as a (start, end) tuple."""
+
+        return self._start, self._end
+
+    @range.setter
+    def range(self, value):
+        start, end = value
+        if start and end and end < start:
+            start, end = end, start
+
+        self._start = start
+        self._end = end
+        self._update_range()
+
+    def destroy(self):
+        self._cancel_pending_months()
+        self._prev_repeat.cancel()
+        self._next_repeat.cancel()
+        super(DateRangeSelector, self).destroy()
+
+    def _create_canvas(self):
+        """Create the items for every month and calculate the cell
+        geometry."""
+
+        days = []
+        for idx in range(7):
+            day_idx = (self._first_week_day + idx) % 7
+            days.append(self._locale.day_names[day_idx])
+
+        item_width = max(self._font.measure(day) for day in days) + 4
+        item_width = max(item_width,
+                         self._font.measure(self._locale.number(99)) + 8)
+        linespace = self._font.metrics('linespace')
+        item_height = linespace + 4
+
+        self._x_stride = item_width
+        self._y_stride = item_height + 2
+        self._title_height = self._y_stride + 4
+        self._header_height = self._y_stride
+        self._month_width = self._x_stride * 7
+        self._month_height = self._title_height + self._header_height + \
+                             (self._y_stride * 6)
+        self._month_gap = self._x_stride
+
+        self._titles = []
+        self._cells = []
+        for month_idx in range(self._month_count):
+            x0, y0 = self._month_origin(month_idx)
+
+            title = self._canvas.create_text(
+                (x0 + (self._month_width / 2), y0 + (self._title_height / 2)),
+                font=self._font,
+                anchor=tk.CENTER)
+            self._titles.append(title)
+
+            y_pos = y0 + self._title_height
+            self._canvas.create_rectangle(
+                (x0, y_pos, x0 + self._month_width,
+                 y_pos + self._header_height - 2),
+                fill=self.colors.header,
+                outline='',
+                tags='header')
+
+            for day_number, day in enumerate(days):
+                x_pos = x0 + (day_number * self._x_stride) + \
+                        (self._x_stride / 2)
+                self._canvas.create_text((x_pos, y_pos + (item_height / 2)),
+                                         text=day,
+                                         font=self._font,
+                                         anchor=tk.CENTER)
+
+            y_pos += self._header_height
+
+            cells = []
+            for week_number in range(6):
+                for day_number in range(7):
+                    x_pos = x0 + (day_number * self._x_stride)
+                    rect = (x_pos, y_pos, x_pos + self._x_stride,
+                            y_pos + item_height)
+                    rect_id = self._canvas.create_rectangle(rect,
+                                                            fill='',
+                                                            outline='')
+                    text_id = self._canvas.create_text(
+                        tks.rect_center(rect),
+                        font=self._font,
+                        anchor=tk.CENTER)
+                    cells.append((rect_id, text_id))
+
+                y_pos += self._y_stride
+
+            self._cells.append(cells)
+
+        width = (self._columns * self._month_width) + \
+                ((self._columns - 1) * self._month_gap)
+        height = (self._rows * self._month_height) + \
+                 ((self._rows - 1) * self._y_stride)
+        self._canvas.configure(width=width, height=height)
+
+    def _month_origin(self, month_idx):
+        """Return the top left position of a month on the canvas."""
+
+        row, column = divmod(month_idx, self._columns)
+        x = column * (self._month_width + self._month_gap)
+        y = row * (self._month_height + self._y_stride)
+        return x, y
+
+    def _cell_at(self, x, y):
+        """Return the (month index, week, day) of the cell at a canvas
+        position or None if there is no cell there."""
+
+        block_width = self._month_width + self._month_gap
+        block_height = self._month_height + self._y_stride
+        column = int(x // block_width)
+        row = int(y // block_height)
+        if column < 0 or column >= self._columns or row < 0:
+            return None
+
+        month_idx = (row * self._columns) + column
+        if month_idx >= self._month_count:
+            return None
+
+        x = x - (column * block_width)
+        y = y - (row * block_height) - self._title_height - \
+            self._header_height
+        if x < 0 or x >= self._month_width or y < 0 or \
+           y >= self._y_stride * 6:
+            return None
+
+        return month_idx, int(y // self._y_stride), int(x // self._x_stride)
+
+    @timed('DateRangeSelector._update_canvas')
+    def _update_canvas(self):
+        """Redraw every month."""
+
+        self._grids = []
+        d = self._date
+        for month_idx in range(self._month_count):
+            grid = month_grid(d.year, d.month, self._first_week_day)
+            self._grids.append((d.month, grid))
+
+            self._canvas.itemconfigure(self._titles[month_idx],
+                                       text='%s %d' % (
+                                           self._locale.month_names[d.month],
+                                           d.year))
+
+            cells = self._cells[month_idx]
+            for week_number, days_in_week in enumerate(grid):
+                for day_number, date_ in enumerate(days_in_week):
+                    text_id = cells[(week_number * 7) + day_number][1]
+                    if date_.month == d.month:
+                        text = self._locale.number(date_.day)
+                    else:
+                        text = ''
+
+                    self._canvas.itemconfigure(text_id, text=text)
+
+            d = add_months(d, 1)
+
+        self._cell_state = {}
+        self._update_range()
+
+    def _config_changed(self, event):
+        """Redraw with the colors from a changed `.tksrc` file."""
+
+        self._range_color = _range_tint(self.colors.select)
+        self._canvas.itemconfigure('header', fill=self.colors.header)
+        self._update_range()
+
+    def _update_range(self):
+        """Recolor the cells whose range state has changed."""
+
+        start = self._start
+        end = self._end or start
+
+        new_state = {}
+        if start:
+            for month_idx, (month, grid) in enumerate(self._grids):
+                if grid[0][0] > end or grid[-1][-1] < start:
+                    continue
+
+                for week_number, days_in_week in enumerate(grid):
+                    for day_number, date_ in enumerate(days_in_week):
+                        if date_.month != month or \
+                           date_ < start or date_ > end:
+                            continue
+
+                        if date_ == start or date_ == end:
+                            state = self.colors.select
+                        else:
+                            state = self._range_color
+
+                        idx = (week_number * 7) + day_number
+                        new_state[(month_idx, idx)] = state
+
+        for key in set(self._cell_state) | set(new_state):
+            fill = new_state.get(key, '')
+            if self._cell_state.get(key, '') != fill:
+                month_idx, idx = key
+                self._canvas.itemconfigure(self._cells[month_idx][idx][0],
+                                           fill=fill)
+
+        self._cell_state = new_state
+
+    def _canvas_clicked(self, event):
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
+
+        cell = self._cell_at(x, y)
+        if cell is None:
+            return
+
+        month_idx, week_number, day_number = cell
+        month, grid = self._grids[month_idx]
+        date_ = grid[week_number][day_number]
+        if date_.month != month:
+            return
+
+        if self._start is None or self._end is not None:
+            self.range = (date_, None)
+        else:
+            self.range = (self._start, date_)
+
+        if self._command:
+            self._command(self._start, self._end)
+
+    def _next_month(self, step=1):
+        return self._page_months(step)
+
+    def _prev_month(self, step=1):
+        return self._page_months(-step)
+
+    def _page_months(self, count):
+        """Move the calendar by a number of months.
+
+        Moves requested before Tk next becomes idle are combined so only the
+        final months are drawn. Returns False once the first or last month
+        which can be displayed has been reached.
+        """
+
+        current = _month_index(self._date)
+        target = min(max(current + self._pending_months + count,
+                         _FIRST_CALENDAR_MONTH), _LAST_CALENDAR_MONTH)
+        self._pending_months = target - current
+        if self._pending_after is None:
+            self._pending_after = self.after_idle(self._apply_pending_months)
+
+        return _FIRST_CALENDAR_MONTH < target < _LAST_CALENDAR_MONTH
+
+    def _apply_pending_months(self):
+        self._pending_after = None
+        count = self._pending_months
+        self._pending_months = 0
+
+        if count:
+            self._date = add_months(self._date, count)
+            self._update_canvas()
+
+    def _cancel_pending_months(self):
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+            self._pending_after = None
+        self._pending_months = 0
+
+    def _mouse_wheel(self, event):
+        """Respond to the mouse scroll wheel by changing the month"""
+
+        if event.num == 4 or event.delta > 0:
+            self._prev_month()
+        else:
+            self._next_month()
+
+
+def month_grid(year, month, first_week_day=calendar.MONDAY):
+    """Return the 6 weeks of dates displayed by a calendar for a month as a
+    tuple of 6 tuples of 7 dates.
+
+    Grids are cached so that paging back and forth between months does not
+    need to recalculate them.
+    """
+
+    key = (year, month, first_week_day)
+    try:
+        grid = _grid_cache.pop(key)
+    except KeyError:
+        cal = calendar.Calendar(first_week_day)
+        weeks = cal.monthdatescalendar(year, month)
+
+        # We display 6 weeks of days but some months only have 4 or 5 weeks
+        # in them this means the calendar doesn't have the required number
+        # of rows so we add more
+        delta = datetime.timedelta(days=1)
+        while len(weeks) < 6:
+            d = weeks[-1][-1]
+
+            missing_days = []
+            for day_number in range(7):
+                d += delta
+                missing_days.append(d)
+
+            weeks.append(missing_days)
+
+        grid = tuple([tuple(week) for week in weeks])
+
+    _grid_cache[key] = grid
+    while len(_grid_cache) > GRID_CACHE_SIZE:
+        _grid_cache.popitem(last=False)
+
+    return grid
+
+
 def set_month(d, month):
     try:
         return d.__class__(year=d.year, month=month, day=d.day)
@@ -1075,14 +1796,47 @@ def prev_month(d):
             datetime.timedelta(days=1)
 
 
+def _range_tint(select):
+    """Return the color of the days between the start and end of a range,
+    a tint of the `select` color."""
+
+    select_rgb = tks.color_funcs.hex_string_to_rgb(select)
+    if select_rgb:
+        return tks.color_funcs.rgb_to_hex_string(
+            tks.color_funcs.rgb_tint(select_rgb, 15))
+    else:
+        return '#ddd'
+
+
+def add_months(d, months):
+    """Return the date `months` months from `d`. If the day does not exist
+    in the new month the last day of the month is used. Dates are limited to
+    between the years :data:`datetime.MINYEAR` and :data:`datetime.MAXYEAR`.
+    """
+
+    index = min(max(_month_index(d) + months, _MIN_MONTH_INDEX),
+                _MAX_MONTH_INDEX)
+    year, month = divmod(index, 12)
+    month += 1
+    day = min(d.day, calendar.monthrange(year, month)[1])
+    return d.replace(year=year, month=month, day=day)
+
+
 def next_year(d, years=1):
+    year = min(max(d.year + years, datetime.MINYEAR), datetime.MAXYEAR)
     try:
-        return d.__class__(year=d.year + years, month=d.month, day=d.day)
+        return d.__class__(year=year, month=d.month, day=d.day)
     except ValueError:
-        return d.__class__(year=d.year + years, month=d.month + 1, day=1) - \
+        return d.__class__(year=year, month=d.month + 1, day=1) - \
             datetime.timedelta(days=1)
 
 
+def _month_index(d):
+    """Return the number of months from the start of year 0 to a date."""
+
+    return d.year * 12 + d.month - 1
+
+
 def prev_year(d):
     return next_year(d, -1)
 
@@ -0,0 +1,333 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Pre-calculated geometry for the clock dials used by :mod:`tks.times`.
+
+The position of every numeral on a dial depends only on the font used and the
+type of dial so it is calculated once and shared by every dial which uses the
+same font. Building a dial then needs no trigonometry and mapping a mouse
+position to a numeral is done with the geometry stored here rather than by
+querying the canvas.
+
+:func:`get_dial_geometry`
+    Returns the :class:`DialGeometry` for a font and dial mode.
+"""
+
+from __future__ import print_function, division, absolute_import
+import math
+
+import tks
+import tks.styles
+
+__all__ = ['DialGeometry', 'DialNumeral', 'get_dial_geometry',
+           'unit_positions', 'endpoints', 'polar', 'dial_position', 'in_rect']
+
+PADDING = 4
+
+MODE_12HOUR = '12hour'
+MODE_24HOUR = '24hour'
+MODE_MINUTE = 'minute'
+
+_unit_cache = {}
+_endpoint_cache = {}
+
+
+class DialNumeral(object):
+    """The position and tags of a number displayed on a dial.
+
+    :param tag: The base tag e.g. `h12`
+    :param text: The text to display
+    :param position: The canvas position of the center of the numeral
+    :param rect: The rectangle of the selection circle
+    :param circle_tags: The tags to give the selection circle
+    :param text_tags: The tags to give the text
+    """
+
+    def __init__(self, tag, text, position, rect, circle_tags, text_tags):
+        self.tag = tag
+        self.text = text
+        self.position = position
+        self.rect = rect
+        self.circle_tags = circle_tags
+        self.text_tags = text_tags
+
+
+class DialGeometry(object):
+    """The geometry of a clock dial.
+
+    :param text_width: The width of the text `00` in the dial font
+    :type text_width:  int
+    :param mode: One of `12hour`, `24hour` or `minute`
+    :type mode:  str
+    :param ampm_size: The width and height of the am/pm boxes in the center
+                      of a 12 hour dial.
+    :type ampm_size:  (int, int)
+    """
+
+    def __init__(self, text_width, mode, ampm_size=None):
+        self.mode = mode
+
+        self.selection_radius = text_width * 1.125
+        self.outer_radius = text_width * 8
+        self.dial_radius = self.outer_radius + self.selection_radius + PADDING
+        self.inner_radius = self.outer_radius - (PADDING / 2) - \
+                            (self.selection_radius * 2)
+
+        self.size = (self.dial_radius * 2) + 1
+        self.center = (self.dial_radius + (PADDING / 2),
+                       self.dial_radius + (PADDING / 2))
+
+        if mode == MODE_MINUTE:
+            self.hand_radii = (self.outer_radius,)
+        else:
+            self.hand_radii = (self.inner_radius - self.selection_radius,
+                               self.outer_radius - self.selection_radius)
+
+        self.numerals = tuple(self._create_numerals())
+
+        if mode == MODE_12HOUR and ampm_size:
+            ampm_width, ampm_height = ampm_size
+            cx, cy = self.center
+            self.am_rect = (cx - (ampm_width / 2),
+                            cy - PADDING - (1.25 * ampm_height),
+                            cx + (ampm_width / 2),
+                            cy - PADDING - (0.25 * ampm_height))
+            self.pm_rect = (cx - (ampm_width / 2),
+                            cy + PADDING + (0.25 * ampm_height),
+                            cx + (ampm_width / 2),
+                            cy + PADDING + (1.25 * ampm_height))
+        else:
+            self.am_rect = None
+            self.pm_rect = None
+
+    def _create_numerals(self):
+        """Calculate the numerals displayed on the dial."""
+
+        if self.mode == MODE_MINUTE:
+            radii = [self.outer_radius]
+        else:
+            radii = [self.inner_radius, self.outer_radius]
+
+        units = unit_positions(12)
+        for radius in radii:
+            for idx in range(12):
+                unit_x, unit_y = units[(idx + 1) % 12]
+
+                if self.mode == MODE_12HOUR:
+                    if radius == self.inner_radius:
+                        i = ((idx + 1) * 5) % 60
+                        tag = 'm%d' % i
+                        text = '%02d' % i
+                    else:
+                        i = idx + 1
+                        tag = 'h%d' % i
+                        text = str(i)
+
+                    circle_tags = ('%sc' % tag,)
+                    text_tags = ('%st' % tag,)
+                elif self.mode == MODE_24HOUR:
+                    if radius == self.inner_radius:
+                        i = (idx + 1) % 24
+                        circle_tag = 'inner_circle'
+                    else:
+                        i = (idx + 1 + 12) % 24
+                        circle_tag = 'outer_circle'
+
+                    tag = 'h%d' % i
+                    text = '%02d' % i
+                    circle_tags = ('%sc' % tag, circle_tag)
+                    text_tags = ('%st' % tag, 'text')
+                else:
+                    i = ((idx + 1) * 5) % 60
+                    tag = 'h%d' % i
+                    text = '%02d' % i
+                    circle_tags = ('%sc' % tag, 'circle')
+                    text_tags = ('%st' % tag, 'text')
+
+                position = (self.center[0] + (unit_x * radius),
+                            self.center[1] + (unit_y * radius))
+                rect = tks.rect_at(position, self.selection_radius)
+
+                yield DialNumeral(tag, text, position, rect,
+                                  circle_tags, text_tags)
+
+    def tag_at(self, x, y):
+        """Return the selection circle tag of the numeral at a canvas position
+        or None if there isn't one."""
+
+        radius, angle = polar(self.center, x, y)
+        position = dial_position(angle)
+
+        on_outer = abs(radius - self.outer_radius) <= self.selection_radius
+        on_inner = abs(radius - self.inner_radius) <= self.selection_radius
+
+        if self.mode == MODE_12HOUR:
+            if on_outer:
+                return 'h%dc' % (position or 12)
+            elif on_inner:
+                return 'm%dc' % (position * 5)
+        elif self.mode == MODE_24HOUR:
+            if on_outer:
+                return 'h%dc' % ((position + 12) if position else 0)
+            elif on_inner:
+                return 'h%dc' % (position or 12)
+        elif on_outer:
+            return 'h%dc' % (position * 5)
+
+        return None
+
+    def ring_at(self, x, y):
+        """Return 'outer' or 'inner' for the ring of numerals nearest to a
+        canvas position or None if the position is off the dial."""
+
+        radius = polar(self.center, x, y)[0]
+        if radius > self.dial_radius:
+            return None
+        elif self.mode == MODE_MINUTE or \
+                radius >= (self.inner_radius + self.outer_radius) / 2:
+            return 'outer'
+        else:
+            return 'inner'
+
+    def value_at(self, x, y, ring=None):
+        """Return the value on a ring of the dial nearest to the direction of a
+        canvas position from the center.
+
+        Minutes are returned to the nearest minute rather than the nearest
+        numeral. If `ring` is None the ring nearest to the position is used.
+        """
+
+        if ring is None:
+            ring = self.ring_at(x, y) or 'outer'
+
+        angle = polar(self.center, x, y)[1]
+        position = dial_position(angle)
+
+        if self.mode == MODE_MINUTE or \
+                (self.mode == MODE_12HOUR and ring == 'inner'):
+            return dial_position(angle, 60)
+        elif self.mode == MODE_24HOUR and ring == 'outer':
+            return (position + 12) if position else 0
+        else:
+            return position or 12
+
+    def ampm_at(self, x, y):
+        """Return 'am' or 'pm' if a canvas position is within one of the
+        am/pm boxes else None."""
+
+        if self.am_rect and in_rect(self.am_rect, x, y):
+            return 'am'
+        elif self.pm_rect and in_rect(self.pm_rect, x, y):
+            return 'pm'
+        else:
+            return None
+
+    def on_face(self, x, y):
+        """Return True if a canvas position is on the dial."""
+
+        return polar(self.center, x, y)[0] <= self.dial_radius
+
+
+def get_dial_geometry(master, font, mode):
+    """Return the :class:`DialGeometry` for a font and dial mode.
+
+    The font is only measured the first time a font and mode combination is
+    requested in the interpreter of `master`.
+
+    :param master: A widget used to measure the font
+    :param font: The font description used for the dial numerals
+    :type font:  tuple
+    :param mode: One of `12hour`, `24hour` or `minute`
+    :type mode:  str
+    """
+
+    root = master._root()
+    try:
+        cache = root._tks_dial_geometry
+    except AttributeError:
+        cache = {}
+        root._tks_dial_geometry = cache
+
+    key = (tuple(font), mode)
+    try:
+        return cache[key]
+    except KeyError:
+        f = tks.styles.get_font(master, font)
+        text_width = f.measure('00')
+
+        if mode == MODE_12HOUR:
+            ampm_width = max(f.measure('am'), f.measure('pm')) + (2 * PADDING)
+            ampm_height = f.metrics('linespace') + PADDING
+            ampm_size = (ampm_width, ampm_height)
+        else:
+            ampm_size = None
+
+        geometry = DialGeometry(text_width, mode, ampm_size)
+        cache[key] = geometry
+        return geometry
+
+
+def unit_positions(count):
+    """Return the offsets from the center of a unit circle of `count` evenly
+    spaced positions starting at 12 o'clock and moving clockwise.
+    """
+
+    try:
+        return _unit_cache[count]
+    except KeyError:
+        positions = []
+        for idx in range(count):
+            angle = (2 * math.pi * idx) / count
+            positions.append((math.sin(angle), -math.cos(angle)))
+
+        positions = tuple(positions)
+        _unit_cache[count] = positions
+        return positions
+
+
+def endpoints(center, radius, divisions, count=None):
+    """Return a table of the canvas positions of `divisions` evenly spaced
+    points on a circle starting at 12 o'clock and moving clockwise.
+
+    The table is extended to `count` entries by wrapping round the circle,
+    so that for example a 24 entry table of hour positions can be indexed
+    directly by the hour.
+    """
+
+    if count is None:
+        count = divisions
+
+    key = (center, radius, divisions, count)
+    try:
+        return _endpoint_cache[key]
+    except KeyError:
+        units = unit_positions(divisions)
+        table = tuple((center[0] + (units[idx % divisions][0] * radius),
+                       center[1] + (units[idx % divisions][1] * radius))
+                      for idx in range(count))
+        _endpoint_cache[key] = table
+        return table
+
+
+def polar(center, x, y):
+    """Return the distance of a point from `center` and the angle in degrees
+    measured clockwise from 12 o'clock.
+    """
+
+    dx = x - center[0]
+    dy = y - center[1]
+    return math.hypot(dx, dy), math.degrees(math.atan2(dx, -dy)) % 360
+
+
+def dial_position(angle, count=12):
+    """Return the index of the nearest of `count` evenly spaced positions
+    round a dial where position 0 is at 12 o'clock.
+    """
+
+    return int(round(angle / (360 / count))) % count
+
+
+def in_rect(rect, x, y):
+    """Return True if the point x,y is within a rectangle."""
+
+    return (min(rect[0], rect[2]) <= x <= max(rect[0], rect[2]) and
+            min(rect[1], rect[3]) <= y <= max(rect[1], rect[3]))
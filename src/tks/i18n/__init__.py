@@ -22,18 +22,49 @@ DEFAULT_LANGUAGES = os.environ.get('LANGUAGE', '').split(':')
 if 'en_US' not in DEFAULT_LANGUAGES:
     DEFAULT_LANGUAGES += ['en_US']
 
-lc, encoding = locale.getdefaultlocale()
-if lc:
-    languages = [lc]
 
-# Concat all languages (env + default locale),
-#  and here we have the languages and location of the translations
-languages += DEFAULT_LANGUAGES
-mo_location = LOCALE_DIR
+class LazyTranslation(object):
+    """A translation which is only loaded the first time a message is
+    translated, so that importing a module which uses it does not search for
+    the translation files."""
+
+    def __init__(self, domain, localedir):
+        self._domain = domain
+        self._localedir = localedir
+        self._translation = None
+
+    def gettext(self, message):
+        """Return the translation of `message`."""
+
+        return self._load().gettext(message)
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def _load(self):
+        if self._translation is None:
+            lc, encoding = locale.getdefaultlocale()
+            languages = [lc] if lc else []
+
+            # Concat all languages (env + default locale),
+            #  and here we have the languages and location of the
+            #  translations
+            languages += DEFAULT_LANGUAGES
 
-gettext.bind_textdomain_codeset(APP_NAME, codeset='UTF-8')
-language = gettext.translation(APP_NAME, mo_location,
-                               languages=languages, fallback=True)
+            if sys.version_info < (3, 0):
+                gettext.bind_textdomain_codeset(self._domain, codeset='UTF-8')
 
-if sys.version_info < (3, 0):
-    language.gettext = language.ugettext
+            translation = gettext.translation(self._domain, self._localedir,
+                                              languages=languages,
+                                              fallback=True)
+
+            if sys.version_info < (3, 0):
+                translation.gettext = translation.ugettext
+
+            self._translation = translation
+
+        return self._translation
+
+
+mo_location = LOCALE_DIR
+language = LazyTranslation(APP_NAME, mo_location)
@@ -0,0 +1,150 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Optional counters which record how often the expensive internal operations
+of the widgets are performed and how long they take.
+
+Recording is off by default. It can be turned on by calling :func:`enable`
+or by setting the environment variable `TKS_STATS` to `1` before :mod:`tks`
+is imported. When it is off the only cost is a check of a flag per call.
+
+The counters are returned by :func:`stats`, which is also available as
+`tks.stats()`, and can be displayed in a window which updates itself with
+:class:`tks.stats_window.StatsWindow`.
+"""
+
+from __future__ import print_function, division, absolute_import
+import os
+import time
+import functools
+
+__all__ = ['enable', 'enabled', 'reset', 'stats', 'timed', 'timed_steps',
+           'Counter']
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_enabled = os.environ.get('TKS_STATS', '') == '1'
+_counters = {}
+
+
+class Counter(object):
+    """The number of calls to an operation and the total time taken.
+
+    :param name: The name of the operation e.g. `ColorWheel._update_triangle`
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def mean_time(self):
+        """The mean time per call in seconds."""
+
+        if self.calls:
+            return self.time / self.calls
+        else:
+            return 0.0
+
+    def add(self, elapsed):
+        """Record a call which took `elapsed` seconds."""
+
+        self.calls += 1
+        self.time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def as_dict(self):
+        return {'calls': self.calls,
+                'time': self.time,
+                'mean_time': self.mean_time,
+                'max_time': self.max_time}
+
+
+def enable(flag=True):
+    """Turn recording on or off. The counters are not reset."""
+
+    global _enabled
+    _enabled = bool(flag)
+
+
+def enabled():
+    """Return True if recording is turned on."""
+
+    return _enabled
+
+
+def reset():
+    """Remove all the recorded counts."""
+
+    _counters.clear()
+
+
+def stats():
+    """Return a dictionary of operation name to a dictionary of the number
+    of `calls` and the total, mean and maximum times in seconds.
+    """
+
+    return dict((name, counter.as_dict())
+                for name, counter in _counters.items())
+
+
+def timed(name):
+    """A decorator which records calls to the decorated function under
+    `name` when recording is turned on."""
+
+    def _decorator(func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            try:
+                counter = _counters[name]
+            except KeyError:
+                counter = _counters.setdefault(name, Counter(name))
+
+            start = _clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counter.add(_clock() - start)
+
+        return _wrapper
+
+    return _decorator
+
+
+def timed_steps(name):
+    """A decorator for generator functions which records each run of the
+    generator as one call under `name`, timing only the work done between
+    its steps and not the time spent waiting for the next step."""
+
+    def _decorator(func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            steps = func(*args, **kwargs)
+            if not _enabled:
+                for step in steps:
+                    yield step
+                return
+
+            try:
+                counter = _counters[name]
+            except KeyError:
+                counter = _counters.setdefault(name, Counter(name))
+
+            elapsed = 0.0
+            while True:
+                start = _clock()
+                try:
+                    step = next(steps)
+                except StopIteration:
+                    counter.add(elapsed + _clock() - start)
+                    return
+                elapsed += _clock() - start
+                yield step
+
+        return _wrapper
+
+    return _decorator
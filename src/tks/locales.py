@@ -0,0 +1,143 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Provides a per process cache of locale information used by the date and
+time widgets.
+
+Parsing a :class:`babel.Locale <babel.core.Locale>` and formatting numbers
+with :mod:`babel` is slow compared to drawing a calendar so the results are
+calculated once per locale and shared between all widgets.
+
+:func:`get_locale_info`
+    Returns the :class:`LocaleInfo` for a locale.
+"""
+
+from __future__ import print_function, division, absolute_import
+import calendar
+
+__all__ = ['LocaleInfo', 'get_locale_info']
+
+NUMERAL_COUNT = 100
+
+_locale_cache = {}
+
+# babel is only imported when the first locale is parsed
+babel = None
+
+
+class LocaleInfo(object):
+    """Locale information needed by the date and time widgets.
+
+    :param locale: Either a locale name e.g. 'en' or a babel Locale instance.
+                   If :mod:`babel` is not installed or `locale` is None then
+                   ISO 8601 formats are used.
+    :type locale:  str or :class:`babel.Locale <babel.core.Locale>`
+    """
+
+    def __init__(self, locale='en'):
+        if locale and _import_babel():
+            if not isinstance(locale, babel.Locale):
+                locale = babel.Locale.parse(locale)
+
+            self.locale = locale
+            self.first_week_day = locale.first_week_day
+            self.day_names = locale.days['format']['abbreviated']
+            self.month_names = locale.months['format']['wide']
+            self.date_pattern = locale.date_formats['short'].pattern
+            self.time_pattern = locale.time_formats['short'].pattern
+            self._numerals = [babel.numbers.format_decimal(x, locale=locale)
+                              for x in range(NUMERAL_COUNT)]
+        else:
+            self.locale = None
+            self.first_week_day = calendar.MONDAY
+            self.day_names = calendar.day_abbr
+            self.month_names = calendar.month_name
+            self.date_pattern = 'yyyy-MM-dd'
+            self.time_pattern = 'HH:mm'
+            self._numerals = [str(x) for x in range(NUMERAL_COUNT)]
+
+        self._ampm = None
+        self._ampm_calculated = False
+
+    @property
+    def ampm(self):
+        """A tuple of the am and pm text if the locale uses a 12 hour clock
+        else None."""
+
+        if not self._ampm_calculated:
+            if self.locale and 'a' in self.time_pattern:
+                am = self.locale.periods['am']
+                pm = self.locale.periods['pm']
+                if am.islower() or pm.islower():
+                    self._ampm = ('am', 'pm')
+                else:
+                    self._ampm = ('AM', 'PM')
+
+            self._ampm_calculated = True
+
+        return self._ampm
+
+    def number(self, value):
+        """Return an integer formatted for the locale.
+
+        Values between 0 and 99 are returned from a pre-calculated table.
+        """
+
+        if 0 <= value < NUMERAL_COUNT:
+            return self._numerals[value]
+        elif self.locale:
+            return babel.numbers.format_decimal(value, locale=self.locale)
+        else:
+            return str(value)
+
+    def format_date(self, value, format='long'):
+        """Format a date for the locale."""
+
+        if self.locale:
+            return babel.dates.format_date(value, format, self.locale)
+        else:
+            return value.strftime('%Y-%m-%d')
+
+    def format_time(self, value, format='short'):
+        """Format a time for the locale."""
+
+        if self.locale:
+            return babel.dates.format_time(value, format, locale=self.locale)
+        else:
+            return value.strftime('%H:%M')
+
+
+def get_locale_info(locale='en'):
+    """Return the :class:`LocaleInfo` for a locale, creating it the first time
+    the locale is requested.
+
+    :param locale: Either a locale name e.g. 'en', a babel Locale instance or
+                   a :class:`LocaleInfo` which is returned unchanged.
+    :type locale:  str, :class:`babel.Locale <babel.core.Locale>` or
+                   :class:`LocaleInfo`
+    """
+
+    if isinstance(locale, LocaleInfo):
+        return locale
+
+    key = str(locale) if locale else None
+    try:
+        return _locale_cache[key]
+    except KeyError:
+        info = LocaleInfo(locale)
+        _locale_cache[key] = info
+        return info
+
+
+def _import_babel():
+    """Import babel the first time it is needed. Returns False if it is not
+    installed."""
+
+    global babel
+    if babel is None:
+        try:
+            import babel.dates
+            import babel.numbers
+        except ImportError:
+            babel = False
+
+    return babel
@@ -0,0 +1,273 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""A single entry widget which edits a value made up of several fixed width
+fields e.g. the year, month and day of a date.
+
+The text always matches the mask. Typing a digit overwrites the character
+under the cursor, the Up and Down keys change the field under the cursor and
+the value is only parsed when a field has been completely typed or the entry
+loses focus.
+
+The value is held in a single Tk variable and no per field variables or
+traces are used, so the entry is much lighter weight than a frame of
+comboboxes.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+    from tkinter import ttk
+else:
+    import Tkinter as tk
+    import ttk
+
+__all__ = ['MaskedEntry']
+
+NAVIGATION_KEYS = ('Left', 'Right', 'Home', 'End', 'Tab', 'ISO_Left_Tab',
+                   'Return', 'KP_Enter', 'Escape')
+
+
+class MaskedEntry(ttk.Entry, object):
+    """Base class for entries which display a value as fixed width fields.
+
+    Sub classes must implement :meth:`_split`, :meth:`_join` and
+    :meth:`_limits`.
+
+    :param master: The master widget
+    :param variable: The Tk variable which holds the value
+    :param mask: A list of the parts of the entry. Each part is either a
+                 literal string or a tuple of a field name and its width.
+    :type mask:  list
+    :param font: The font to use
+    """
+
+    def __init__(self, master, variable, mask, font=None):
+        self._variable = variable
+        self._mask = mask
+
+        self._fields = []
+        position = 0
+        for part in mask:
+            if isinstance(part, tuple):
+                name, width = part
+                self._fields.append((name, position, width))
+                position += width
+            else:
+                position += len(part)
+
+        kwargs = {'width': position + 1}
+        if font:
+            kwargs['font'] = font
+
+        super(MaskedEntry, self).__init__(master, **kwargs)
+
+        self._internal_value_change = False
+
+        self.bind('<KeyPress>', self._key_pressed)
+        self.bind('<FocusOut>', self._focus_out)
+        self.bind('<<Paste>>', lambda event: 'break')
+        self.bind('<<Cut>>', lambda event: 'break')
+        self.bind('<<Clear>>', lambda event: 'break')
+        self.bind('<Alt-Down>', self._popup)
+        self.bind('<F4>', self._popup)
+
+        self._variable.trace_variable('w', self._value_changed)
+        self._render(self._variable.get())
+
+    @property
+    def value(self):
+        """The value represented by the entry."""
+
+        return self._variable.get()
+
+    @value.setter
+    def value(self, value):
+        self._internal_value_change = True
+        self._variable.set(value)
+        self._render(value)
+
+    def _split(self, value):
+        """Return a dictionary of field name to integer field value. For
+        fields with choices the value is the index of the choice."""
+
+        raise NotImplementedError
+
+    def _join(self, values):
+        """Return a new value from a dictionary of field values which have
+        already been limited to the range returned by :meth:`_limits`."""
+
+        raise NotImplementedError
+
+    def _limits(self, name, values):
+        """Return the minimum and maximum values of a field given the values
+        of the fields before it."""
+
+        raise NotImplementedError
+
+    def _choices(self, name):
+        """Return a list of the text choices for a field or None if the field
+        is numeric."""
+
+        return None
+
+    def _spin_value(self, name, values, step):
+        """Return the field values after a field has been stepped by the Up
+        or Down keys. By default the field wraps round within its limits."""
+
+        minimum, maximum = self._limits(name, values)
+        span = maximum - minimum + 1
+        values[name] = minimum + ((values[name] - minimum + step) % span)
+        return values
+
+    def _popup(self, event=None):
+        """Called when Alt-Down or F4 is pressed to display a selection
+        dialog."""
+
+    def _format(self, values):
+        text = []
+        for part in self._mask:
+            if isinstance(part, tuple):
+                name, width = part
+                choices = self._choices(name)
+                if choices:
+                    text.append(choices[values[name]].ljust(width))
+                else:
+                    text.append(str(values[name]).zfill(width))
+            else:
+                text.append(part)
+
+        return ''.join(text)
+
+    def _render(self, value):
+        cursor = self.index(tk.INSERT)
+        self.delete(0, tk.END)
+        self.insert(0, self._format(self._split(value)))
+        self.icursor(cursor)
+
+    def _parse(self, text):
+        """Return the field values from the entry text limited to their
+        allowed ranges, or None if the text cannot be parsed."""
+
+        values = {}
+        for name, start, width in self._fields:
+            field_text = text[start:start + width].strip()
+            choices = self._choices(name)
+            try:
+                if choices:
+                    values[name] = [c.lower() for c in choices].index(
+                        field_text.lower())
+                else:
+                    values[name] = int(field_text)
+            except ValueError:
+                return None
+
+        return self._limit(values)
+
+    def _limit(self, values):
+        """Limit the field values to their allowed ranges in field order."""
+
+        for name, start, width in self._fields:
+            minimum, maximum = self._limits(name, values)
+            values[name] = max(minimum, min(values[name], maximum))
+
+        return values
+
+    def commit(self):
+        """Update the variable from the text in the entry."""
+
+        values = self._parse(self.get())
+        if values is None:
+            self._render(self._variable.get())
+            return
+
+        value = self._join(values)
+        if value != self._variable.get():
+            self.value = value
+        else:
+            self._render(value)
+
+    def _field_at(self, index):
+        """Return the index of the field at or after an entry index. If the
+        index is past the last field the last field is returned."""
+
+        for idx, (name, start, width) in enumerate(self._fields):
+            if index < start + width:
+                return idx
+
+        return len(self._fields) - 1
+
+    def _key_pressed(self, event):
+        keysym = event.keysym
+
+        if keysym in ('Up', 'Down'):
+            self._spin(1 if keysym == 'Up' else -1)
+            return 'break'
+        elif keysym in ('BackSpace', 'Delete'):
+            if keysym == 'BackSpace':
+                self.icursor(max(0, self.index(tk.INSERT) - 1))
+            return 'break'
+        elif keysym in NAVIGATION_KEYS or not event.char or \
+                event.state & 0x4:
+            return None
+
+        self._type(event.char)
+        return 'break'
+
+    def _type(self, char):
+        """Overwrite the character under the cursor."""
+
+        index = self.index(tk.INSERT)
+        field = self._field_at(index)
+        name, start, width = self._fields[field]
+        index = max(index, start)
+
+        choices = self._choices(name)
+        if choices:
+            matches = [idx for idx, choice in enumerate(choices)
+                       if choice.lower().startswith(char.lower())]
+            if not matches:
+                return
+
+            values = self._parse(self.get())
+            if values is None:
+                return
+
+            values[name] = matches[0]
+            self.value = self._join(values)
+            self.icursor(start + width)
+            return
+
+        if not char.isdigit() or index >= start + width:
+            return
+
+        self.delete(index)
+        self.insert(index, char)
+        index += 1
+
+        if index == start + width:
+            self.commit()
+            if field + 1 < len(self._fields):
+                index = self._fields[field + 1][1]
+
+        self.icursor(index)
+
+    def _spin(self, step):
+        """Step the field under the cursor."""
+
+        values = self._parse(self.get())
+        if values is None:
+            values = self._split(self._variable.get())
+
+        name = self._fields[self._field_at(self.index(tk.INSERT))][0]
+        values = self._limit(self._spin_value(name, values, step))
+        self.value = self._join(values)
+
+    def _focus_out(self, event):
+        self.commit()
+
+    def _value_changed(self, *args):
+        if not self._internal_value_change:
+            self._render(self._variable.get())
+        self._internal_value_change = False
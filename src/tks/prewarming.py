@@ -0,0 +1,182 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Fills the caches used by the dialogs while the application is idle.
+
+The first time a dialog is opened it loads the rc file, imports its modules,
+creates fonts, parses the babel locale, lays out the clock dials, builds the
+calendar and renders the color wheel. :func:`prewarm` does this work in
+small steps from `after_idle` callbacks so that it is already done when the
+user opens the dialog. ::
+
+    root = tk.Tk()
+    tks.prewarm(root, locale='en')
+
+Each callback runs steps until its time budget is used up and then yields
+to the event loop, so the application stays responsive while warming. A
+single step which takes longer than the budget, such as parsing a babel
+locale, cannot be split.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+import datetime
+import importlib
+
+from tks.chunked import ChunkScheduler
+
+__all__ = ['Prewarmer', 'prewarm']
+
+FRAME_BUDGET = 8
+
+DIALOGS = ('color', 'date', 'time')
+
+
+class Prewarmer(object):
+    """Runs a sequence of steps from idle callbacks.
+
+    :param master: The widget used to schedule the callbacks
+    :param steps: An iterable of functions or generators. Each function is
+                  called once and each generator is advanced one item per
+                  step.
+    :param budget: The number of milliseconds of work done per callback
+    :type budget:  int
+    :param command: An optional function called when all the steps are done
+    """
+
+    def __init__(self, master, steps, budget=FRAME_BUDGET, command=None):
+        self._steps = iter(steps)
+        self._current = None
+        self._command = command
+        self._scheduler = ChunkScheduler(master, budget, idle=True)
+        self.done = False
+
+    def start(self):
+        """Start running the steps."""
+
+        if not self.done and not self._scheduler.running('steps'):
+            self._scheduler.run('steps', self._chunks(), done=self._finished)
+
+    def cancel(self):
+        """Stop running the steps. The work done so far is kept."""
+
+        self._scheduler.cancel('steps')
+
+    def run_step(self):
+        """Run the next step now. Returns False if there are no more."""
+
+        if self._current is None:
+            try:
+                step = next(self._steps)
+            except StopIteration:
+                return False
+
+            result = step()
+            if hasattr(result, '__next__') or hasattr(result, 'next'):
+                self._current = result
+            return True
+
+        try:
+            next(self._current)
+        except StopIteration:
+            self._current = None
+
+        return True
+
+    def _chunks(self):
+        while self.run_step():
+            yield
+
+    def _finished(self):
+        self.done = True
+        if self._command:
+            self._command()
+
+
+def prewarm(master=None, locale='en', dialogs=DIALOGS, fonts=None,
+            budget=FRAME_BUDGET, command=None):
+    """Fill the caches used by the dialogs during idle time.
+
+    :param master: A widget in the application, defaults to the Tk root
+    :param locale: The locale the date and time dialogs will be opened with
+    :param dialogs: The dialogs to prepare, any of `color`, `date` and
+                    `time`
+    :param fonts: The fonts the dialogs will use, defaults to those from the
+                  rc file
+    :param budget: The number of milliseconds of work done per idle callback
+    :param command: A function called when all the work is done
+    :rtype: :class:`Prewarmer`
+    """
+
+    if master is None:
+        if sys.version_info >= (3, 0):
+            import tkinter as tk
+        else:
+            import Tkinter as tk
+        master = tk._default_root
+
+    warmer = Prewarmer(master, _steps(master, locale, dialogs, fonts),
+                       budget, command)
+    warmer.start()
+    return warmer
+
+
+def _steps(master, locale, dialogs, fonts):
+    """Generate the steps for :func:`prewarm`."""
+
+    import tks
+
+    state = {'fonts': fonts}
+
+    def _load_rc():
+        tks.load_colors()
+        if state['fonts'] is None:
+            state['fonts'] = tks.load_fonts()
+
+    yield _load_rc
+
+    modules = ['tks.styles', 'tks.dialog']
+    if 'color' in dialogs:
+        modules += ['tks.colors', 'tks.color_wheel', 'tks.color_plane',
+                    'tks.color_slider', 'tks.color_square']
+    if 'date' in dialogs:
+        modules += ['tks.dates']
+    if 'time' in dialogs:
+        modules += ['tks.times']
+
+    for name in modules:
+        yield lambda name=name: importlib.import_module(name)
+
+    text = lambda: state['fonts'].text
+
+    yield lambda: tks.styles.get_font(master, text())
+    if 'date' in dialogs:
+        yield lambda: tks.styles.get_font(master, text(), weight='bold')
+    if 'time' in dialogs:
+        yield lambda: tks.styles.get_font(master, text(), weight='bold',
+                                          scale=2)
+
+    if 'color' in dialogs:
+        yield lambda: tks.color_wheel.wheel_data_steps(
+            tks.color_wheel.DEFAULT_RADIUS,
+            tks.color_wheel.inner_radius(tks.color_wheel.DEFAULT_RADIUS))
+
+    if 'date' in dialogs or 'time' in dialogs:
+        yield lambda: tks.locales.get_locale_info(locale)
+
+    if 'date' in dialogs:
+        def _month_grids():
+            info = tks.locales.get_locale_info(locale)
+            today = datetime.date.today()
+            for count in (0, 1, -1):
+                d = tks.dates.add_months(today.replace(day=1), count)
+                tks.dates.month_grid(d.year, d.month, info.first_week_day)
+                yield
+
+        yield _month_grids
+
+    if 'time' in dialogs:
+        for mode in (tks.dial_geometry.MODE_12HOUR,
+                     tks.dial_geometry.MODE_24HOUR,
+                     tks.dial_geometry.MODE_MINUTE):
+            yield lambda mode=mode: tks.dial_geometry.get_dial_geometry(
+                master, text(), mode)
@@ -1,7 +1,8 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
 """Provides a class :class:`rcfile` to load configuration information
-from a file."""
+from a file and a function :func:`get_rcfile` which returns a shared, parsed
+:class:`rcfile` which is only read again when the file changes."""
 
 import io
 import sys
@@ -12,6 +13,8 @@ if sys.version_info >= (3, 0):
 else:
     import ConfigParser as configparser
 
+from tks.instrument import timed
+
 
 RC_FILE = '.tksrc'
 
@@ -28,6 +31,8 @@ DEFAULT_CONFIG = u"""[font]
 #invalid=red
 """
 
+_rc_cache = {}
+
 
 class rcfile(object):
     """A Resource Configuration file.
@@ -44,6 +49,7 @@ class rcfile(object):
         else:
             self.filenames = None
 
+    @timed('rcfile.read')
     def read(self, extra_files=None):
         """Read configuration information from the filename specified in the
         constructor plus any extra files specified as a parameter.
@@ -131,3 +137,42 @@ class rcfile(object):
             self.parser.remove_option(path[0], path[1])
         else:
             raise KeyError
+
+
+def get_rcfile(filename=None):
+    """Return a parsed :class:`rcfile` shared by all callers.
+
+    The file is only parsed the first time it is requested and again when
+    its modification time changes, so the cost of a call is a single `stat`.
+    The returned object should not be modified.
+
+    :param filename: The file to read. Defaults to `~/.tksrc`
+    :type filename:  str
+    """
+
+    if not filename:
+        filename = os.path.expanduser(os.path.join('~', RC_FILE))
+
+    try:
+        mtime = os.stat(filename).st_mtime
+    except OSError:
+        mtime = None
+
+    try:
+        cached_mtime, rc = _rc_cache[filename]
+        if cached_mtime == mtime:
+            return rc
+    except KeyError:
+        pass
+
+    rc = rcfile(filename)
+    rc.read()
+    _rc_cache[filename] = (mtime, rc)
+    return rc
+
+
+def clear_rc_cache():
+    """Forget the parsed files so that they are read again on the next call
+    to :func:`get_rcfile`."""
+
+    _rc_cache.clear()
@@ -0,0 +1,185 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Watches the `.tksrc` file and applies changes to the colors and fonts of
+running widgets without recreating them.
+
+The file's modification time is checked with an `after` callback so the
+watcher needs no threads or platform specific file notification. When the
+file changes only the colors and fonts whose values have changed are
+applied:
+
+* The ttk styles used by the widgets are reconfigured.
+* The `colors` and `fonts` of each widget are updated in place, unless the
+  widget was given a value which differs from the old `.tksrc` value.
+* The virtual event `<<TksConfigChanged>>` is sent to each updated widget so
+  that it can redraw any canvas items which use the changed values. The
+  day, date range and time selectors and :class:`~tks.value_grid.ValueGrid`
+  redraw themselves. Widgets which do not use the `colors` or `fonts`, such
+  as the color palette, are not affected.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+
+if sys.version_info >= (3, 0):
+    from tkinter import ttk
+else:
+    import ttk
+
+import tks
+from tks.styles import configure_style, get_font
+
+__all__ = ['RCWatcher', 'CONFIG_CHANGED']
+
+CONFIG_CHANGED = '<<TksConfigChanged>>'
+
+POLL_INTERVAL = 1000
+
+# The ttk style options which are set from a color or font. Fonts are
+# passed to :func:`~tks.styles.get_font` with the options in the last item.
+STYLE_OPTIONS = (
+    ('TimeFrame.TLabel', 'background', 'color', 'header', None),
+    ('TimeFrame.TLabel', 'font', 'font', 'text', {'weight': 'bold',
+                                                   'scale': 2}),
+    ('Selected.TimeFrame.TLabel', 'foreground', 'color', 'select_dark',
+     None),
+    ('TimeFrame.TFrame', 'background', 'color', 'header', None),
+    ('Selected.SecondFrame.TLabel', 'foreground', 'color', 'select_dark',
+     None),
+    ('Selector.tks.TButton', 'font', 'font', 'text', None),
+    ('Selector.tks.TLabel', 'font', 'font', 'text', None),
+)
+
+
+class RCWatcher(object):
+    """Polls the `.tksrc` file for changes and applies them to the widgets
+    below `master`.
+
+    :param master: The widget whose descendants are updated, usually the
+                   root window.
+    :param filename: The file to watch. Defaults to `~/.tksrc`
+    :type filename:  str
+    :param interval: The number of milliseconds between checks
+    :type interval:  int
+    :param command: An optional function called with a dictionary of the
+                    changed colors and a dictionary of the changed fonts
+                    after they have been applied.
+    """
+
+    def __init__(self, master, filename=None, interval=POLL_INTERVAL,
+                 command=None):
+        self._master = master
+        self._filename = filename
+        self._interval = interval
+        self._command = command
+        self._after_id = None
+        self._settings = self._read()
+
+    def start(self):
+        """Start watching the file."""
+
+        if self._after_id is None:
+            self._after_id = self._master.after(self._interval, self._poll)
+
+    def stop(self):
+        """Stop watching the file."""
+
+        if self._after_id is not None:
+            self._master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def check(self):
+        """Check the file now and apply any changes.
+
+        :returns: True if any colors or fonts changed
+        """
+
+        settings = self._read()
+        if settings is self._settings:
+            return False
+
+        old_colors, old_fonts = self._settings
+        new_colors, new_fonts = settings
+        self._settings = settings
+
+        colors = _changes(old_colors, new_colors, tks.DefaultColors)
+        fonts = _changes(old_fonts, new_fonts, tks.DefaultFonts)
+        if not colors and not fonts:
+            return False
+
+        self._restyle(colors, fonts)
+        self._update_widgets(self._master, (old_colors, colors),
+                             (old_fonts, fonts), {})
+
+        if self._command:
+            self._command(colors, fonts)
+
+        return True
+
+    def _poll(self):
+        self._after_id = None
+        try:
+            self.check()
+        finally:
+            self._after_id = self._master.after(self._interval, self._poll)
+
+    def _read(self):
+        return tks._rc_settings(self._filename)
+
+    def _restyle(self, colors, fonts):
+        changed = {'color': colors, 'font': fonts}
+        style = ttk.Style(self._master)
+        for style_name, option, kind, name, font_options in STYLE_OPTIONS:
+            if name in changed[kind] and style.configure(style_name):
+                value = changed[kind][name]
+                if font_options:
+                    value = get_font(self._master, value, **font_options)
+                configure_style(self._master, style_name, **{option: value})
+
+    def _update_widgets(self, widget, colors, fonts, seen):
+        """Update the widget and its descendants. `seen` records whether each
+        colors or fonts object has been updated as they are often shared
+        between a widget and its children."""
+
+        updated = False
+        for attr, cls, changes in (('colors', tks.DefaultColors, colors),
+                                   ('_colors', tks.DefaultColors, colors),
+                                   ('fonts', tks.DefaultFonts, fonts),
+                                   ('_fonts', tks.DefaultFonts, fonts)):
+            values = getattr(widget, attr, None)
+            if isinstance(values, cls):
+                if id(values) not in seen:
+                    seen[id(values)] = _update(values, cls, *changes)
+                updated |= seen[id(values)]
+
+        if updated:
+            widget.event_generate(CONFIG_CHANGED)
+
+        for child in list(widget.children.values()):
+            self._update_widgets(child, colors, fonts, seen)
+
+
+def _changes(old, new, defaults):
+    """Return the names and values which differ between two settings
+    dictionaries. Names which have been removed revert to the defaults."""
+
+    changes = {}
+    for name in set(old) | set(new):
+        value = new.get(name, getattr(defaults, name))
+        if value != old.get(name, getattr(defaults, name)):
+            changes[name] = value
+
+    return changes
+
+
+def _update(values, cls, old, changes):
+    """Update the attributes of a widget's colors or fonts which still have
+    their old `.tksrc` values. Returns True if any were changed."""
+
+    updated = False
+    for name, value in changes.items():
+        if getattr(values, name, None) == old.get(name, getattr(cls, name)):
+            setattr(values, name, value)
+            updated = True
+
+    return updated
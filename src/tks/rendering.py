@@ -0,0 +1,204 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Calculates image pixel data away from the Tk thread.
+
+Tk may only be used from the thread which created the interpreter but the
+pixel data of an image such as the color wheel's triangle is calculated by
+plain Python functions. A :class:`RenderPool` runs these functions on
+worker threads, or processes, and passes each result to a callback on the
+Tk thread, which only has to wrap the data in a `PhotoImage`. ::
+
+    pool = get_render_pool(widget)
+    pool.submit((widget, 'triangle'), triangle_data, (radius, hue),
+                callback=widget._triangle_calculated)
+
+The results are passed back through a thread safe queue which is polled
+with `after` callbacks while there are jobs outstanding. Submitting a job
+with the same key as an outstanding job supersedes it so, for example,
+dragging the hue selector only delivers the triangle for the latest hue.
+
+Worker threads share the interpreter lock with the Tk thread so they keep
+the interface responsive rather than making the calculation faster. A pool
+of processes calculates in parallel but its functions and their arguments
+must be picklable i.e. defined at module level.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+import threading
+
+if sys.version_info >= (3, 0):
+    import queue
+else:
+    import Queue as queue
+
+__all__ = ['RenderPool', 'get_render_pool']
+
+WORKERS = 2
+POLL_INTERVAL = 10
+
+
+class RenderPool(object):
+    """Runs functions on worker threads or processes and passes their
+    results to callbacks on the Tk thread.
+
+    :param widget: The widget used to schedule the polling callbacks
+    :param workers: The number of worker threads or processes
+    :type workers:  int
+    :param processes: If True use a pool of processes instead of threads
+    :type processes:  bool
+    :param interval: The number of milliseconds between checks for results
+    :type interval:  int
+    """
+
+    def __init__(self, widget, workers=WORKERS, processes=False,
+                 interval=POLL_INTERVAL):
+        self._widget = widget
+        self._interval = interval
+        self._results = queue.Queue()
+        self._jobs = {}
+        self._generation = 0
+        self._after_id = None
+
+        if processes:
+            import multiprocessing
+            self._pool = multiprocessing.Pool(workers)
+            self._requests = None
+            self._threads = []
+        else:
+            self._pool = None
+            self._requests = queue.Queue()
+            self._threads = []
+            for _ in range(workers):
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, key, func, args=(), callback=None):
+        """Calculate `func(*args)` on a worker, superseding any outstanding
+        job with the same key.
+
+        :param key: A hashable value identifying the job
+        :param func: The function to call
+        :param args: The arguments to pass to the function
+        :param callback: An optional function called on the Tk thread with
+                         the result
+        """
+
+        self._generation += 1
+        job = (key, self._generation)
+        self._jobs[key] = (self._generation, callback)
+
+        if self._pool is not None:
+            self._pool.apply_async(_call, (func, args),
+                                   callback=lambda result:
+                                   self._results.put(job + result))
+        else:
+            self._requests.put((job, func, args))
+
+        if self._after_id is None:
+            self._after_id = self._widget.after(self._interval, self._poll)
+
+    def cancel(self, key):
+        """Discard the result of an outstanding job."""
+
+        self._jobs.pop(key, None)
+        if not self._jobs and self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def pending(self, key):
+        """Return True if the result of a job has not been delivered."""
+
+        return key in self._jobs
+
+    def shutdown(self):
+        """Discard all outstanding jobs and stop the workers."""
+
+        for key in list(self._jobs):
+            self.cancel(key)
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        else:
+            for _ in self._threads:
+                self._requests.put(None)
+            self._threads = []
+
+    def _work(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+
+            job, func, args = request
+            # Skip jobs which have been superseded while they were queued
+            if self._current(job):
+                self._results.put(job + _call(func, args))
+
+    def _current(self, job):
+        key, generation = job
+        entry = self._jobs.get(key)
+        return entry is not None and entry[0] == generation
+
+    def _poll(self):
+        self._after_id = None
+        error = None
+
+        while True:
+            try:
+                key, generation, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if not self._current((key, generation)):
+                continue
+
+            _, callback = self._jobs.pop(key)
+            if not ok:
+                error = error or value
+            elif callback:
+                try:
+                    callback(value)
+                except Exception as exc:
+                    error = error or exc
+
+        if self._jobs:
+            self._after_id = self._widget.after(self._interval, self._poll)
+
+        # Raised after polling has been rescheduled so that Tk reports it
+        # without stopping the delivery of later results.
+        if error is not None:
+            raise error
+
+
+def get_render_pool(widget):
+    """Return the :class:`RenderPool` for the interpreter which `widget`
+    belongs to, creating a pool of threads the first time it is requested.
+    The pool is shut down when the root window is destroyed."""
+
+    root = widget._root()
+    try:
+        return root._tks_render_pool
+    except AttributeError:
+        pool = RenderPool(root)
+        root._tks_render_pool = pool
+
+        def _destroyed(event):
+            if event.widget is root:
+                pool.shutdown()
+
+        root.bind('<Destroy>', _destroyed, add='+')
+        return pool
+
+
+def _call(func, args):
+    """Call a function on a worker returning a tuple of whether it succeeded
+    and either its result or the exception it raised."""
+
+    try:
+        return (True, func(*args))
+    except Exception as exc:
+        return (False, exc)
@@ -0,0 +1,117 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Press and hold auto repeat for Tk widgets."""
+
+from __future__ import print_function, division, absolute_import
+
+__all__ = ['AutoRepeat']
+
+
+class AutoRepeat(object):
+    """Calls a function when a button is clicked and repeatedly for as long
+    as mouse button 1 is held down on it.
+
+    The function is made the button's command so a click, the keyboard and
+    `invoke` all make a single step. Holding the button down makes a step
+    after `delay` milliseconds and then repeats, and the button's command is
+    skipped when the button is released after repeating.
+
+    The interval between calls shrinks each time the function is called until
+    it reaches `min_interval`. After `accelerate_after` calls the function is
+    passed `accelerated_step` instead of 1 so that large jumps can be made
+    quickly. If `func` returns False, for example because a limit has been
+    reached, the repeating stops until the button is next pressed.
+
+    :param widget: The widget to bind to
+    :param func:   The function to call. It is passed the number of steps to
+                   move.
+    :param delay:  Milliseconds to wait before the first repeat
+    :type delay:   int
+    :param interval: Milliseconds between the first repeats
+    :type interval:  int
+    :param min_interval: The shortest interval between repeats
+    :type min_interval:  int
+    :param acceleration: The factor to multiply the interval by on each
+                         repeat
+    :type acceleration:  float
+    :param accelerate_after: The number of repeats before `accelerated_step`
+                             is used.
+    :type accelerate_after:  int
+    :param accelerated_step: The step to pass to `func` once
+                             `accelerate_after` repeats have occurred.
+    :type accelerated_step:  int
+    """
+
+    def __init__(self, widget, func,
+                 delay=400,
+                 interval=150,
+                 min_interval=30,
+                 acceleration=0.85,
+                 accelerate_after=12,
+                 accelerated_step=1):
+        self._widget = widget
+        self._func = func
+        self._delay = delay
+        self._initial_interval = interval
+        self._min_interval = min_interval
+        self._acceleration = acceleration
+        self._accelerate_after = accelerate_after
+        self._accelerated_step = accelerated_step
+
+        self._interval = interval
+        self._count = 0
+        self._after_id = None
+
+        if 'command' in widget.keys():
+            widget.configure(command=self._invoke)
+
+        widget.bind('<ButtonPress-1>', self._press, '+')
+        widget.bind('<ButtonRelease-1>', self._release, '+')
+
+    def cancel(self):
+        """Stop repeating."""
+
+        if self._after_id:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _press(self, event):
+        try:
+            if self._widget.instate(['disabled']):
+                return
+        except AttributeError:
+            pass
+
+        self.cancel()
+        self._interval = self._initial_interval
+        self._count = 0
+        self._after_id = self._widget.after(self._delay, self._repeat)
+
+    def _invoke(self):
+        if not self._count:
+            self._func(1)
+
+    def _repeat(self):
+        self._after_id = None
+        self._count += 1
+        if self._count > self._accelerate_after:
+            step = self._accelerated_step
+        else:
+            step = 1
+
+        if self._func(step) is False:
+            return
+
+        self._interval = max(self._min_interval,
+                             int(self._interval * self._acceleration))
+        self._after_id = self._widget.after(self._interval, self._repeat)
+
+    def _release(self, event):
+        self.cancel()
+        # The button invokes its command after this binding so the count is
+        # only cleared once that has been skipped.
+        if self._count:
+            self._widget.after_idle(self._clear_count)
+
+    def _clear_count(self):
+        self._count = 0
@@ -0,0 +1,101 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""A window which displays the counters recorded by :mod:`tks.instrument`.
+
+The window is updated once a second so it can be left open while using a
+dialog to see which operations are taking the time.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+    from tkinter import ttk
+else:
+    import Tkinter as tk
+    import ttk
+
+import tks.instrument
+
+__all__ = ['StatsWindow']
+
+COLUMNS = (('calls', 'Calls', 60),
+           ('time', 'Total ms', 80),
+           ('mean_time', 'Mean ms', 80),
+           ('max_time', 'Max ms', 80))
+
+
+class StatsWindow(tk.Toplevel, object):
+    """Displays the operation counters in a table ordered by total time.
+
+    Creating the window turns recording on.
+
+    :param master: The master widget
+    :param interval: The number of milliseconds between updates
+    :type interval:  int
+    """
+
+    def __init__(self, master, interval=1000):
+        super(StatsWindow, self).__init__(master)
+        self.title('tks stats')
+
+        self._interval = interval
+        self._after_id = None
+
+        tks.instrument.enable()
+
+        self._tree = ttk.Treeview(self, columns=[c[0] for c in COLUMNS],
+                                  height=12)
+        self._tree.heading('#0', text='Operation')
+        self._tree.column('#0', width=240)
+        for name, text, width in COLUMNS:
+            self._tree.heading(name, text=text)
+            self._tree.column(name, width=width, anchor=tk.E)
+        self._tree.grid(row=0, column=0, columnspan=2, sticky=tk.NSEW)
+
+        reset = ttk.Button(self, text='Reset', command=self._reset)
+        reset.grid(row=1, column=1, padx=4, pady=4, sticky=tk.E)
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.bind('<Destroy>', self._destroyed)
+        self.refresh()
+
+    def refresh(self):
+        """Update the table from the current counters."""
+
+        self._after_id = None
+
+        stats = tks.instrument.stats()
+        ordered = sorted(stats.items(), key=lambda item: -item[1]['time'])
+
+        existing = set(self._tree.get_children())
+        for idx, (name, counter) in enumerate(ordered):
+            values = (counter['calls'],
+                      '%.1f' % (counter['time'] * 1000),
+                      '%.2f' % (counter['mean_time'] * 1000),
+                      '%.2f' % (counter['max_time'] * 1000))
+            if name in existing:
+                self._tree.item(name, values=values)
+                self._tree.move(name, '', idx)
+                existing.discard(name)
+            else:
+                self._tree.insert('', idx, iid=name, text=name, values=values)
+
+        if existing:
+            self._tree.delete(*existing)
+
+        self._after_id = self.after(self._interval, self.refresh)
+
+    def _reset(self):
+        tks.instrument.reset()
+        if self._after_id:
+            self.after_cancel(self._after_id)
+        self.refresh()
+
+    def _destroyed(self, event):
+        if event.widget is self and self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
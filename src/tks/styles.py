@@ -0,0 +1,137 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Fonts and ttk styles shared by all the widgets in a Tk interpreter.
+
+Each :class:`tkinter.font.Font` creates a named font in Tk which lasts as
+long as the Python object, so creating one per widget makes the font table
+grow with every dialog that is opened. The functions here create each font
+once per interpreter and only send style options to Tk when their values
+change.
+
+Styles are configured per ttk theme so the records of what has been
+configured are forgotten when the theme changes.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+
+if sys.version_info >= (3, 0):
+    from tkinter import ttk
+    from tkinter import font as tkf
+else:
+    import ttk
+    import tkFont as tkf
+
+__all__ = ['get_font', 'configure_style', 'lookup_style']
+
+
+class _Registry(object):
+    """The fonts and styles of one interpreter."""
+
+    def __init__(self, root):
+        self.fonts = {}
+        self.options = {}
+        self.lookups = {}
+        self.style = ttk.Style(root)
+        root.bind('<<ThemeChanged>>', self._theme_changed, add='+')
+
+    def _theme_changed(self, event=None):
+        self.options.clear()
+        self.lookups.clear()
+
+
+def get_font(master, font, weight=None, scale=None):
+    """Return a font shared by all widgets in the interpreter of `master`.
+
+    :param master: A widget
+    :param font: A font description e.g. `('TkTextFont',)`
+    :param weight: If given the weight of the font e.g. `bold`
+    :type weight:  str
+    :param scale: If given the size of the font is multiplied by this
+    :type scale:  float
+    :rtype: :class:`tkinter.font.Font`
+    """
+
+    registry = _get_registry(master)
+
+    if isinstance(font, tkf.Font):
+        font_key = font.name
+    elif isinstance(font, (list, tuple)):
+        font_key = tuple(font)
+    else:
+        font_key = font
+
+    key = (font_key, weight, scale)
+    try:
+        return registry.fonts[key]
+    except KeyError:
+        f = tkf.Font(root=master._root(), font=font)
+        if scale:
+            f['size'] = int(f.actual('size') * scale)
+        if weight:
+            f['weight'] = weight
+
+        registry.fonts[key] = f
+        return f
+
+
+def configure_style(master, style, **options):
+    """Configure a ttk style, only sending the options whose values differ
+    from those last set to Tk.
+
+    :param master: A widget
+    :param style: The style name e.g. `tks.TFrame`
+    :type style:  str
+    :returns: The style name
+    """
+
+    registry = _get_registry(master)
+
+    changed = {}
+    for option, value in options.items():
+        if registry.options.get((style, option), _MISSING) != value:
+            changed[option] = value
+
+    if changed:
+        registry.style.configure(style, **changed)
+        for option, value in changed.items():
+            registry.options[(style, option)] = value
+
+        # Forget the looked up values of the options for the style and the
+        # styles which inherit from it e.g. `Selector.tks.TButton` from
+        # `tks.TButton`
+        for key in list(registry.lookups):
+            name, option = key
+            if option in changed and (style == '.' or name == style or
+                                      name.endswith('.' + style)):
+                del registry.lookups[key]
+
+    return style
+
+
+def lookup_style(master, style, option):
+    """Return the value of a style option, only asking Tk the first time it
+    is requested for the current theme."""
+
+    registry = _get_registry(master)
+
+    key = (style, option)
+    try:
+        return registry.lookups[key]
+    except KeyError:
+        value = registry.style.lookup(style, option)
+        registry.lookups[key] = value
+        return value
+
+
+_MISSING = object()
+
+
+def _get_registry(master):
+    root = master._root()
+    try:
+        return root._tks_styles
+    except AttributeError:
+        registry = _Registry(root)
+        root._tks_styles = registry
+        return registry
@@ -0,0 +1,89 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Images which show translucent colors over a checkerboard.
+
+A swatch is drawn from a small tile of two checkerboard cells which Tk
+copies across the image, and the images are cached per interpreter by color
+and size so that rows of translucent squares, such as the tints and shades
+of a color, only create each image once. ::
+
+    image = swatch_image(canvas, (1.0, 0.0, 0.0, 0.5), 100, 100)
+    canvas.create_image((0, 0), anchor=tk.NW, image=image)
+
+The widget displaying an image must keep a reference to it. The cache
+only keeps the most recently used images.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+from collections import OrderedDict
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+else:
+    import Tkinter as tk
+
+from tks.color_funcs import composite, rgb_to_hex_string
+
+__all__ = ['swatch_image', 'checkerboard_image']
+
+CHECKER_SIZE = 6
+CHECKER_LIGHT = (0.8, 0.8, 0.8)
+CHECKER_DARK = (0.6, 0.6, 0.6)
+
+SWATCH_CACHE_SIZE = 64
+
+
+def swatch_image(master, rgba, width, height):
+    """Return an image of a color drawn over a checkerboard.
+
+    :param master: A widget
+    :param rgba: The color as an (R, G, B, A) tuple. An RGB color gives a
+                 solid image.
+    :param width: The width of the image
+    :type width:  int
+    :param height: The height of the image
+    :type height:  int
+    :rtype: :class:`tkinter.PhotoImage`
+    """
+
+    root = master._root()
+    try:
+        cache = root._tks_swatches
+    except AttributeError:
+        cache = root._tks_swatches = OrderedDict()
+
+    # Colors which are the same to 8 bits share an image
+    key = (rgb_to_hex_string(rgba), width, height)
+    try:
+        image = cache.pop(key)
+    except KeyError:
+        image = _create_swatch(root, rgba, width, height)
+        while len(cache) >= SWATCH_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    cache[key] = image
+    return image
+
+
+def checkerboard_image(master, width, height):
+    """Return an image of the checkerboard drawn behind translucent
+    colors."""
+
+    return swatch_image(master, (0.0, 0.0, 0.0, 0.0), width, height)
+
+
+def _create_swatch(root, rgba, width, height):
+    light = rgb_to_hex_string(composite(rgba, CHECKER_LIGHT))
+    dark = rgb_to_hex_string(composite(rgba, CHECKER_DARK))
+
+    size = CHECKER_SIZE
+    tile = tk.PhotoImage(master=root, width=size * 2, height=size * 2)
+    tile.put(light, to=(0, 0, size * 2, size * 2))
+    tile.put(dark, to=(size, 0, size * 2, size))
+    tile.put(dark, to=(0, size, size, size * 2))
+
+    # Tk repeats the source image to fill the region given by -to
+    image = tk.PhotoImage(master=root, width=width, height=height)
+    image.tk.call(image, 'copy', tile, '-to', 0, 0, width, height)
+    return image
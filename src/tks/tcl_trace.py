@@ -0,0 +1,181 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Counts the Tcl commands issued by the widgets.
+
+Most of the time taken to redraw a canvas based widget is spent in Tcl
+round trips such as `itemconfigure` and `gettags` so counting them is a
+better guide to the effect of a change than timing the Python code. ::
+
+    tracer = tks.tcl_trace.trace(root)
+    with tracer.action('select day'):
+        selector._day_clicked(event)
+    print(tracer.format_report())
+    tracer.stop()
+
+The commands are counted by action, widget and operation. Widget paths have
+the numbers Tkinter appends to repeated names removed so that all the
+canvases of one widget class are counted together.
+"""
+
+from __future__ import (print_function, division, absolute_import,
+                        unicode_literals)
+import re
+import contextlib
+
+__all__ = ['TclTracer', 'trace']
+
+# Commands whose first argument is a sub command
+ENSEMBLES = ('after', 'bind', 'clipboard', 'event', 'focus', 'font', 'grab',
+             'grid', 'image', 'pack', 'place', 'tk', 'ttk::style', 'update',
+             'winfo', 'wm')
+
+_NUMBER_SUFFIX = re.compile(r'\d+(?=\.|$)')
+
+
+class TclTracer(object):
+    """A stand in for a Tk interpreter which counts the commands passed to
+    it before passing them on.
+
+    :param tkapp: The Tk interpreter i.e. the `tk` attribute of a widget.
+    :param log: An optional file like object to which each command is
+                written.
+    """
+
+    def __init__(self, tkapp, log=None):
+        self._tkapp = tkapp
+        self.log = log
+        self.root = None
+        self.active = True
+        self.counts = {}
+        self._action = None
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+
+        if self.active:
+            self._record(args)
+
+        return self._tkapp.call(*args)
+
+    def globalgetvar(self, *args):
+        if self.active:
+            self._record(('globalgetvar',))
+        return self._tkapp.globalgetvar(*args)
+
+    def globalsetvar(self, *args):
+        if self.active:
+            self._record(('globalsetvar',))
+        return self._tkapp.globalsetvar(*args)
+
+    @property
+    def total(self):
+        """The total number of commands counted."""
+
+        return sum(self.counts.values())
+
+    @contextlib.contextmanager
+    def action(self, name):
+        """A context manager which counts the commands issued within it
+        under the action `name`."""
+
+        previous = self._action
+        self._action = name
+        try:
+            yield self
+        finally:
+            self._action = previous
+
+    def reset(self):
+        """Remove all the counts."""
+
+        self.counts.clear()
+
+    def report(self, top=20, action=None):
+        """Return a list of (count, action, widget, operation) tuples for the
+        most frequent commands.
+
+        :param top: The number of entries to return or None for all of them
+        :param action: Only return the counts for this action
+        """
+
+        entries = [(count,) + key for key, count in self.counts.items()
+                   if action is None or key[0] == action]
+        entries.sort(key=lambda entry: (-entry[0], str(entry[1:])))
+        return entries[:top] if top else entries
+
+    def format_report(self, top=20, action=None):
+        """Return the report as a string table."""
+
+        lines = ['%8s  %-20s %-40s %s' % ('Count', 'Action', 'Widget',
+                                          'Operation')]
+        for count, action_name, widget, operation in \
+                self.report(top, action):
+            lines.append('%8d  %-20s %-40s %s' % (count, action_name or '',
+                                                   widget, operation))
+
+        lines.append('%8d  total' % self.total)
+        return '\n'.join(lines)
+
+    def _record(self, args):
+        if not args:
+            return
+
+        command = str(args[0])
+        if command.startswith('.'):
+            widget = _NUMBER_SUFFIX.sub('', command)
+            operation = str(args[1]) if len(args) > 1 else ''
+        else:
+            widget = ''
+            operation = command
+            if command in ENSEMBLES and len(args) > 1:
+                operation = '%s %s' % (command, args[1])
+
+        key = (self._action, widget, operation)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        if self.log:
+            # Text is written so that an io.StringIO can be used as the log
+            # on Python 2
+            self.log.write('%s\n' % ' '.join('%s' % (arg,) for arg in args))
+
+    def stop(self):
+        """Stop counting and restore the interpreter of the traced root and
+        its children."""
+
+        self.active = False
+        if self.root is not None:
+            _set_tk(self.root, self, self._tkapp)
+            self.root = None
+
+
+def trace(root, log=None):
+    """Start counting the Tcl commands issued by `root` and all its existing
+    and future child widgets.
+
+    Call :meth:`TclTracer.stop` to stop.
+
+    :param root: The root window
+    :param log: An optional file like object to which each command is
+                written.
+    :rtype: :class:`TclTracer`
+    """
+
+    tracer = TclTracer(root.tk, log)
+    tracer.root = root
+    _set_tk(root, root.tk, tracer)
+    return tracer
+
+
+def _set_tk(widget, old, new):
+    """Replace the interpreter of a widget and its children. Widgets copy
+    their master's interpreter when they are created."""
+
+    if widget.tk is old:
+        widget.tk = new
+
+    for child in list(widget.children.values()):
+        _set_tk(child, old, new)
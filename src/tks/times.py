@@ -1,15 +1,22 @@
 # Copyright 2014, Simon Kennedy, sffjunkie+code@gmail.com
 
-""":mod:`tks.times`  provides 4 classes to obtain a time from a user.
+""":mod:`tks.times`  provides 6 classes to obtain a time from a user.
 
 :class:`TimeVar`
     A Tk variable which holds a time.
 
+:class:`TimeSlots`
+    The times which a user is allowed to select.
+
 :class:`TimeEntry`
     Displays entry boxes for hours, minutes and optionally seconds and
     an AM/PM selector. Also contains a button to display a time
     selection dialog.
 
+:class:`CompactTimeEntry`
+    A single entry box for a time which is lighter weight than a
+    :class:`TimeEntry`.
+
 :class:`TimeDialog`
     Displays a dialog window allowing the user to select a time.
 
@@ -20,6 +27,7 @@
 from __future__ import print_function, division, absolute_import
 import sys
 import math
+import bisect
 import datetime
 
 if sys.version_info >= (3, 0):
@@ -31,16 +39,19 @@ else:
     import tkFont as tkf
     import ttk
 
-try:
-    import babel
-except ImportError:
-    babel = None
-
 from tks.i18n import language
 _ = language.gettext
 
 import tks
 import tks.dialog
+import tks.locales
+import tks.animate
+import tks.dial_geometry
+from tks.dial_geometry import polar
+from tks.instrument import timed
+from tks.masked_entry import MaskedEntry
+from tks.styles import get_font, configure_style
+from tks.rc_watch import CONFIG_CHANGED
 
 PADDING = 4
 FACE_RADIUS = 150
@@ -48,6 +59,8 @@ MODE_NONE = 0
 MODE_HOUR = 1
 MODE_MINUTE = 2
 MODE_SECOND = 3
+HAND_ANIMATION = 120
+MINUTES_PER_DAY = 24 * 60
 
 
 class TimeVar(tks.PickleVar):
@@ -60,6 +73,95 @@ class TimeVar(tks.PickleVar):
         super(TimeVar, self).__init__(master, value, name)
 
 
+class TimeSlots(object):
+    """The times which may be selected, to the nearest minute.
+
+    The valid times are calculated once and held in a sorted list so that
+    checking a time or finding the next valid time is a binary search.
+
+    :param min_time: The earliest time allowed. If None then midnight.
+    :type min_time:  :class:`datetime.time`
+    :param max_time: The latest time allowed. If None then 23:59.
+    :type max_time:  :class:`datetime.time`
+    :param step: The number of minutes between valid times, counted from
+                 `min_time`.
+    :type step:  int
+    :param disabled: Times which are not allowed.
+    :type disabled:  iterable of :class:`datetime.time`
+    """
+
+    def __init__(self, min_time=None, max_time=None, step=1, disabled=None):
+        if step < 1:
+            raise ValueError('"step" must be at least 1 minute')
+
+        start = _minutes(min_time) if min_time else 0
+        end = _minutes(max_time) if max_time else MINUTES_PER_DAY - 1
+        disabled = set(_minutes(t) for t in disabled or ())
+
+        self._slots = [m for m in range(start, end + 1, step)
+                       if m not in disabled]
+        if not self._slots:
+            raise ValueError('No times are available')
+
+        self._hours = {}
+        for m in self._slots:
+            self._hours.setdefault(m // 60, []).append(m % 60)
+
+        for hour, minutes in self._hours.items():
+            self._hours[hour] = tuple(minutes)
+
+        self.hours = tuple(sorted(self._hours))
+        """The hours which contain at least 1 valid time."""
+
+    def __contains__(self, value):
+        m = _minutes(value)
+        idx = bisect.bisect_left(self._slots, m)
+        return idx < len(self._slots) and self._slots[idx] == m
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __iter__(self):
+        for m in self._slots:
+            yield _time(m)
+
+    def minutes(self, hour):
+        """Return the valid minutes within an hour."""
+
+        return self._hours.get(hour, ())
+
+    def nearest(self, value):
+        """Return the valid time nearest to `value`."""
+
+        m = _minutes(value)
+        idx = bisect.bisect_left(self._slots, m)
+        if idx == len(self._slots):
+            return _time(self._slots[-1])
+        elif idx == 0 or self._slots[idx] == m:
+            return _time(self._slots[idx])
+
+        before = self._slots[idx - 1]
+        after = self._slots[idx]
+        if (m - before) <= (after - m):
+            return _time(before)
+        else:
+            return _time(after)
+
+    def step(self, value, count=1):
+        """Return the valid time `count` slots after `value` or before it if
+        `count` is negative. The result is limited to the first and last
+        valid times."""
+
+        m = _minutes(value)
+        if count > 0:
+            idx = bisect.bisect_right(self._slots, m) + count - 1
+        else:
+            idx = bisect.bisect_left(self._slots, m) + count
+
+        idx = max(0, min(idx, len(self._slots) - 1))
+        return _time(self._slots[idx])
+
+
 class TimeEntry(ttk.Frame, object):
     """A time entry widget
 
@@ -77,13 +179,16 @@ class TimeEntry(ttk.Frame, object):
     :type fonts:     :class:`~tks.DefaultFonts`
     :param show_seconds: If True a seconds value can be entered.
     :type show_seconds:  bool
+    :param slots: If not None only these times can be entered.
+    :type slots:  :class:`TimeSlots`
     """
 
     def __init__(self, master,
                  variable=None,
                  locale='en',
                  fonts=None,
-                 show_seconds=False):
+                 show_seconds=False,
+                 slots=None):
         super(TimeEntry, self).__init__(master)
 
         if variable:
@@ -101,30 +206,20 @@ class TimeEntry(ttk.Frame, object):
 
         self.fonts = fonts
 
-        self._ampm = None
-        if babel and locale:
-            if not isinstance(locale, babel.Locale):
-                locale = babel.Locale(locale)
-
-            pattern = locale.time_formats['short'].pattern
-
-            for ch in pattern:
-                ch = ch.lower()
-                if ch not in ['h', 'm', 's', 'a', 'k']:
-                    separator = ch
-                    break
-
-            if 'a' in pattern:
-                s = babel.dates.format_time(start_time,
-                                            format='a', locale=locale)
-                if 'am' in s or 'pm' in s:
-                    self._ampm = ('am', 'pm')
-                elif 'AM' in s or 'PM' in s:
-                    self._ampm = ('AM', 'PM')
-        else:
-            separator = ':'
+        locale_info = tks.locales.get_locale_info(locale)
+        pattern = locale_info.time_pattern
+
+        for ch in pattern:
+            ch = ch.lower()
+            if ch not in ['h', 'm', 's', 'a', 'k']:
+                separator = ch
+                break
+
+        self._ampm = locale_info.ampm
 
         self._locale = locale
+        self._slots = slots
+        self._minute_values_hour = None
 
         self._hour_var = tk.IntVar()
         self._minute_var = tk.IntVar()
@@ -136,7 +231,13 @@ class TimeEntry(ttk.Frame, object):
                                         width=3,
                                         font=self.fonts.text)
 
-        if self._ampm is None:
+        if slots:
+            if self._ampm is None:
+                hours = slots.hours
+            else:
+                hours = sorted(set((h % 12) or 12 for h in slots.hours))
+            hour_values = ['%02d' % x for x in hours]
+        elif self._ampm is None:
             hour_values = ['%02d' % x for x in range(1, 24)]
             hour_values.append('00')
         else:
@@ -227,6 +328,15 @@ class TimeEntry(ttk.Frame, object):
     def value(self, value):
         """Set the time to be displayed."""
 
+        if self._slots:
+            if value not in self._slots:
+                value = self._slots.nearest(value)
+
+            if value.hour != self._minute_values_hour:
+                minutes = self._slots.minutes(value.hour)
+                self._minute_entry['values'] = ['%02d' % m for m in minutes]
+                self._minute_values_hour = value.hour
+
         if value.hour != self._hour_var.get():
             if self._ampm:
                 if value.hour > 0 and value.hour <= 12:
@@ -320,13 +430,152 @@ class TimeEntry(ttk.Frame, object):
                          start_time=t,
                          locale=self._locale,
                          show_seconds=self._show_seconds,
-                         ampm=self._ampm)
+                         ampm=self._ampm,
+                         slots=self._slots)
         self.wait_window(dlg)
         new_time = dlg.time
         if new_time != None:
             self.value = new_time
 
 
+class CompactTimeEntry(MaskedEntry):
+    """A time entry widget which uses a single entry box.
+
+    Digits overwrite the text under the cursor, the Up and Down keys change
+    the field under the cursor, typing `a` or `p` selects am or pm and
+    either Alt-Down or F4 displays a time selection dialog. Only a single
+    entry widget and the :class:`TimeVar` are created which makes this more
+    suitable than :class:`TimeEntry` when many times are displayed at once.
+
+    :param master:   The master frame
+    :type master:    :class:`ttk.Frame`
+    :param variable: The variable which holds the time to display.
+    :type variable:  :class:`tks.times.TimeVar`
+    :param locale:   Determines the separator and whether am/pm is used.
+                     Either a locale name e.g. 'en' or a babel Locale instance.
+    :type locale:    str or :class:`babel.Locale <babel.core.Locale>`
+    :param fonts:    Fonts to use
+    :type fonts:     :class:`~tks.DefaultFonts`
+    :param show_seconds: If True a seconds value can be entered.
+    :type show_seconds:  bool
+    :param slots: If not None only these times can be entered and the Up
+                  and Down keys move between them.
+    :type slots:  :class:`TimeSlots`
+    """
+
+    def __init__(self, master,
+                 variable=None,
+                 locale='en',
+                 fonts=None,
+                 show_seconds=False,
+                 slots=None):
+        if variable:
+            if not isinstance(variable, TimeVar):
+                raise ValueError('"variable" argument must be a TimeVar')
+        else:
+            variable = TimeVar(master)
+
+        locale_info = tks.locales.get_locale_info(locale)
+
+        separator = ':'
+        for ch in locale_info.time_pattern:
+            if ch.lower() not in ['h', 'm', 's', 'a', 'k']:
+                separator = ch
+                break
+
+        self._locale = locale
+        self._ampm = locale_info.ampm
+        self._show_seconds = show_seconds
+        self._slots = slots
+
+        mask = [('hour', 2), separator, ('minute', 2)]
+        if show_seconds:
+            mask.extend([separator, ('second', 2)])
+
+        if self._ampm:
+            mask.extend([' ', ('ampm', max(len(x) for x in self._ampm))])
+
+        if not fonts:
+            fonts = tks.load_fonts()
+
+        self.fonts = fonts
+
+        super(CompactTimeEntry, self).__init__(master, variable, mask,
+                                               font=fonts.text)
+
+    def _split(self, value):
+        values = {'minute': value.minute, 'second': value.second}
+        if self._ampm:
+            values['hour'] = (value.hour % 12) or 12
+            values['ampm'] = int(value.hour >= 12)
+        else:
+            values['hour'] = value.hour
+
+        return values
+
+    def _join(self, values):
+        hour = values['hour']
+        if self._ampm:
+            hour = (hour % 12) + (12 * values['ampm'])
+
+        value = datetime.time(hour, values['minute'],
+                              values.get('second', 0))
+
+        if self._slots and value not in self._slots:
+            value = self._slots.nearest(value)
+
+        return value
+
+    def _limits(self, name, values):
+        if name == 'hour':
+            return (1, 12) if self._ampm else (0, 23)
+        elif name == 'ampm':
+            return (0, 1)
+        else:
+            return (0, 59)
+
+    def _choices(self, name):
+        if name == 'ampm':
+            return self._ampm
+
+        return None
+
+    def _spin_value(self, name, values, step):
+        if self._slots and name in ('hour', 'minute'):
+            if name == 'hour':
+                step *= 60
+
+            current = self._join(values)
+            minutes = _minutes(current) + step
+            if 0 <= minutes < MINUTES_PER_DAY:
+                new_time = self._slots.nearest(_time(minutes))
+                if new_time == current:
+                    new_time = self._slots.step(current, 1 if step > 0 else -1)
+            else:
+                new_time = current
+
+            return self._split(new_time)
+
+        return super(CompactTimeEntry, self)._spin_value(name, values, step)
+
+    def _popup(self, event=None):
+        """Display the time selection dialog."""
+
+        dlg = TimeDialog(self,
+                         _('Select a Time...'),
+                         start_time=self.value,
+                         locale=self._locale,
+                         show_seconds=self._show_seconds,
+                         ampm=self._ampm,
+                         fonts=self.fonts,
+                         slots=self._slots)
+        self.wait_window(dlg)
+        if dlg.time is not None:
+            self.value = dlg.time
+
+        return 'break'
+
+
 class TimeDialog(tks.dialog.Dialog):
     """Display a dialog to obtain a time from the user
 
@@ -356,6 +605,8 @@ class TimeDialog(tks.dialog.Dialog):
     :type apmp: (str, str)
     :param fonts: Fonts definitions to use
     :type fonts: :class:`~tks.DefaultFonts`
+    :param slots: If not None only these times can be selected.
+    :type slots:  :class:`TimeSlots`
     """
 
     def __init__(self, master, title,
@@ -364,7 +615,8 @@ class TimeDialog(tks.dialog.Dialog):
                  time_position=tk.TOP,
                  show_seconds=False,
                  ampm=None,
-                 fonts=None):
+                 fonts=None,
+                 slots=None):
         super(TimeDialog, self).__init__(master, title)
 
         self.time = None
@@ -372,9 +624,6 @@ class TimeDialog(tks.dialog.Dialog):
         if not fonts:
             fonts = tks.load_fonts()
 
-        if babel and not isinstance(locale, babel.Locale):
-            locale = babel.Locale(locale)
-
         self.time = None
         if start_time is None:
             start_time = datetime.datetime.time.now()
@@ -384,12 +633,16 @@ class TimeDialog(tks.dialog.Dialog):
                                       time_position=time_position,
                                       show_seconds=show_seconds,
                                       ampm=ampm,
-                                      fonts=fonts)
+                                      fonts=fonts,
+                                      slots=slots)
+        self._slots = slots
 
     def ok(self, event=None):
         """Called when the OK button is pressed"""
 
         self.time = self.selector.time
+        if self._slots and self.time not in self._slots:
+            self.time = self._slots.nearest(self.time)
 
     def cancel(self, event=None):
         """Called when either the Escape key or the Cancel button is pressed"""
@@ -421,6 +674,10 @@ class TimeSelector(ttk.Frame, object):
     :type fonts: :class:`~tks.DefaultFonts`
     :param colors:    Colors to use.
     :type colors:      :class:`~tks.DefaultColors`
+    :param slots: If not None only these times can be selected. Numerals on
+                  the dials which cannot be selected are grayed out and the
+                  Up and Down keys move between the valid times.
+    :type slots:  :class:`TimeSlots`
 
     Used by the :class:`TimeDialog` class but can be used independently."""
 
@@ -430,19 +687,26 @@ class TimeSelector(ttk.Frame, object):
                  time_position=tk.TOP,
                  show_seconds=False,
                  fonts=None,
-                 colors=None):
+                 colors=None,
+                 slots=None):
         self._master = master
         super(TimeSelector, self).__init__(master)
         self._time = None
         self._ampm = ampm
+        self._slots = slots
+        self._disabled_hour = None
+        self._hs = None
+        self._ms = None
+
+        if slots and start_time and start_time not in slots:
+            start_time = slots.nearest(start_time)
 
         if start_time is None:
             self._time = datetime.datetime.time.now()
         else:
             self._time = start_time
 
-        if babel and not isinstance(locale, babel.Locale):
-            locale = babel.Locale(locale)
+        self._locale = tks.locales.get_locale_info(locale)
 
         if not fonts:
             fonts = tks.load_fonts()
@@ -450,25 +714,23 @@ class TimeSelector(ttk.Frame, object):
         if not colors:
             colors = tks.load_colors()
 
-        f = tkf.Font(font=fonts.text)
-        f['weight'] = tkf.BOLD
-        f['size'] = int(f.actual('size') * 2)
-        ttk.Style().configure('TimeFrame.TLabel', font=f,
-                              anchor=tk.CENTER,
-                              background=colors.header)
+        f = get_font(self, fonts.text, weight=tkf.BOLD, scale=2)
+        configure_style(self, 'TimeFrame.TLabel', font=f,
+                        anchor=tk.CENTER,
+                        background=colors.header)
 
-        ttk.Style().configure('Selected.TimeFrame.TLabel',
-                              foreground=colors.select_dark)
+        configure_style(self, 'Selected.TimeFrame.TLabel',
+                        foreground=colors.select_dark)
 
-        ttk.Style().configure('TimeFrame.TFrame',
-                              relief=tk.SOLID,
-                              background=colors.header)
+        configure_style(self, 'TimeFrame.TFrame',
+                        relief=tk.SOLID,
+                        background=colors.header)
 
-        ttk.Style().configure('SecondFrame.TLabel',
-                              foreground='black')
+        configure_style(self, 'SecondFrame.TLabel',
+                        foreground='black')
 
-        ttk.Style().configure('Selected.SecondFrame.TLabel',
-                              foreground=colors.select_dark)
+        configure_style(self, 'Selected.SecondFrame.TLabel',
+                        foreground=colors.select_dark)
 
         self._master.bind('<Key>', self._key_pressed)
 
@@ -567,6 +829,12 @@ class TimeSelector(ttk.Frame, object):
                                           colors=colors)
             self._mode = '24hour'
 
+            if slots:
+                self._hs.disable(['h%dt' % h for h in range(24)
+                                  if not slots.minutes(h)])
+
+        self._update_disabled()
+
         self._selector = self._hs
         self._selector.grid(row=1, column=0, sticky=tk.NSEW, padx=3, pady=3)
 
@@ -590,6 +858,8 @@ class TimeSelector(ttk.Frame, object):
         if self._second_var:
             self._second_var.set('%02d' % value.second)
 
+        self._update_disabled()
+
     @property
     def hour(self):
         return self.time.hour
@@ -600,6 +870,13 @@ class TimeSelector(ttk.Frame, object):
                                   self.time.minute,
                                   self.time.second)
 
+        # Move to the nearest valid minute in the new hour
+        if self._slots and self._time not in self._slots:
+            minutes = self._slots.minutes(self._time.hour)
+            if minutes:
+                minute = min(minutes, key=lambda m: abs(m - self.minute))
+                self._show_minute(minute)
+
     @property
     def minute(self):
         return self.time.minute
@@ -620,6 +897,60 @@ class TimeSelector(ttk.Frame, object):
                                   self.time.minute,
                                   value)
 
+    def is_valid(self, hour=None, minute=None):
+        """Return True if a time can be selected.
+
+        If `hour` is None the current hour is used. If `minute` is None then
+        True is returned if any minute within the hour can be selected.
+        """
+
+        if not self._slots:
+            return True
+
+        if hour is None:
+            hour = self._time.hour
+
+        if minute is None:
+            return bool(self._slots.minutes(hour))
+        else:
+            return datetime.time(hour, minute) in self._slots
+
+    def _show_time(self, value):
+        """Update the dials to display a time."""
+
+        self._hs.hour = value.hour
+        self._show_minute(value.minute)
+
+    def _show_minute(self, minute):
+        dial = self._ms or self._hs
+        if dial:
+            dial.minute = minute
+        else:
+            self.minute = minute
+
+    def _update_disabled(self):
+        """Gray out the numerals on the dials which cannot be selected."""
+
+        if not self._slots or self._hs is None:
+            return
+
+        hour = self._time.hour
+        if hour == self._disabled_hour:
+            return
+
+        self._disabled_hour = hour
+        minute_tags = ['%dt' % m for m in range(0, 60, 5)
+                       if datetime.time(hour, m) not in self._slots]
+
+        if self._ampm:
+            offset = 12 if hour >= 12 else 0
+            tags = ['h%dt' % h for h in range(1, 13)
+                    if not self._slots.minutes((h % 12) + offset)]
+            tags.extend(['m%s' % tag for tag in minute_tags])
+            self._hs.disable(tags)
+        else:
+            self._ms.disable(['h%s' % tag for tag in minute_tags])
+
     @property
     def dial_mode(self):
         return self._dial_mode
@@ -754,6 +1085,11 @@ class TimeSelector(ttk.Frame, object):
     def _key_pressed(self, event):
         """Respond to a key being pressed"""
 
+        if self._slots and event.keysym in ('Up', 'Down'):
+            count = 1 if event.keysym == 'Up' else -1
+            self._show_time(self._slots.step(self._time, count))
+            return
+
         if not self._time_position:
             return
 
@@ -804,9 +1140,13 @@ class TimeSelector12HourAndMinute(ttk.Frame, object):
         self._hour_hand = None
         self._minute_hand = None
 
+        self._dragging = False
+        self._drag_ring = None
+
         self._canvas = tk.Canvas(self)
         self._canvas.grid(row=1, column=0, sticky=(tk.EW, tk.S))
         self._create_canvas()
+        self.bind(CONFIG_CHANGED, self._config_changed)
 
         self.columnconfigure(0, weight=1)
 
@@ -866,7 +1206,7 @@ class TimeSelector12HourAndMinute(ttk.Frame, object):
         self._last_hour_tag = tag
         self._hour = h
         self._master.hour = h
-        self._hour_hand.value = h
+        self._hour_hand.set(h, animate=not self._dragging)
 
     @property
     def minute(self):
@@ -884,45 +1224,38 @@ class TimeSelector12HourAndMinute(ttk.Frame, object):
         self._last_minute_tag = tag
         self._minute = m
         self._master.minute = m
-        self._minute_hand.value = m
+        self._minute_hand.set(m, animate=not self._dragging)
 
-    def _hm_clicked(self, event):
+    def _motion(self, event):
         x = self._canvas.canvasx(event.x)
         y = self._canvas.canvasy(event.y)
+        self._hover.tag = self._geometry.tag_at(x, y)
 
-        items = self._canvas.find_closest(x, y)
-        tags = self._canvas.gettags(items[0])
+    def _hm_clicked(self, event):
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
 
-        if 'face' in tags:
+        if self._geometry.ampm_at(x, y):
+            self._drag_ring = None
+            self._ampm_clicked(event)
             return
 
-        for tag in tags:
-            if tag[0] == 'm' or tag[0] == 'h':
-                break
-        else:
-            return
+        self._drag_ring = self._geometry.ring_at(x, y)
 
-        if tag.endswith('t'):
-            tag = '%sc' % tag[:-1]
+        tag = self._geometry.tag_at(x, y)
+        if tag is None:
+            return
 
         value = int(tag[1:-1])
         if tag.startswith('h'):
             if tag == self._last_hour_tag:
                 return
 
-            if self.am:
-                if value == 12:
-                    self.hour = 0
-                else:
-                    self.hour = value
-            else:
-                if value != 12:
-                    value += 12
-                self.hour = value
-
+            self._set_hour12(value)
             self._master.number_key_mode = MODE_HOUR
         else:
-            if tag == self._last_minute_tag:
+            if tag == self._last_minute_tag or \
+                    not self._master.is_valid(minute=value):
                 return
 
             self.minute = value
@@ -930,115 +1263,108 @@ class TimeSelector12HourAndMinute(ttk.Frame, object):
 
         self._canvas.itemconfig(tag, fill=self._colors.select)
 
+    def _dragged(self, x, y):
+        """Set the hour or minute from the pointer position while dragging
+        round the ring the drag started on."""
+
+        if self._drag_ring is None:
+            return
+
+        value = self._geometry.value_at(x, y, self._drag_ring)
+
+        self._dragging = True
+        try:
+            if self._drag_ring == 'outer':
+                self._set_hour12(value)
+                self._master.number_key_mode = MODE_HOUR
+            elif value != self._minute and \
+                    self._master.is_valid(minute=value):
+                self.minute = value
+                self._master.number_key_mode = MODE_MINUTE
+        finally:
+            self._dragging = False
+
+    def _set_hour12(self, value):
+        """Set the hour from a 12 hour clock value keeping am/pm unchanged."""
+
+        if self.am:
+            hour = 0 if value == 12 else value
+        else:
+            hour = value if value == 12 else value + 12
+
+        if hour != self._hour and self._master.is_valid(hour=hour):
+            self.hour = hour
+
+    def disable(self, tags):
+        """Gray out the numerals with the specified text tags."""
+
+        self._disabled.tags = tags
+
     def _ampm_clicked(self, event):
         x = self._canvas.canvasx(event.x)
         y = self._canvas.canvasy(event.y)
 
-        items = self._canvas.find_closest(x, y)
-        tags = self._canvas.gettags(items[0])
-
-        if 'am' in tags and not self.am:
+        ampm = self._geometry.ampm_at(x, y)
+        if ampm == 'am' and not self.am:
             self.am = True
-        elif 'pm' in tags and self.am:
+        elif ampm == 'pm' and self.am:
             self.am = False
 
+    @timed('TimeSelector12HourAndMinute._create_canvas')
     def _create_canvas(self):
-        f = tkf.Font(font=self._fonts.text)
-        hour_text_width = f.measure('00')
-        selection_radius = hour_text_width * 1.125
-
-        outer_radius = hour_text_width * 8
-        dial_radius = outer_radius + selection_radius + PADDING
-        inner_radius = outer_radius - (PADDING / 2) - (selection_radius * 2)
-        hand_radius = inner_radius - selection_radius
-
-        width = height = (dial_radius * 2) + 1
-
-        self._center = (dial_radius + (PADDING / 2),
-                        dial_radius + (PADDING / 2))
+        geometry = tks.dial_geometry.get_dial_geometry(self, self._fonts.text,
+                                                       '12hour')
+        self._geometry = geometry
+        self._center = geometry.center
 
-
-        dial_rect = tks.rect_at(self._center, dial_radius)
+        dial_rect = tks.rect_at(self._center, geometry.dial_radius)
         self._canvas.create_oval(dial_rect,
                                  fill=self._colors.fill,
                                  tags='face',
                                  width='0.5',
                                  outline=self._colors.outline)
 
-        radii = [inner_radius, outer_radius]
-
-        for radius in radii:
-            for idx, angle in enumerate(range(30, 361, 30)):
-                x_offset = math.sin(math.radians(angle)) * radius
-                y_offset = -math.cos(math.radians(angle)) * radius
-
-                if radius == inner_radius:
-                    i = ((idx + 1) * 5) % 60
-                    tag = 'm%d' % i
-                    text = '%02d' % i
-                elif radius == outer_radius:
-                    i = idx + 1
-                    tag = 'h%d' % i
-                    text = str(i)
-
-                oval_rect = tks.rect_at((self._center[0] + x_offset,
-                                         self._center[1] + y_offset),
-                                        selection_radius)
-                iid = self._canvas.create_oval(oval_rect,
-                                               fill=self._colors.fill,
-                                               outline='',
-                                               tags='%sc' % tag)
-
-                self._canvas.tag_bind(iid, '<Button-1>', self._hm_clicked)
-                self._canvas.tag_raise(iid)
-
-                iid = self._canvas.create_text((self._center[0] + x_offset,
-                                                self._center[1] + y_offset),
-                                               text=text,
-                                               tags='%st' % tag,
-                                               font=f)
-
-                self._canvas.tag_bind(iid, '<Button-1>', self._hm_clicked)
-                self._canvas.tag_raise(iid)
-
-        ampm_width = max(f.measure('am'),
-                         f.measure('pm')) + (2 * PADDING)
-        ampm_height = f.metrics('linespace') + PADDING
-        am_rect = (self._center[0] - (ampm_width / 2),
-                   self._center[1] - PADDING - (1.25 * ampm_height),
-                   self._center[0] + (ampm_width / 2),
-                   self._center[1] - PADDING - (0.25 * ampm_height))
-
-        self._canvas.create_rectangle(am_rect,
+        for numeral in geometry.numerals:
+            self._canvas.create_oval(numeral.rect,
+                                     fill=self._colors.fill,
+                                     outline='',
+                                     tags=numeral.circle_tags)
+            self._canvas.create_text(numeral.position,
+                                     text=numeral.text,
+                                     tags=numeral.text_tags,
+                                     font=self._fonts.text)
+
+        self._canvas.create_rectangle(geometry.am_rect,
                                       outline=self._colors.outline,
                                       fill=self._colors.select,
                                       tags=('am', 'ampm', 'amr'))
 
-        am_text = self._ampm[0]
-        pm_text = self._ampm[1]
-        am_pos = tks.rect_center(am_rect)
-        self._canvas.create_text(am_pos, text=am_text, tags=('am', 'ampm'))
-
-        pm_rect = (self._center[0] - (ampm_width / 2),
-                   self._center[1] + PADDING + (0.25 * ampm_height),
-                   self._center[0] + (ampm_width / 2),
-                   self._center[1] + PADDING + (1.25 * ampm_height))
+        am_pos = tks.rect_center(geometry.am_rect)
+        self._canvas.create_text(am_pos, text=self._ampm[0],
+                                 tags=('am', 'ampm'))
 
-        self._canvas.create_rectangle(pm_rect,
+        self._canvas.create_rectangle(geometry.pm_rect,
                                       fill='#fff',
                                       outline=self._colors.outline,
                                       tags=('pm', 'ampm', 'pmr'))
 
-        pm_pos = tks.rect_center(pm_rect)
-        self._canvas.create_text(pm_pos, text=pm_text, tags=('pm', 'ampm'))
+        pm_pos = tks.rect_center(geometry.pm_rect)
+        self._canvas.create_text(pm_pos, text=self._ampm[1],
+                                 tags=('pm', 'ampm'))
 
-        self._canvas.tag_bind('ampm', '<Button-1>', self._ampm_clicked)
+        self._hover = HoverHighlight(self._canvas, self._colors.select_dark)
+        self._canvas.bind('<Button-1>', self._hm_clicked)
+        self._canvas.bind('<Motion>', self._motion)
+        self._canvas.bind('<Leave>', self._hover.clear)
+        self._drag = DragThrottle(self._canvas, self._dragged)
+        self._disabled = DisabledNumerals(self._canvas, self._colors.disabled)
 
+        minute_radius, hour_radius = geometry.hand_radii
         self._minute_hand = ClockHand(self._canvas, self._center,
-                                      hand_radius)
+                                      minute_radius)
 
         self._hour_hand = ClockHand(self._canvas, self._center,
-                                    outer_radius - selection_radius,
+                                    hour_radius,
                                     mode='hour')
 
         center_circle_rect = tks.rect_at(self._center, PADDING)
@@ -1050,7 +1376,22 @@ class TimeSelector12HourAndMinute(ttk.Frame, object):
         self._canvas.tag_raise('text')
         self._canvas.tag_raise('minute')
         self._canvas.tag_raise('ampm')
-        self._canvas.configure(width=width, height=height)
+        self._canvas.configure(width=geometry.size, height=geometry.size)
+
+    def _config_changed(self, event):
+        """Redraw with the colors and fonts from a changed `.tksrc` file."""
+
+        disabled = self._disabled.tags
+        self._hour_hand.set(-1)
+        self._minute_hand.set(-1)
+        self._canvas.delete('all')
+        self._create_canvas()
+
+        self._disabled.tags = disabled
+        self._last_hour_tag = ''
+        self._last_minute_tag = ''
+        self.hour = self._hour
+        self.minute = self._minute
 
     def key_pressed(self, key):
         if key == 'a' and not self.am:
@@ -1078,9 +1419,13 @@ class TimeSelector24Hour(ttk.Frame, object):
         self._hour_hand_inner = None
         self._hour_hand_outer = None
 
+        self._dragging = False
+        self._show_minutes = False
+
         self._canvas = tk.Canvas(self)
         self._canvas.grid(row=1, column=0, sticky=(tk.EW, tk.S))
         self._create_canvas()
+        self.bind(CONFIG_CHANGED, self._config_changed)
 
         self.columnconfigure(0, weight=1)
 
@@ -1088,8 +1433,6 @@ class TimeSelector24Hour(ttk.Frame, object):
         self._last_hour_tag = ''
         self.hour = start_time.hour
 
-        self._center = None
-
     @property
     def hour(self):
         return self._hour
@@ -1108,117 +1451,122 @@ class TimeSelector24Hour(ttk.Frame, object):
         self._hour = h
         self._master.hour = h
 
+        animate = not self._dragging
         if h > 12 or h == 0:
-            self._hour_hand_inner.value = -1
-            self._hour_hand_outer.value = h - 12
+            self._hour_hand_inner.set(-1)
+            self._hour_hand_outer.set(h - 12, animate=animate)
         else:
-            self._hour_hand_inner.value = h
-            self._hour_hand_outer.value = -1
+            self._hour_hand_inner.set(h, animate=animate)
+            self._hour_hand_outer.set(-1)
+
+    def _motion(self, event):
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
+        self._hover.tag = self._geometry.tag_at(x, y)
 
     def _hour_clicked(self, event):
         x = self._canvas.canvasx(event.x)
         y = self._canvas.canvasy(event.y)
 
-        items = self._canvas.find_closest(x, y)
-        tags = self._canvas.gettags(items[0])
+        tag = self._geometry.tag_at(x, y)
+        if tag is None:
+            self._dial_clicked(event)
+            return
 
-        if 'face' in tags:
+        value = int(tag[1:-1])
+        if tag == self._last_hour_tag or \
+                not self._master.is_valid(hour=value):
             return
 
-        for tag in tags:
-            if tag[0] == 'm' or tag[0] == 'h':
-                break
+        self.hour = value
 
-        if tag.endswith('t'):
-            tag = '%sc' % tag[:-1]
+        self._canvas.itemconfig(tag, fill=self._colors.select)
 
-        if tag.startswith('h'):
-            if tag == self._last_hour_tag:
-                return
+        # The minute dial is shown when the button is released so that the
+        # hour can be adjusted by dragging.
+        self._show_minutes = True
 
-            value = int(tag[1:-1])
-            self.hour = value
+    def _dial_clicked(self, event):
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
 
-        self._canvas.itemconfig(tag, fill=self._colors.select)
+        if self._geometry.on_face(x, y):
+            hour = int(polar(self._center, x, y)[1] // 30)
+            if self._master.is_valid(hour=hour):
+                self.hour = hour
 
-        self._master.dial_mode = MODE_MINUTE
-        self._master.number_key_mode = MODE_MINUTE
+    def _dragged(self, x, y):
+        """Set the hour from the pointer position while dragging."""
 
-    def _dial_clicked(self, event):
-        x = self._canvas.canvasx(event.x) - self._center[0]
-        y = self._canvas.canvasy(event.y) - self._center[1]
+        if not self._geometry.on_face(x, y):
+            return
 
-        angle = math.degrees(math.atan2(y, x))
-        self.hour = int(math.floor(((angle + 90) % 360) / 30))
+        value = self._geometry.value_at(x, y)
+        if value != self._hour and self._master.is_valid(hour=value):
+            self._dragging = True
+            try:
+                self.hour = value
+            finally:
+                self._dragging = False
+
+        self._show_minutes = True
+
+    def disable(self, tags):
+        """Gray out the numerals with the specified text tags."""
+
+        self._disabled.tags = tags
+
+    def _config_changed(self, event):
+        """Redraw with the colors and fonts from a changed `.tksrc` file."""
+
+        disabled = self._disabled.tags
+        self._hour_hand_inner.set(-1)
+        self._hour_hand_outer.set(-1)
+        self._canvas.delete('all')
+        self._create_canvas()
+
+        self._disabled.tags = disabled
+        self._last_hour_tag = ''
+        self.hour = self._hour
 
+    def _released(self, event):
+        if self._show_minutes:
+            self._show_minutes = False
+            self._master.dial_mode = MODE_MINUTE
+            self._master.number_key_mode = MODE_MINUTE
+
+    @timed('TimeSelector24Hour._create_canvas')
     def _create_canvas(self):
-        f = tkf.Font(font=self._fonts.text)
-        hour_text_width = f.measure('00')
-        selection_radius = hour_text_width * 1.125
-
-        outer_radius = hour_text_width * 8
-        dial_radius = outer_radius + selection_radius + PADDING
-        inner_radius = outer_radius - (PADDING / 2) - (selection_radius * 2)
-
-        width = height = (dial_radius * 2) + 1
-        self._center = (dial_radius + (PADDING / 2),
-                        dial_radius + (PADDING / 2))
-
-        dial_rect = tks.rect_at(self._center, dial_radius)
-        dial = self._canvas.create_oval(dial_rect,
-                                        fill=self._colors.fill,
-                                        tags='face',
-                                        width='0.5',
-                                        outline=self._colors.outline)
-        self._canvas.tag_bind(dial, '<Button-1>', self._dial_clicked)
-
-        radii = [inner_radius, outer_radius]
-
-        for radius in radii:
-            for idx, angle in enumerate(range(30, 361, 30)):
-                x_offset = math.sin(math.radians(angle)) * radius
-                y_offset = -math.cos(math.radians(angle)) * radius
-
-                if radius == inner_radius:
-                    i = idx + 1
-                    circle_tag = 'inner_circle'
-                elif radius == outer_radius:
-                    i = idx + 1 + 12
-                    circle_tag = 'outer_circle'
-
-                i = i % 24
-
-                tag = 'h%d' % i
-                text = '%02d' % i
-
-                oval_rect = tks.rect_at((self._center[0] + x_offset,
-                                         self._center[1] + y_offset),
-                                        selection_radius)
-                iid = self._canvas.create_oval(oval_rect,
-                                               fill='',
-                                               outline='',
-                                               tags=('%sc' % tag, circle_tag))
-
-                self._canvas.tag_bind(iid, '<Button-1>', self._hour_clicked)
-                self._canvas.tag_raise(iid)
-
-                iid = self._canvas.create_text((self._center[0] + x_offset,
-                                                self._center[1] + y_offset),
-                                               text=text,
-                                               tags=('%st' % tag, 'text'),
-                                               font=f)
-
-                self._canvas.tag_bind(iid, '<Button-1>', self._hour_clicked)
-                self._canvas.tag_raise(iid)
+        geometry = tks.dial_geometry.get_dial_geometry(self, self._fonts.text,
+                                                       '24hour')
+        self._geometry = geometry
+        self._center = geometry.center
 
-        self._canvas.tag_lower('face')
-        self._canvas.configure(width=width, height=height)
+        dial_rect = tks.rect_at(self._center, geometry.dial_radius)
+        self._canvas.create_oval(dial_rect,
+                                 fill=self._colors.fill,
+                                 tags='face',
+                                 width='0.5',
+                                 outline=self._colors.outline)
+
+        for numeral in geometry.numerals:
+            self._canvas.create_oval(numeral.rect,
+                                     fill='',
+                                     outline='',
+                                     tags=numeral.circle_tags)
+            self._canvas.create_text(numeral.position,
+                                     text=numeral.text,
+                                     tags=numeral.text_tags,
+                                     font=self._fonts.text)
 
+        self._canvas.configure(width=geometry.size, height=geometry.size)
+
+        inner_radius, outer_radius = geometry.hand_radii
         self._hour_hand_inner = ClockHand(self._canvas, self._center,
-                                          inner_radius - selection_radius,
+                                          inner_radius,
                                           mode='hour')
         self._hour_hand_outer = ClockHand(self._canvas, self._center,
-                                          outer_radius - selection_radius,
+                                          outer_radius,
                                           mode='hour')
 
         center_circle_rect = tks.rect_at(self._center, PADDING)
@@ -1229,6 +1577,13 @@ class TimeSelector24Hour(ttk.Frame, object):
         self._canvas.tag_raise('circle')
         self._canvas.tag_raise('text')
 
+        self._hover = HoverHighlight(self._canvas, self._colors.select_dark)
+        self._canvas.bind('<Button-1>', self._hour_clicked)
+        self._canvas.bind('<Motion>', self._motion)
+        self._canvas.bind('<Leave>', self._hover.clear)
+        self._drag = DragThrottle(self._canvas, self._dragged, self._released)
+        self._disabled = DisabledNumerals(self._canvas, self._colors.disabled)
+
 
 class TimeSelectorMinute(ttk.Frame, object):
     """A Time selector widget"""
@@ -1244,10 +1599,12 @@ class TimeSelectorMinute(ttk.Frame, object):
         self._minute = -1
         self._last_minute_tag = ''
         self._center = None
+        self._dragging = False
 
         self._canvas = tk.Canvas(self)
         self._canvas.grid(row=1, column=0, sticky=(tk.EW, tk.S))
         self._create_canvas()
+        self.bind(CONFIG_CHANGED, self._config_changed)
 
         self.columnconfigure(0, weight=1)
 
@@ -1289,96 +1646,96 @@ class TimeSelectorMinute(ttk.Frame, object):
             self._last_minute_tag = tag
             self._minute = value
             self._master.minute = value
-            self._minute_hand.value = value
+            self._minute_hand.set(value, animate=not self._dragging)
 
-    def _minute_clicked(self, event):
+    def _motion(self, event):
         x = self._canvas.canvasx(event.x)
         y = self._canvas.canvasy(event.y)
+        self._hover.tag = self._geometry.tag_at(x, y)
 
-        items = self._canvas.find_closest(x, y)
-        tags = self._canvas.gettags(items[0])
+    def _minute_clicked(self, event):
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
 
-        if 'face' in tags:
+        tag = self._geometry.tag_at(x, y)
+        if tag is None:
+            self._dial_clicked(event)
             return
 
-        for tag in tags:
-            if tag[0] == 'm' or tag[0] == 'h':
-                break
-
-        if tag.endswith('t'):
-            tag = '%sc' % tag[:-1]
-
         value = int(tag[1:-1])
-        if tag == self._last_minute_tag:
+        if tag == self._last_minute_tag or \
+                not self._master.is_valid(minute=value):
             return
 
         self.minute = value
 
     def _dial_clicked(self, event):
-        x = self._canvas.canvasx(event.x) - self._center[0]
-        y = self._canvas.canvasy(event.y) - self._center[1]
-
-        angle = math.degrees(math.atan2(y, x))
-        self.minute = int(math.floor(((angle + 90) % 360) / 6))
-
-    def _create_canvas(self):
-        f = tkf.Font(font=self._fonts.text)
-        hour_text_width = f.measure('00')
-        selection_radius = hour_text_width * 1.125
+        x = self._canvas.canvasx(event.x)
+        y = self._canvas.canvasy(event.y)
 
-        outer_radius = hour_text_width * 8
-        dial_radius = outer_radius + selection_radius + PADDING
-        # inner_radius = outer_radius - (PADDING / 2) - (selection_radius * 2)
-        hand_radius = outer_radius
+        if self._geometry.on_face(x, y):
+            minute = int(polar(self._center, x, y)[1] // 6)
+            if self._master.is_valid(minute=minute):
+                self.minute = minute
 
-        width = height = (dial_radius * 2) + 1
-        self._center = (dial_radius + (PADDING / 2),
-                        dial_radius + (PADDING / 2))
+    def _dragged(self, x, y):
+        """Set the minute from the pointer position while dragging."""
 
-        dial_rect = tks.rect_at(self._center, dial_radius)
-        dial = self._canvas.create_oval(dial_rect,
-                                        fill=self._colors.fill,
-                                        tags='face',
-                                        width='0.5',
-                                        outline=self._colors.outline)
-        self._canvas.tag_bind(dial, '<Button-1>', self._dial_clicked)
+        minute = self._geometry.value_at(x, y)
+        if not self._master.is_valid(minute=minute):
+            return
 
-        radii = [outer_radius]
+        self._dragging = True
+        try:
+            self.minute = minute
+        finally:
+            self._dragging = False
 
-        for radius in radii:
-            for idx, angle in enumerate(range(30, 361, 30)):
-                x_offset = math.sin(math.radians(angle)) * radius
-                y_offset = -math.cos(math.radians(angle)) * radius
+    def disable(self, tags):
+        """Gray out the numerals with the specified text tags."""
 
-                if radius == outer_radius:
-                    i = (idx + 1) * 5
+        self._disabled.tags = tags
 
-                i = i % 60
+    def _config_changed(self, event):
+        """Redraw with the colors and fonts from a changed `.tksrc` file."""
 
-                tag = 'h%d' % i
-                text = '%02d' % i
+        disabled = self._disabled.tags
+        minute = self._minute
+        self._minute_hand.set(-1)
+        self._canvas.delete('all')
+        self._create_canvas()
 
-                oval_rect = tks.rect_at((self._center[0] + x_offset,
-                                         self._center[1] + y_offset),
-                                        selection_radius)
-                iid = self._canvas.create_oval(oval_rect,
-                                               fill=self._colors.fill,
-                                               outline='',
-                                               tags=('%sc' % tag, 'circle'))
+        self._disabled.tags = disabled
+        self._last_minute_tag = ''
+        self._minute = -1
+        self.minute = minute
 
-                self._canvas.tag_bind(iid, '<Button-1>', self._minute_clicked)
-                self._canvas.tag_raise(iid)
+    @timed('TimeSelectorMinute._create_canvas')
+    def _create_canvas(self):
+        geometry = tks.dial_geometry.get_dial_geometry(self, self._fonts.text,
+                                                       'minute')
+        self._geometry = geometry
+        self._center = geometry.center
+        hand_radius = geometry.hand_radii[0]
 
-                iid = self._canvas.create_text((self._center[0] + x_offset,
-                                                self._center[1] + y_offset),
-                                               text=text,
-                                               tags=('%st' % tag, 'text'),
-                                               font=f)
+        dial_rect = tks.rect_at(self._center, geometry.dial_radius)
+        self._canvas.create_oval(dial_rect,
+                                 fill=self._colors.fill,
+                                 tags='face',
+                                 width='0.5',
+                                 outline=self._colors.outline)
 
-                self._canvas.tag_bind(iid, '<Button-1>', self._minute_clicked)
-                self._canvas.tag_raise(iid)
+        for numeral in geometry.numerals:
+            self._canvas.create_oval(numeral.rect,
+                                     fill=self._colors.fill,
+                                     outline='',
+                                     tags=numeral.circle_tags)
+            self._canvas.create_text(numeral.position,
+                                     text=numeral.text,
+                                     tags=numeral.text_tags,
+                                     font=self._fonts.text)
 
-        self._canvas.configure(width=width, height=height)
+        self._canvas.configure(width=geometry.size, height=geometry.size)
 
         self._minute_hand = ClockHand(self._canvas, self._center, hand_radius)
         self._minute_indicator = MinuteIndicator(self._canvas, self._center,
@@ -1390,22 +1747,54 @@ class TimeSelectorMinute(ttk.Frame, object):
                                  fill=self._colors.select,
                                  outline=self._colors.outline)
 
+        self._hover = HoverHighlight(self._canvas, self._colors.select_dark)
+        self._canvas.bind('<Button-1>', self._minute_clicked)
+        self._canvas.bind('<Motion>', self._motion)
+        self._canvas.bind('<Leave>', self._hover.clear)
+        self._drag = DragThrottle(self._canvas, self._dragged)
+        self._disabled = DisabledNumerals(self._canvas, self._colors.disabled)
+
 
 class ClockHand(object):
-    """Draws a clock hand on the canvas"""
+    """Draws a clock hand on the canvas
+
+    The end points of the hand are looked up in tables which are calculated
+    once per radius. If `duration` is not 0 then changes in position are
+    animated by the shared :class:`~tks.animate.FrameScheduler`.
+    """
 
-    def __init__(self, canvas, center, radius, mode='minute'):
+    def __init__(self, canvas, center, radius, mode='minute',
+                 duration=HAND_ANIMATION):
         self._mode = mode
         self.tag = '%s_hand' % mode
         self._canvas = canvas
         self._center = center
         self._radius = radius
+        self._duration = duration
+
+        if mode == 'minute':
+            self._endpoints = tks.dial_geometry.endpoints(center, radius, 60)
+            self._step_angle = 6
+        else:
+            self._endpoints = tks.dial_geometry.endpoints(center, radius,
+                                                          12, 24)
+            self._step_angle = 30
+
+        self._frame_endpoints = tks.dial_geometry.endpoints(center, radius,
+                                                            360)
+        self._angle = None
+
+        if duration:
+            self._scheduler = tks.animate.get_frame_scheduler(canvas)
+        else:
+            self._scheduler = None
 
         coords = (center[0], center[1], center[0], center[1])
         self._line = canvas.create_line(coords,
                                         fill='#888',
                                         tags=self.tag,
                                         width=1.25)
+        self._animation_key = (str(canvas), self._line)
         self._variable = -1
 
     @property
@@ -1414,23 +1803,54 @@ class ClockHand(object):
 
     @value.setter
     def value(self, value):
-        if value != self._variable:
-            if value != -1:
-                if self._mode == 'minute':
-                    angle = value * 6
-                else:
-                    angle = value * 30
+        self.set(value)
 
-                x = self._center[0] + math.sin(math.radians(angle)) * self._radius
-                y = self._center[1] - math.cos(math.radians(angle)) * self._radius
+    def set(self, value, animate=True):
+        """Move the hand to point at `value`.
 
-                coords = (self._center[0], self._center[1], x, y)
+        :param animate: If False the hand is moved immediately.
+        :type animate:  bool
+        """
+
+        if value != self._variable:
+            if self._scheduler and (value == -1 or not animate):
+                self._scheduler.cancel(self._animation_key)
+
+            if value == -1:
+                self._canvas.coords(self._line, (-2, -2, -1, -1))
+                self._angle = None
+            elif self._angle is None or not self._scheduler or not animate:
+                self._canvas.coords(self._line,
+                                    self._center + self._endpoints[value])
+                self._angle = (value * self._step_angle) % 360
             else:
-                coords = (-2, -2, -1, -1)
+                self._animate_to(value)
 
-            self._canvas.coords(self._line, coords)
             self._variable = value
 
+    def _animate_to(self, value):
+        """Move the hand smoothly from its current position to `value`"""
+
+        start = self._angle
+        target = (value * self._step_angle) % 360
+        delta = ((target - start + 180) % 360) - 180
+
+        def step(fraction):
+            if fraction >= 1.0:
+                self._angle = target
+                end = self._endpoints[value]
+            else:
+                eased = 1 - ((1 - fraction) ** 2)
+                self._angle = (start + (delta * eased)) % 360
+                end = self._frame_endpoints[int(round(self._angle)) % 360]
+
+            try:
+                self._canvas.coords(self._line, self._center + end)
+            except tk.TclError:
+                self._scheduler.cancel(self._animation_key)
+
+        self._scheduler.animate(self._animation_key, step, self._duration)
+
     def tag_raise(self):
         """Raise ourselves to the top of the canvas stack"""
 
@@ -1452,6 +1872,7 @@ class MinuteIndicator(object):
         self._canvas = canvas
         self._center = center
         self._radius = radius
+        self._endpoints = tks.dial_geometry.endpoints(center, radius, 60)
         self._indicator_radius = 4
         self._offscreen = (-10, -10, -9, -9)
         self._minute = -1
@@ -1470,17 +1891,16 @@ class MinuteIndicator(object):
     def minute(self, value):
         """Updates the position of the minute marker"""
 
-        if value != -1 and value % 5 != 0:
-            angle = value * 6
-
-            x = self._center[0] + math.sin(math.radians(angle)) * self._radius
-            y = self._center[1] - math.cos(math.radians(angle)) * self._radius
+        if value == self._minute:
+            return
 
-            rect = tks.rect_at((x, y), self._indicator_radius)
+        if value != -1 and value % 5 != 0:
+            rect = tks.rect_at(self._endpoints[value], self._indicator_radius)
         else:
             rect = self._offscreen
 
         self._canvas.coords(self._indicator, rect)
+        self._minute = value
 
     def tag_raise(self):
         """Raise ourselves to the top of the canvas stack"""
@@ -1492,3 +1912,125 @@ class MinuteIndicator(object):
 
         self._canvas.tag_lower(self.tag)
 
+
+class HoverHighlight(object):
+    """Outlines the canvas item under the mouse pointer.
+
+    :param canvas: The canvas containing the items
+    :param color:  The outline color to use
+    """
+
+    def __init__(self, canvas, color):
+        self._canvas = canvas
+        self._color = color
+        self._tag = None
+
+    @property
+    def tag(self):
+        """The tag of the highlighted item or None."""
+
+        return self._tag
+
+    @tag.setter
+    def tag(self, value):
+        if value != self._tag:
+            if self._tag:
+                self._canvas.itemconfigure(self._tag, outline='')
+
+            if value:
+                self._canvas.itemconfigure(value, outline=self._color)
+
+            self._tag = value
+
+    def clear(self, *args):
+        """Remove the highlight"""
+
+        self.tag = None
+
+
+class DisabledNumerals(object):
+    """Grays out the text of canvas items which cannot be selected.
+
+    Only the items whose state changes are reconfigured.
+
+    :param canvas: The canvas containing the items
+    :param color:  The text color to use for disabled items
+    """
+
+    def __init__(self, canvas, color):
+        self._canvas = canvas
+        self._color = color
+        self._tags = frozenset()
+
+    @property
+    def tags(self):
+        """The tags of the disabled items."""
+
+        return self._tags
+
+    @tags.setter
+    def tags(self, value):
+        value = frozenset(value)
+        for tag in self._tags - value:
+            self._canvas.itemconfigure(tag, fill='black')
+
+        for tag in value - self._tags:
+            self._canvas.itemconfigure(tag, fill=self._color)
+
+        self._tags = value
+
+
+class DragThrottle(object):
+    """Calls a function with the canvas position of the mouse pointer while
+    mouse button 1 is dragged over a canvas.
+
+    However quickly the pointer moves the function is called at most once per
+    idle cycle with the latest position.
+
+    :param canvas: The canvas to bind to
+    :param func: The function to call with the x and y canvas coordinates
+    :param release: An optional function to call when the button is released
+    """
+
+    def __init__(self, canvas, func, release=None):
+        self._canvas = canvas
+        self._func = func
+        self._release_func = release
+        self._position = None
+        self._after_id = None
+
+        canvas.bind('<B1-Motion>', self._motion)
+        canvas.bind('<ButtonRelease-1>', self._release)
+
+    def _motion(self, event):
+        self._position = (self._canvas.canvasx(event.x),
+                          self._canvas.canvasy(event.y))
+        if self._after_id is None:
+            self._after_id = self._canvas.after_idle(self._apply)
+
+    def _apply(self):
+        self._after_id = None
+        if self._position is not None:
+            x, y = self._position
+            self._position = None
+            self._func(x, y)
+
+    def _release(self, event):
+        if self._after_id is not None:
+            self._canvas.after_cancel(self._after_id)
+            self._apply()
+
+        if self._release_func:
+            self._release_func(event)
+
+
+def _minutes(value):
+    """Return the number of minutes from midnight to a time."""
+
+    return (value.hour * 60) + value.minute
+
+
+def _time(minutes):
+    """Return the time a number of minutes after midnight."""
+
+    return datetime.time(minutes // 60, minutes % 60)
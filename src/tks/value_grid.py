@@ -0,0 +1,695 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+""":mod:`tks.value_grid` provides a table of text, dates, times and colors.
+
+:class:`GridColumn`
+    Describes a column of the table.
+
+:class:`ValueGrid`
+    A scrolling table which draws its values on a canvas and only creates an
+    editor widget for the cell being edited.
+
+Only the rows which are visible are drawn and the canvas items are reused as
+the table is scrolled, so the number of Tk widgets and canvas items depends
+on the size of the window rather than the number of rows.
+"""
+
+from __future__ import print_function, division, absolute_import
+import sys
+import bisect
+import datetime
+
+if sys.version_info >= (3, 0):
+    import tkinter as tk
+    import tkinter.ttk as ttk
+else:
+    import Tkinter as tk
+    import ttk
+
+from tks.i18n import language
+_ = language.gettext
+
+import tks
+import tks.locales
+import tks.color_funcs
+from tks.styles import get_font
+from tks.rc_watch import CONFIG_CHANGED
+
+__all__ = ['GridColumn', 'ValueGrid']
+
+PADDING = 4
+SWATCH_WIDTH = 16
+
+_SAMPLE_DATE = datetime.date(2000, 12, 28)
+_SAMPLE_TIME = datetime.time(12, 59)
+
+
+class GridColumn(object):
+    """A column in a :class:`ValueGrid`.
+
+    :param title: The column heading
+    :type title:  str
+    :param kind: The type of value in the column. One of `text`, `date`,
+                 `time` or `color`. Colors are (R, G, B) tuples with
+                 elements between 0.0 and 1.0
+    :type kind:  str
+    :param width: The width of the column in pixels. If None then the width
+                  is calculated from the heading and the type of value.
+    :type width:  int
+    :param editable: If False the values cannot be edited.
+    :type editable:  bool
+    """
+
+    def __init__(self, title, kind='text', width=None, editable=True):
+        if kind not in ('text', 'date', 'time', 'color'):
+            raise ValueError('Unknown column kind %s' % kind)
+
+        self.title = title
+        self.kind = kind
+        self.width = width
+        self.editable = editable
+
+
+class ValueGrid(ttk.Frame, object):
+    """A table of values.
+
+    Double clicking a cell or pressing Return or F2 edits the selected cell.
+    Dates and times are edited with a :class:`~tks.dates.CompactDateEntry`
+    or :class:`~tks.times.CompactTimeEntry` and colors with a
+    :class:`~tks.colors.ColorDialog`. A single editor is created for each
+    type of value the first time it is needed and is reused for every cell.
+
+    :param master: The master widget
+    :param columns: The columns of the table
+    :type columns:  list of :class:`GridColumn`
+    :param rows: The values to display. Each row is a list with one value
+                 per column.
+    :type rows:  list
+    :param height: The number of rows to display
+    :type height:  int
+    :param locale: Determines how dates and times are displayed and edited.
+                   Either a locale name e.g. 'en' or a babel Locale instance.
+    :type locale:  str or :class:`babel.Locale <babel.core.Locale>`
+    :param fonts: Fonts to use
+    :type fonts:  :class:`~tks.DefaultFonts`
+    :param colors: Colors to use
+    :type colors:  :class:`~tks.DefaultColors`
+    :param command: A function which is called with the row index, column
+                    index and new value whenever a value is edited.
+    """
+
+    def __init__(self, master,
+                 columns,
+                 rows=None,
+                 height=10,
+                 locale='en',
+                 fonts=None,
+                 colors=None,
+                 command=None):
+        super(ValueGrid, self).__init__(master)
+
+        if not fonts:
+            fonts = tks.load_fonts()
+
+        if not colors:
+            colors = tks.load_colors()
+
+        self._columns = list(columns)
+        self._rows = [list(row) for row in rows or []]
+        self._locale = locale
+        self._locale_info = tks.locales.get_locale_info(locale)
+        self._fonts = fonts
+        self._colors = colors
+        self._command = command
+
+        self._top = 0
+        self._page_rows = 0
+        self._selection = None
+        self._editing = None
+        self._editors = {}
+        self._pool = []
+        self._item_state = {}
+
+        font = get_font(self, fonts.text)
+        self._row_height = font.metrics('linespace') + PADDING
+        self._calc_column_positions(font)
+
+        total_width = self._column_x[-1]
+
+        self._header = tk.Canvas(self, height=self._row_height + 1,
+                                 width=total_width, highlightthickness=0,
+                                 background=colors.header)
+        self._header.grid(row=0, column=0, sticky=tk.EW)
+        self._draw_header()
+
+        self._canvas = tk.Canvas(self, width=total_width,
+                                 height=self._row_height * height,
+                                 highlightthickness=0,
+                                 background=colors.fill,
+                                 takefocus=True)
+        self._canvas.grid(row=1, column=0, sticky=tk.NSEW)
+
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL,
+                                        command=self.yview)
+        self._scrollbar.grid(row=1, column=1, sticky=tk.NS)
+
+        self._select_rect = self._canvas.create_rectangle(
+            -10, -10, -9, -9,
+            outline=colors.select_dark,
+            fill=colors.select,
+            tags='selection')
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self._canvas.bind('<Configure>', self._resized)
+        self._canvas.bind('<Button-1>', self._clicked)
+        self._canvas.bind('<Double-Button-1>', self._double_clicked)
+        self._canvas.bind('<Key>', self._key_pressed)
+        self._canvas.bind('<MouseWheel>', self._mouse_wheel)
+        self._canvas.bind('<Button-4>', self._mouse_wheel)
+        self._canvas.bind('<Button-5>', self._mouse_wheel)
+        self.bind(CONFIG_CHANGED, self._config_changed)
+
+    @property
+    def columns(self):
+        """The columns of the table."""
+
+        return tuple(self._columns)
+
+    @property
+    def row_count(self):
+        """The number of rows in the table."""
+
+        return len(self._rows)
+
+    @property
+    def selection(self):
+        """The selected (row, column) or None."""
+
+        return self._selection
+
+    @selection.setter
+    def selection(self, value):
+        if value is not None:
+            row, column = value
+            row = max(0, min(row, len(self._rows) - 1))
+            column = max(0, min(column, len(self._columns) - 1))
+            value = (row, column) if self._rows else None
+
+        self._selection = value
+        if value:
+            self.see(value[0])
+
+        self._draw_selection()
+
+    def value(self, row, column):
+        """Return the value of a cell."""
+
+        return self._rows[row][column]
+
+    def set_value(self, row, column, value):
+        """Set the value of a cell."""
+
+        self._rows[row][column] = value
+        self._draw_row(row)
+
+    def row(self, index):
+        """Return a copy of the values in a row."""
+
+        return list(self._rows[index])
+
+    def insert_row(self, index, values):
+        """Insert a row before `index`."""
+
+        self.finish_edit()
+        self._rows.insert(index, list(values))
+        self._redraw()
+
+    def append_row(self, values):
+        """Add a row to the end of the table."""
+
+        self.insert_row(len(self._rows), values)
+
+    def delete_row(self, index):
+        """Remove a row from the table."""
+
+        self.finish_edit()
+        del self._rows[index]
+        if self._selection and self._selection[0] >= len(self._rows):
+            self.selection = (len(self._rows) - 1, self._selection[1])
+
+        self._redraw()
+
+    def see(self, row):
+        """Scroll the table so that a row is visible."""
+
+        if row < self._top:
+            self._scroll_to(row)
+        elif row >= self._top + self._page_rows:
+            self._scroll_to(row - self._page_rows + 1)
+
+    def yview(self, *args):
+        """Scroll the table. Accepts the arguments passed by a
+        :class:`ttk.Scrollbar`."""
+
+        if not args:
+            return self._view_fractions()
+
+        if args[0] == tk.MOVETO:
+            self._scroll_to(int(round(float(args[1]) * len(self._rows))))
+        elif args[0] == tk.SCROLL:
+            count = int(args[1])
+            if args[2] == tk.PAGES:
+                count *= max(1, self._page_rows - 1)
+            self._scroll_to(self._top + count)
+
+    def edit(self, row, column):
+        """Display an editor for a cell."""
+
+        self.finish_edit()
+
+        if not self._columns[column].editable:
+            return
+
+        self.selection = (row, column)
+        kind = self._columns[column].kind
+        if kind == 'color':
+            self._edit_color(row, column)
+            return
+
+        editor = self._editor(kind)
+        value = self._rows[row][column]
+        if value is None:
+            value = _default_value(kind)
+        editor.value = value
+
+        x1, y1, x2, y2 = self._cell_rect(row, column)
+        editor.place(in_=self._canvas, x=x1, y=y1,
+                     width=x2 - x1, height=y2 - y1)
+        editor.focus_set()
+        editor.icursor(0)
+        self._editing = (row, column, editor)
+        self._draw_selection()
+
+    def finish_edit(self, save=True):
+        """Hide the editor and if `save` is True store the edited value."""
+
+        if not self._editing:
+            return
+
+        row, column, editor = self._editing
+        self._editing = None
+
+        if save:
+            editor.commit()
+            value = editor.value
+            if value != self._rows[row][column]:
+                self.set_value(row, column, value)
+                if self._command:
+                    self._command(row, column, value)
+
+        editor.place_forget()
+        self._canvas.focus_set()
+        self._draw_selection()
+
+    def _editor(self, kind):
+        """Return the editor for a type of value, creating it the first time
+        it is needed."""
+
+        try:
+            return self._editors[kind]
+        except KeyError:
+            pass
+
+        # The editors are imported here so that a table which only displays
+        # text does not import the date and time modules.
+        if kind == 'date':
+            import tks.dates
+            editor = tks.dates.CompactDateEntry(
+                self._canvas, variable=tks.dates.DateVar(self),
+                locale=self._locale, fonts=self._fonts)
+        elif kind == 'time':
+            import tks.times
+            editor = tks.times.CompactTimeEntry(
+                self._canvas, variable=tks.times.TimeVar(self),
+                locale=self._locale, fonts=self._fonts)
+        else:
+            editor = _TextEditor(self._canvas, font=self._fonts.text)
+
+        editor.bind('<Return>', lambda event: self.finish_edit())
+        editor.bind('<KP_Enter>', lambda event: self.finish_edit())
+        editor.bind('<Escape>', lambda event: self.finish_edit(save=False))
+        editor.bind('<FocusOut>', self._editor_focus_out, '+')
+
+        self._editors[kind] = editor
+        return editor
+
+    def _editor_focus_out(self, event):
+        # Wait until focus has moved. If it has moved to a dialog opened by
+        # the editor then carry on editing.
+        self.after_idle(self._check_editor_focus)
+
+    def _check_editor_focus(self):
+        if not self._editing:
+            return
+
+        editor = self._editing[2]
+        focus = self.focus_get()
+        if focus is editor:
+            return
+
+        if focus is None or focus.winfo_toplevel() is self.winfo_toplevel():
+            self.finish_edit()
+
+    def _edit_color(self, row, column):
+        import tks.colors
+
+        start_color = self._rows[row][column]
+        if start_color is None:
+            start_color = tks.colors.DEFAULT_RGB
+
+        dlg = tks.colors.ColorDialog(self, _('Select a Color'),
+                                     start_color=start_color,
+                                     fonts=self._fonts)
+        self.wait_window(dlg)
+        if dlg.color is not None and dlg.color != self._rows[row][column]:
+            self.set_value(row, column, dlg.color)
+            if self._command:
+                self._command(row, column, dlg.color)
+
+        self._canvas.focus_set()
+
+    def _calc_column_positions(self, font):
+        samples = {
+            'text': '0' * 10,
+            'date': self._format('date', _SAMPLE_DATE),
+            'time': self._format('time', _SAMPLE_TIME),
+            'color': '#ffffff',
+        }
+
+        self._column_x = [0]
+        for column in self._columns:
+            width = column.width
+            if width is None:
+                width = max(font.measure(column.title),
+                            font.measure(samples[column.kind]))
+                if column.kind == 'color':
+                    width += SWATCH_WIDTH + PADDING
+
+                width += 2 * PADDING
+
+            self._column_x.append(self._column_x[-1] + width)
+
+    def _draw_header(self):
+        for idx, column in enumerate(self._columns):
+            x = self._column_x[idx]
+            self._header.create_text(x + PADDING, self._row_height / 2,
+                                     text=column.title, anchor=tk.W,
+                                     font=self._fonts.text)
+            if idx:
+                self._header.create_line(x, 0, x, self._row_height,
+                                         fill=self._colors.outline)
+
+        self._header.create_line(0, self._row_height,
+                                 self._column_x[-1], self._row_height,
+                                 fill=self._colors.outline)
+
+    def _config_changed(self, event):
+        """Redraw with the colors and fonts from a changed `.tksrc` file."""
+
+        self.finish_edit()
+        for editor in self._editors.values():
+            editor.destroy()
+        self._editors = {}
+
+        font = get_font(self, self._fonts.text)
+        self._row_height = font.metrics('linespace') + PADDING
+        self._calc_column_positions(font)
+        total_width = self._column_x[-1]
+
+        self._header.delete('all')
+        self._header.configure(height=self._row_height + 1,
+                               width=total_width,
+                               background=self._colors.header)
+        self._draw_header()
+
+        self._canvas.configure(width=total_width,
+                               background=self._colors.fill)
+        self._canvas.itemconfigure(self._select_rect,
+                                   outline=self._colors.select_dark,
+                                   fill=self._colors.select)
+
+        # The rows are created again for the new row height
+        for items in self._pool:
+            for item in items:
+                if item:
+                    self._canvas.delete(item)
+        self._pool = []
+        self._item_state = {}
+        self._layout(self._canvas.winfo_height())
+
+    def _resized(self, event):
+        self._layout(event.height)
+
+    def _layout(self, height):
+        """Create or remove rows to fill the height of the canvas."""
+
+        page_rows = max(1, int(height // self._row_height))
+        slots = page_rows + 1
+
+        while len(self._pool) < slots:
+            self._pool.append(self._create_slot(len(self._pool)))
+
+        while len(self._pool) > slots:
+            for item in self._pool.pop():
+                if item:
+                    self._canvas.delete(item)
+                    self._item_state.pop(item, None)
+
+        self._canvas.delete('column_line')
+        for x in self._column_x[1:-1]:
+            self._canvas.create_line(x, 0, x, height,
+                                     fill=self._colors.outline,
+                                     tags='column_line')
+
+        self._page_rows = page_rows
+        self._scroll_to(self._top, force=True)
+
+    def _create_slot(self, slot):
+        """Create the canvas items for one visible row."""
+
+        y = slot * self._row_height
+        items = [self._canvas.create_line(0, y + self._row_height,
+                                          self._column_x[-1],
+                                          y + self._row_height,
+                                          fill=self._colors.outline)]
+
+        for idx, column in enumerate(self._columns):
+            x = self._column_x[idx] + PADDING
+            if column.kind == 'color':
+                items.append(self._canvas.create_rectangle(
+                    x, y + PADDING,
+                    x + SWATCH_WIDTH, y + self._row_height - PADDING,
+                    fill='', outline=''))
+                x += SWATCH_WIDTH + PADDING
+            else:
+                items.append(None)
+
+            items.append(self._canvas.create_text(
+                x, y + (self._row_height / 2),
+                anchor=tk.W, font=self._fonts.text))
+
+        return items
+
+    def _scroll_to(self, top, force=False):
+        top = max(0, min(top, len(self._rows) - self._page_rows))
+        if top != self._top or force:
+            self.finish_edit()
+            self._top = top
+            self._redraw()
+
+    def _redraw(self):
+        for row in range(self._top, self._top + len(self._pool)):
+            self._draw_row(row)
+
+        self._draw_selection()
+        self._scrollbar.set(*self._view_fractions())
+
+    def _draw_row(self, row):
+        slot = row - self._top
+        if not 0 <= slot < len(self._pool):
+            return
+
+        items = self._pool[slot]
+        for idx, column in enumerate(self._columns):
+            swatch = items[1 + (idx * 2)]
+            text_item = items[2 + (idx * 2)]
+
+            if row < len(self._rows):
+                value = self._rows[row][idx]
+                text = self._format(column.kind, value)
+            else:
+                value = None
+                text = ''
+
+            self._configure(text_item, text=text)
+            if swatch:
+                if value is None:
+                    self._configure(swatch, fill='', outline='')
+                else:
+                    self._configure(swatch, fill=self._swatch_color(value),
+                                    outline=self._colors.outline)
+
+    def _swatch_color(self, value):
+        """Return the Tk color of a swatch. Tk colors have no alpha so a
+        translucent color is drawn as it would look over the background."""
+
+        if len(value) > 3:
+            background = [c / 65535 for c in
+                          self._canvas.winfo_rgb(self._canvas['background'])]
+            value = tks.color_funcs.composite(value, background)
+
+        return tks.color_funcs.rgb_to_hex_string(value)
+
+    def _configure(self, item, **kwargs):
+        """Configure a canvas item only if its options have changed."""
+
+        state = tuple(sorted(kwargs.items()))
+        if self._item_state.get(item) != state:
+            self._canvas.itemconfigure(item, **kwargs)
+            self._item_state[item] = state
+
+    def _draw_selection(self):
+        if self._selection and not self._editing:
+            row, column = self._selection
+            if self._top <= row < self._top + len(self._pool):
+                rect = self._cell_rect(row, column)
+                self._canvas.coords(self._select_rect, rect)
+                self._canvas.tag_lower(self._select_rect)
+                return
+
+        self._canvas.coords(self._select_rect, -10, -10, -9, -9)
+
+    def _format(self, kind, value):
+        if value is None:
+            return ''
+        elif kind == 'date':
+            return self._locale_info.format_date(value, 'short')
+        elif kind == 'time':
+            return self._locale_info.format_time(value, 'short')
+        elif kind == 'color':
+            return tks.color_funcs.rgb_to_hex_string(value)
+        else:
+            return str(value)
+
+    def _cell_rect(self, row, column):
+        y = (row - self._top) * self._row_height
+        return (self._column_x[column], y,
+                self._column_x[column + 1], y + self._row_height)
+
+    def _cell_at(self, x, y):
+        """Return the (row, column) at a canvas position or None."""
+
+        column = bisect.bisect_right(self._column_x, x) - 1
+        row = self._top + int(y // self._row_height)
+        if 0 <= column < len(self._columns) and 0 <= row < len(self._rows):
+            return (row, column)
+        else:
+            return None
+
+    def _view_fractions(self):
+        if not self._rows:
+            return (0.0, 1.0)
+
+        count = len(self._rows)
+        return (self._top / count,
+                min(1.0, (self._top + self._page_rows) / count))
+
+    def _clicked(self, event):
+        self.finish_edit()
+        self._canvas.focus_set()
+        cell = self._cell_at(self._canvas.canvasx(event.x),
+                             self._canvas.canvasy(event.y))
+        if cell:
+            self.selection = cell
+
+    def _double_clicked(self, event):
+        cell = self._cell_at(self._canvas.canvasx(event.x),
+                             self._canvas.canvasy(event.y))
+        if cell:
+            self.edit(*cell)
+
+    def _mouse_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._top - 3)
+        else:
+            self._scroll_to(self._top + 3)
+
+    def _key_pressed(self, event):
+        keysym = event.keysym
+
+        if not self._rows:
+            return
+
+        if self._selection is None:
+            if keysym in ('Up', 'Down', 'Left', 'Right',
+                          'Prior', 'Next', 'Home', 'End'):
+                self.selection = (self._top, 0)
+                return 'break'
+            return
+
+        row, column = self._selection
+        moves = {
+            'Up': (-1, 0),
+            'Down': (1, 0),
+            'Left': (0, -1),
+            'Right': (0, 1),
+            'Prior': (-self._page_rows, 0),
+            'Next': (self._page_rows, 0),
+        }
+
+        if keysym in moves:
+            d_row, d_column = moves[keysym]
+            self.selection = (row + d_row, column + d_column)
+        elif keysym == 'Home':
+            self.selection = (0, column)
+        elif keysym == 'End':
+            self.selection = (len(self._rows) - 1, column)
+        elif keysym in ('Return', 'KP_Enter', 'F2'):
+            self.edit(row, column)
+        else:
+            return
+
+        return 'break'
+
+
+def _default_value(kind):
+    """Return the value to start editing an empty cell with."""
+
+    if kind == 'date':
+        return datetime.date.today()
+    elif kind == 'time':
+        return datetime.datetime.now().time().replace(second=0,
+                                                      microsecond=0)
+    else:
+        return None
+
+
+class _TextEditor(ttk.Entry, object):
+    """An entry used to edit text cells."""
+
+    def __init__(self, master, font=None):
+        super(_TextEditor, self).__init__(master, font=font)
+
+    @property
+    def value(self):
+        return self.get()
+
+    @value.setter
+    def value(self, value):
+        self.delete(0, tk.END)
+        self.insert(0, '' if value is None else str(value))
+
+    def commit(self):
+        """Nothing to do as the text is the value."""
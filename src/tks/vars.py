@@ -0,0 +1,58 @@
+# Copyright 2014-2018, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Tk variable types shared by the widgets.
+
+This is kept separate from the :mod:`tks` package module so that importing
+:mod:`tks` does not import Tkinter on Python 3.7 and later.
+:class:`PickleVar` is still available as `tks.PickleVar`.
+"""
+
+import sys
+import pickle
+
+if sys.version_info >= (3, 0):
+    from base64 import encodebytes, decodebytes
+    import tkinter as tk
+else:
+    from base64 import (encodestring as encodebytes,
+                        decodestring as decodebytes)
+    import Tkinter as tk
+
+from tks.instrument import timed
+
+__all__ = ['PickleVar']
+
+
+class PickleVar(tk.Variable, object):
+    """A Tkinter variable which stores values as pickled objects."""
+
+    def __init__(self, master=None, value=None, name=None):
+        # Python 3 Tkinter does not call our set method so we'll need to
+        # pickle the value now
+        if value and sys.version_info >= (3, 0):
+            value = self.__transform_value(value)
+
+        super(PickleVar, self).__init__(master, value, name)
+
+    @timed('PickleVar.get')
+    def get(self):
+        value = super(PickleVar, self).get()
+        if value and not isinstance(value, bytes) and sys.version_info >= (3, 0):
+            value = bytes(value, encoding='ASCII')
+
+        value = decodebytes(value)
+        return pickle.loads(value)
+
+    @timed('PickleVar.set')
+    def set(self, value):
+        value = self.__transform_value(value)
+        return tk.Variable.set(self, value)
+
+    @staticmethod
+    def __transform_value(value):
+        """We need to base64 encode/decode the pickled objects as Tkinter tries
+        to convert the value to a string and fails with a UnicodeDecodeError
+        """
+        value = pickle.dumps(value)
+        value = encodebytes(value)
+        return value